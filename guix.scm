@@ -36,6 +36,7 @@
        (source mobilizon-reshare-git-origin)
        (propagated-inputs
         (modify-inputs (package-propagated-inputs mobilizon-reshare)
+          (append python-apscheduler)
           (replace "python-uvicorn" python-uvicorn)
           (replace "python-fastapi" python-fastapi)
           (replace "python-fastapi-pagination-minimal"
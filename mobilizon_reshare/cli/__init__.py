@@ -5,19 +5,49 @@ import sys
 import traceback
 
 from mobilizon_reshare.config.command import CommandConfig
-from mobilizon_reshare.config.config import init_logging
-from mobilizon_reshare.storage.db import tear_down, init
 
 logger = logging.getLogger(__name__)
 
+# the database, the clients and the platforms are imported by the functions that use them, so that they are loaded
+# only when a command actually runs and not, e.g., to print the help or the version
 
-async def graceful_exit():
-    await tear_down()
 
+async def graceful_exit(read_only: bool = False):
+    from mobilizon_reshare.storage.db import tear_down
+
+    try:
+        # read-only commands don't open clients nor validate credentials
+        if not read_only:
+            await _close_clients()
+    finally:
+        await tear_down()
+
+
+async def _close_clients():
+    from mobilizon_reshare.mobilizon.client import close_client
+    from mobilizon_reshare.publishers import credentials
+    from mobilizon_reshare.publishers.sessions import close_sessions
+    from mobilizon_reshare.storage.query.write import save_credential_validations
+
+    await close_client()
+    close_sessions()
+    if credentials.validations_changed():
+        await save_credential_validations(credentials.get_validations())
+
+
+async def _safe_execution(
+    function, read_only: bool = False, auto_migrate: bool = True
+):
+    from mobilizon_reshare.config.config import init_logging
+    from mobilizon_reshare.publishers import credentials
+    from mobilizon_reshare.storage.db import init
+    from mobilizon_reshare.storage.query.read import get_credential_validations
 
-async def _safe_execution(function):
     init_logging()
-    await init()
+    await init(read_only=read_only, auto_migrate=auto_migrate)
+    if not read_only:
+        # credentials validated by previous runs don't need to be validated again
+        credentials.set_validations(await get_credential_validations())
 
     return_code = 1
     try:
@@ -26,13 +56,20 @@ async def _safe_execution(function):
         traceback.print_exc()
     finally:
         logger.debug("Closing")
-        await graceful_exit()
+        await graceful_exit(read_only=read_only)
         return return_code
 
 
-def safe_execution(function, command_config: CommandConfig = None):
+def safe_execution(
+    function,
+    command_config: CommandConfig = None,
+    read_only: bool = False,
+    auto_migrate: bool = True,
+):
     if command_config:
         function = functools.partial(function, command_config)
 
-    code = asyncio.run(_safe_execution(function))
+    code = asyncio.run(
+        _safe_execution(function, read_only=read_only, auto_migrate=auto_migrate)
+    )
     sys.exit(code)
@@ -1,28 +1,17 @@
 import functools
 
 import click
-import uvicorn
 from click import pass_context
 
 from mobilizon_reshare.cli import safe_execution
-from mobilizon_reshare.cli.commands.format.format import format_event
-from mobilizon_reshare.cli.commands.list.list_event import list_events
-from mobilizon_reshare.cli.commands.list.list_publication import list_publications
-from mobilizon_reshare.cli.commands.publish.main import publish_command as publish_main
-from mobilizon_reshare.cli.commands.pull.main import pull_command as pull_main
-from mobilizon_reshare.cli.commands.recap.main import recap_command as recap_main
-from mobilizon_reshare.cli.commands.retry.main import (
-    retry_event_command,
-    retry_publication_command,
-)
-from mobilizon_reshare.cli.commands.start.main import start_command as start_main
 from mobilizon_reshare.config.command import CommandConfig
 from mobilizon_reshare.config.config import current_version, get_settings, init_logging
 from mobilizon_reshare.config.publishers import publisher_names
-from mobilizon_reshare.dataclasses.event import _EventPublicationStatus
-from mobilizon_reshare.models.publication import PublicationStatus
 from mobilizon_reshare.publishers import get_active_publishers
 
+# commands import their implementation when they run, so that each one loads only the subsystems and the platform
+# SDKs it needs
+
 
 def test_settings(ctx, param, value):
     if not value or ctx.resilient_parsing:
@@ -48,20 +37,16 @@ def print_platforms(ctx, param, value):
     ctx.exit()
 
 
-status_name_to_enum = {
-    "event": {
-        "waiting": _EventPublicationStatus.WAITING,
-        "completed": _EventPublicationStatus.COMPLETED,
-        "failed": _EventPublicationStatus.FAILED,
-        "partial": _EventPublicationStatus.PARTIAL,
-        "all": None,
-    },
-    "publication": {
-        "completed": PublicationStatus.COMPLETED,
-        "failed": PublicationStatus.FAILED,
-        "all": None,
-    },
+status_names = {
+    "event": ["waiting", "completed", "failed", "partial", "all"],
+    "publication": ["completed", "failed", "all"],
 }
+
+
+def get_status(status_enum, status_name):
+    return None if status_name == "all" else status_enum[status_name.upper()]
+
+
 from_date_option = click.option(
     "-b",
     "--begin",
@@ -78,13 +63,13 @@ to_date_option = click.option(
 )
 event_status_argument = click.argument(
     "status",
-    type=click.Choice(list(status_name_to_enum["event"].keys())),
+    type=click.Choice(status_names["event"]),
     default="all",
     expose_value=True,
 )
 publication_status_argument = click.argument(
     "status",
-    type=click.Choice(list(status_name_to_enum["publication"].keys())),
+    type=click.Choice(status_names["publication"]),
     default="all",
     expose_value=True,
 )
@@ -149,8 +134,9 @@ def mobilizon_reshare(obj):
     default=False,
 )
 def start(dry_run):
+    from mobilizon_reshare.cli.commands.start.main import start_command
 
-    safe_execution(start_main, CommandConfig(dry_run=dry_run))
+    safe_execution(start_command, CommandConfig(dry_run=dry_run))
 
 
 @mobilizon_reshare.command(help="Publish a recap of already published events.")
@@ -162,7 +148,9 @@ def start(dry_run):
     default=False,
 )
 def recap(dry_run):
-    safe_execution(recap_main, CommandConfig(dry_run=dry_run))
+    from mobilizon_reshare.cli.commands.recap.main import recap_command
+
+    safe_execution(recap_command, CommandConfig(dry_run=dry_run))
 
 
 @mobilizon_reshare.command(
@@ -170,7 +158,9 @@ def recap(dry_run):
     "update them if they are known and changed."
 )
 def pull():
-    safe_execution(pull_main,)
+    from mobilizon_reshare.cli.commands.pull.main import pull_command
+
+    safe_execution(pull_command,)
 
 
 @mobilizon_reshare.command(
@@ -187,8 +177,10 @@ def pull():
     default=False,
 )
 def publish(event, platform, dry_run):
+    from mobilizon_reshare.cli.commands.publish.main import publish_command
+
     safe_execution(functools.partial(
-            publish_main, event, platform
+            publish_command, event, platform
         ), CommandConfig(dry_run=dry_run))
 
 
@@ -207,11 +199,17 @@ def publication():
 @from_date_option
 @to_date_option
 def event_list(status, begin, end):
+    from mobilizon_reshare.cli.commands.list.list_event import list_events
+    from mobilizon_reshare.dataclasses.event import _EventPublicationStatus
 
     safe_execution(
         functools.partial(
-            list_events, status_name_to_enum["event"][status], frm=begin, to=end,
+            list_events,
+            get_status(_EventPublicationStatus, status),
+            frm=begin,
+            to=end,
         ),
+        read_only=True,
     )
 
 
@@ -220,13 +218,17 @@ def event_list(status, begin, end):
 @from_date_option
 @to_date_option
 def publication_list(status, begin, end):
+    from mobilizon_reshare.cli.commands.list.list_publication import list_publications
+    from mobilizon_reshare.models.publication import PublicationStatus
+
     safe_execution(
         functools.partial(
             list_publications,
-            status_name_to_enum["publication"][status],
+            get_status(PublicationStatus, status),
             frm=begin,
             to=end,
         ),
+        read_only=True,
     )
 
 
@@ -239,23 +241,60 @@ def publication_list(status, begin, end):
 def format(
     event_id, publisher,
 ):
-    safe_execution(functools.partial(format_event, event_id, publisher),)
+    from mobilizon_reshare.cli.commands.format.format import format_event
+
+    safe_execution(
+        functools.partial(format_event, event_id, publisher), read_only=True
+    )
 
 
 @event.command(name="retry", help="Retries all the failed publications")
 @click.argument("event-id", type=click.UUID)
 def event_retry(event_id):
+    from mobilizon_reshare.cli.commands.retry.main import retry_event_command
+
     safe_execution(functools.partial(retry_event_command, event_id),)
 
 
 @publication.command(name="retry", help="Retries a specific publication")
 @click.argument("publication-id", type=click.UUID)
 def publication_retry(publication_id):
+    from mobilizon_reshare.cli.commands.retry.main import retry_publication_command
+
     safe_execution(functools.partial(retry_publication_command, publication_id),)
 
 
+@mobilizon_reshare.command(
+    help="Apply the pending database migrations and register the active platforms. Every other command "
+    "does it only when it finds migrations that haven't been applied yet."
+)
+def migrate():
+    from mobilizon_reshare.cli.commands.migrate.main import migrate_command
+
+    # the command migrates the database itself, so it's not migrated automatically beforehand
+    safe_execution(migrate_command, read_only=True, auto_migrate=False)
+
+
+@mobilizon_reshare.command(
+    help="Run pull, publish, start, recap and retry on the schedules in the daemon section of the settings, until "
+    "the process is interrupted."
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Prevents data to be published to platforms. WARNING: it will download and write new events to the database",
+    default=False,
+)
+def daemon(dry_run):
+    from mobilizon_reshare.cli.commands.daemon.main import daemon_command
+
+    safe_execution(daemon_command, CommandConfig(dry_run=dry_run))
+
+
 @mobilizon_reshare.command("web")
 def web():
+    import uvicorn
+
     uvicorn.run(
         "mobilizon_reshare.web.backend.main:app", host="0.0.0.0", port=8000, reload=True
     )
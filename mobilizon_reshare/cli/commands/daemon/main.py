@@ -0,0 +1,6 @@
+from mobilizon_reshare.config.command import CommandConfig
+from mobilizon_reshare.main.daemon import Daemon
+
+
+async def daemon_command(command_config: CommandConfig):
+    return await Daemon(command_config).run()
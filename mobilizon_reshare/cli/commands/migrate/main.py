@@ -0,0 +1,9 @@
+import click
+
+from mobilizon_reshare.storage.db import migrate
+
+
+async def migrate_command():
+    await migrate()
+    click.echo("Database migrated.")
+    return 0
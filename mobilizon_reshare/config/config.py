@@ -1,36 +1,129 @@
 import importlib
+import importlib.util
 import logging
+import os
 from logging.config import dictConfig
 from pathlib import Path
 from typing import Optional
 
 from appdirs import AppDirs
-from dynaconf import Dynaconf, Validator
+from dynaconf import Dynaconf
 
 import mobilizon_reshare
 from mobilizon_reshare.config import strategies, publishers, notifiers
 from mobilizon_reshare.config.notifiers import notifier_names
 from mobilizon_reshare.config.publishers import publisher_names
+from mobilizon_reshare.config.validators import Validator
 
 logger = logging.getLogger(__name__)
 
-base_validators = [
-    # strategy to decide events to publish
-    Validator("selection.strategy", must_exist=True, is_type_of=str),
-    # url of the main Mobilizon instance to download events from
-    Validator("source.mobilizon.url", must_exist=True, is_type_of=str),
-    Validator("source.mobilizon.group", must_exist=True, is_type_of=str),
-    Validator("db_url", must_exist=True, is_type_of=str),
-    Validator("locale", must_exist=True, is_type_of=str, default="en-us"),
-]
-
-activeness_validators = [
-    Validator(f"publisher.{publisher_name}.active", must_exist=True, is_type_of=bool)
-    for publisher_name in publisher_names
-] + [
-    Validator(f"notifier.{notifier_name}.active", must_exist=True, is_type_of=bool)
-    for notifier_name in notifier_names
-]
+
+def get_base_validators(env: str) -> list[Validator]:
+    return [
+        # strategy to decide events to publish
+        Validator("selection.strategy", must_exist=True, is_type_of=str, env=env),
+        # url of the main Mobilizon instance to download events from and group whose events are pulled. They can be
+        # omitted when a list of sources, each with its own url and group, is provided.
+        Validator(
+            "source.mobilizon.url",
+            "source.mobilizon.group",
+            must_exist=True,
+            is_type_of=str,
+            when=Validator("source.mobilizon.sources", must_exist=False, env=env),
+            env=env,
+        ),
+        Validator("source.mobilizon.sources", is_type_of=list, default=[], env=env),
+        # number of sources pulled at the same time
+        Validator(
+            "source.mobilizon.max_concurrent_sources",
+            is_type_of=int,
+            default=4,
+            env=env,
+        ),
+        # number of events requested for each page and maximum number of events pulled in a single run
+        Validator("source.mobilizon.page_size", is_type_of=int, default=50, env=env),
+        Validator("source.mobilizon.max_events", is_type_of=int, default=1000, env=env),
+        # timeout in seconds and size of the connection pool of the HTTP client used to query Mobilizon
+        Validator(
+            "source.mobilizon.timeout", is_type_of=(int, float), default=30, env=env
+        ),
+        Validator(
+            "source.mobilizon.max_connections", is_type_of=int, default=10, env=env
+        ),
+        # pull only the events updated since the last pull, with a full pull every few hours to reconcile missed changes
+        Validator(
+            "source.mobilizon.incremental", is_type_of=bool, default=False, env=env
+        ),
+        Validator(
+            "source.mobilizon.full_pull_interval_in_hours",
+            is_type_of=int,
+            default=24,
+            env=env,
+        ),
+        # number of platforms an event is published on at the same time and seconds after which a platform that
+        # hasn't answered is considered failed
+        Validator(
+            "publishing.max_concurrent_publications", is_type_of=int, default=5, env=env
+        ),
+        Validator("publishing.timeout", is_type_of=(int, float), default=60, env=env),
+        # minutes a successful validation of the credentials of a platform is trusted for, 0 to validate them every time
+        Validator(
+            "publishing.credentials_ttl_in_minutes", is_type_of=int, default=60, env=env
+        ),
+        # timeout in seconds of each request to a platform and number of connections kept open with each platform
+        Validator(
+            "publishing.request_timeout", is_type_of=(int, float), default=30, env=env
+        ),
+        Validator("publishing.pool_size", is_type_of=int, default=4, env=env),
+        # number of formatted messages kept in memory, 0 to format them every time
+        Validator(
+            "publishing.message_cache_size", is_type_of=int, default=512, env=env
+        ),
+        Validator("db_url", must_exist=True, is_type_of=str, env=env),
+        Validator("locale", must_exist=True, is_type_of=str, default="en-us", env=env),
+        # tree builder that parses descriptions: "html.parser" comes with Python, "lxml" is faster on long descriptions
+        # but requires the lxml extra and, like browsers, it closes paragraphs before nested blocks such as headers.
+        # The default stays "html.parser", so descriptions are parsed faster only when "lxml" is selected.
+        Validator(
+            "html_parser", is_in=["html.parser", "lxml"], default="html.parser", env=env
+        ),
+        Validator(
+            "html_parser",
+            condition=lambda html_parser: html_parser != "lxml"
+            or importlib.util.find_spec("lxml") is not None,
+            messages={
+                "condition": "html_parser is lxml but lxml isn't installed, "
+                "install the lxml extra"
+            },
+            env=env,
+        ),
+        # crontab expressions of the jobs run by the daemon command, an empty expression disables the job
+        Validator("daemon.pull", is_type_of=str, default="*/15 * * * *", env=env),
+        Validator("daemon.publish", is_type_of=str, default="5-59/15 * * * *", env=env),
+        Validator("daemon.recap", is_type_of=str, default="5 11 * * 0", env=env),
+        Validator("daemon.retry", is_type_of=str, default="", env=env),
+        Validator("daemon.start", is_type_of=str, default="", env=env),
+    ]
+
+
+def get_activeness_validators(env: str) -> list[Validator]:
+    return [
+        Validator(
+            f"publisher.{publisher_name}.active",
+            must_exist=True,
+            is_type_of=bool,
+            env=env,
+        )
+        for publisher_name in publisher_names
+    ] + [
+        Validator(
+            f"notifier.{notifier_name}.active",
+            must_exist=True,
+            is_type_of=bool,
+            env=env,
+        )
+        for notifier_name in notifier_names
+    ]
 
 
 def current_version() -> str:
@@ -57,7 +150,6 @@ def get_settings_files_paths() -> Optional[str]:
             bundled_settings_path.absolute(),
         ]:
             if config_path and Path(config_path).exists():
-                logger.debug(f"Loading configuration from {config_path}")
                 return config_path
 
 
@@ -73,10 +165,12 @@ def build_settings(validators: Optional[list[Validator]] = None) -> Dynaconf:
     The first available configuration file will be loaded.
     """
     ENVVAR_PREFIX = "MOBILIZON_RESHARE"
+    settings_file = get_settings_files_paths()
+    logger.debug(f"Loading configuration from {settings_file}")
     config = Dynaconf(
         environments=True,
         envvar_prefix=ENVVAR_PREFIX,
-        settings_files=get_settings_files_paths(),
+        settings_files=settings_file,
         validators=validators or [],
     )
 
@@ -85,25 +179,34 @@ def build_settings(validators: Optional[list[Validator]] = None) -> Dynaconf:
     return config
 
 
-def build_and_validate_settings() -> Dynaconf:
+def validate_settings(settings: Dynaconf, validators: list[Validator]) -> None:
+    for validator in validators:
+        validator.validate(settings)
+    settings.validators.register(*validators)
+
+
+def build_and_validate_settings(settings: Optional[Dynaconf] = None) -> Dynaconf:
     """
-    Creates a settings object to be used in the application. It collects and apply generic validators and validators
-    specific for each publisher, notifier and publication strategy.
+    Creates a settings object to be used in the application, or validates the given one. It collects and apply
+    generic validators and validators specific for each publisher, notifier and publication strategy.
     """
 
-    # we first do a preliminary load of the settings without validation. We will later use them to determine which
+    # we first do a preliminary validation of the settings. We will later use them to determine which
     # publishers, notifiers and strategy have been selected
-    raw_settings = build_settings(validators=activeness_validators)
+    if settings is None:
+        settings = build_settings()
+    validate_settings(settings, get_activeness_validators(settings.current_env))
 
     # we retrieve validators that are conditional. Each module will analyze the settings and decide which validators
     # need to be applied.
-    strategy_validators = strategies.get_validators(raw_settings)
-    publisher_validators = publishers.get_validators(raw_settings)
-    notifier_validators = notifiers.get_validators(raw_settings)
-
-    # we rebuild the settings, providing all the selected validators.
-    settings = build_settings(
-        base_validators
+    strategy_validators = strategies.get_validators(settings)
+    publisher_validators = publishers.get_validators(settings)
+    notifier_validators = notifiers.get_validators(settings)
+
+    # we validate the same settings again, providing all the selected validators, instead of loading them twice.
+    validate_settings(
+        settings,
+        get_base_validators(settings.current_env)
         + strategy_validators
         + publisher_validators
         + notifier_validators,
@@ -112,27 +215,61 @@ def build_and_validate_settings() -> Dynaconf:
     return settings
 
 
+def get_settings_files() -> list[str]:
+    """
+    Returns the files the settings are loaded from: the configuration file and, when it's given, the secrets file.
+    """
+    paths = [get_settings_files_paths(), os.environ.get("SECRETS_FOR_DYNACONF")]
+    return [str(path) for path in paths if path]
+
+
+def get_modification_times(paths: list[str]) -> dict[str, Optional[float]]:
+    modification_times = {}
+    for path in paths:
+        try:
+            modification_times[path] = os.stat(path).st_mtime
+        except OSError:
+            modification_times[path] = None
+    return modification_times
+
+
 # this singleton and functions are necessary to put together
 # the necessities of the testing suite, the CLI and still having a single entrypoint to the config.
 # The CLI needs to provide the settings file at run time so we cannot work at import time.
 # The normal Dynaconf options to specify the settings files are also not a valid option because of the two steps
 # validation that prevents us to employ their mechanism to specify settings files. This could probably be reworked
 # better in the future.
+# Settings are loaded once per process: the settings read before the validation, e.g. to connect to the database,
+# are the same object that is validated later.
 
 
 class CustomConfig:
+    _instance = None
+    _raw_settings = None
+
     @classmethod
     def get_instance(cls):
-        if not hasattr(cls, "_instance") or cls._instance is None:
+        if cls._instance is None:
             cls._instance = cls()
         return cls._instance
 
-    def __init__(self):
-        self.settings = build_and_validate_settings()
+    @classmethod
+    def get_raw_settings(cls) -> Dynaconf:
+        if cls._raw_settings is None:
+            cls._raw_settings = build_settings()
+        return cls._raw_settings
+
+    def __init__(self, raw_settings: Optional[Dynaconf] = None):
+        self.settings_files = get_settings_files()
+        self.settings = build_and_validate_settings(
+            raw_settings or self.get_raw_settings()
+        )
+        self.modification_times = get_modification_times(self.settings_files)
 
     @classmethod
     def clear(cls):
         cls._instance = None
+        cls._raw_settings = None
 
 
 def get_settings() -> Dynaconf:
@@ -140,4 +277,29 @@ def get_settings() -> Dynaconf:
 
 
 def get_settings_without_validation() -> Dynaconf:
-    return build_settings()
+    return CustomConfig.get_raw_settings()
+
+
+def reload_settings() -> Dynaconf:
+    """
+    Loads and validates the settings again, e.g. after the configuration files have been edited. The current
+    settings are kept if the new ones aren't valid.
+    """
+    raw_settings = build_settings()
+    instance = CustomConfig(raw_settings)
+    CustomConfig._raw_settings = raw_settings
+    CustomConfig._instance = instance
+    return instance.settings
+
+
+def reload_settings_if_changed() -> bool:
+    """
+    Reloads the settings when one of the files they have been loaded from has been modified since. Long-running
+    processes call it periodically to pick up configuration changes without restarting.
+    """
+    instance = CustomConfig.get_instance()
+    if get_modification_times(instance.settings_files) == instance.modification_times:
+        return False
+    logger.info("Configuration files changed, reloading the settings")
+    reload_settings()
+    return True
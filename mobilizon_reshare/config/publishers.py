@@ -1,59 +1,135 @@
-from dynaconf import Validator
-
-
-telegram_validators = [
-    Validator("publisher.telegram.chat_id", must_exist=True),
-    Validator("publisher.telegram.message_thread_id", default=None),
-    Validator("publisher.telegram.msg_template_path", must_exist=True, default=None),
-    Validator("publisher.telegram.recap_template_path", must_exist=True, default=None),
-    Validator(
-        "publisher.telegram.recap_header_template_path", must_exist=True, default=None
-    ),
-    Validator("publisher.telegram.token", must_exist=True),
-    Validator("publisher.telegram.username", must_exist=True),
-]
-zulip_validators = [
-    Validator("publisher.zulip.instance", must_exist=True),
-    Validator("publisher.zulip.chat_id", must_exist=True),
-    Validator("publisher.zulip.subject", must_exist=True),
-    Validator("publisher.zulip.msg_template_path", must_exist=True, default=None),
-    Validator("publisher.zulip.recap_template_path", must_exist=True, default=None),
-    Validator(
-        "publisher.zulip.recap_header_template_path", must_exist=True, default=None
-    ),
-    Validator("publisher.zulip.bot_token", must_exist=True),
-    Validator("publisher.zulip.bot_email", must_exist=True),
-]
-mastodon_validators = [
-    Validator("publisher.mastodon.instance", must_exist=True),
-    Validator("publisher.mastodon.token", must_exist=True),
-    Validator("publisher.mastodon.toot_length", default=500),
-    Validator("publisher.mastodon.msg_template_path", must_exist=True, default=None),
-    Validator("publisher.mastodon.recap_template_path", must_exist=True, default=None),
-    Validator(
-        "publisher.mastodon.recap_header_template_path", must_exist=True, default=None
-    ),
-    Validator("publisher.mastodon.name", must_exist=True),
-]
-twitter_validators = [
-    Validator("publisher.twitter.msg_template_path", must_exist=True, default=None),
-    Validator("publisher.twitter.recap_template_path", must_exist=True, default=None),
-    Validator(
-        "publisher.twitter.recap_header_template_path", must_exist=True, default=None
-    ),
-    Validator("publisher.twitter.api_key", must_exist=True),
-    Validator("publisher.twitter.api_key_secret", must_exist=True),
-    Validator("publisher.twitter.access_token", must_exist=True),
-    Validator("publisher.twitter.access_secret", must_exist=True),
-]
-facebook_validators = [
-    Validator("publisher.facebook.msg_template_path", must_exist=True, default=None),
-    Validator("publisher.facebook.recap_template_path", must_exist=True, default=None),
-    Validator(
-        "publisher.facebook.recap_header_template_path", must_exist=True, default=None
-    ),
-    Validator("publisher.facebook.page_access_token", must_exist=True),
-]
+from mobilizon_reshare.config.validators import Validator
+
+
+def telegram_validators(env: str) -> list[Validator]:
+    return [
+        Validator("publisher.telegram.chat_id", must_exist=True, env=env),
+        Validator("publisher.telegram.message_thread_id", default=None, env=env),
+        Validator(
+            "publisher.telegram.msg_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.telegram.recap_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.telegram.recap_header_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator("publisher.telegram.token", must_exist=True, env=env),
+        Validator("publisher.telegram.username", must_exist=True, env=env),
+    ]
+
+
+def zulip_validators(env: str) -> list[Validator]:
+    return [
+        Validator("publisher.zulip.instance", must_exist=True, env=env),
+        Validator("publisher.zulip.chat_id", must_exist=True, env=env),
+        Validator("publisher.zulip.subject", must_exist=True, env=env),
+        Validator(
+            "publisher.zulip.msg_template_path", must_exist=True, default=None, env=env
+        ),
+        Validator(
+            "publisher.zulip.recap_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.zulip.recap_header_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator("publisher.zulip.bot_token", must_exist=True, env=env),
+        Validator("publisher.zulip.bot_email", must_exist=True, env=env),
+    ]
+
+
+def mastodon_validators(env: str) -> list[Validator]:
+    return [
+        Validator("publisher.mastodon.instance", must_exist=True, env=env),
+        Validator("publisher.mastodon.token", must_exist=True, env=env),
+        Validator("publisher.mastodon.toot_length", default=500, env=env),
+        Validator(
+            "publisher.mastodon.msg_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.mastodon.recap_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.mastodon.recap_header_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator("publisher.mastodon.name", must_exist=True, env=env),
+    ]
+
+
+def twitter_validators(env: str) -> list[Validator]:
+    return [
+        Validator(
+            "publisher.twitter.msg_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.twitter.recap_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.twitter.recap_header_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator("publisher.twitter.api_key", must_exist=True, env=env),
+        Validator("publisher.twitter.api_key_secret", must_exist=True, env=env),
+        Validator("publisher.twitter.access_token", must_exist=True, env=env),
+        Validator("publisher.twitter.access_secret", must_exist=True, env=env),
+    ]
+
+
+def facebook_validators(env: str) -> list[Validator]:
+    return [
+        Validator(
+            "publisher.facebook.msg_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.facebook.recap_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator(
+            "publisher.facebook.recap_header_template_path",
+            must_exist=True,
+            default=None,
+            env=env,
+        ),
+        Validator("publisher.facebook.page_access_token", must_exist=True, env=env),
+    ]
+
 
 publisher_name_to_validators = {
     "telegram": telegram_validators,
@@ -78,5 +154,5 @@ def get_validators(settings):
     active_publishers = get_active_publishers(settings)
     validators = []
     for publisher in active_publishers:
-        validators += publisher_name_to_validators[publisher]
+        validators += publisher_name_to_validators[publisher](settings.current_env)
     return validators
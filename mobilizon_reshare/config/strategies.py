@@ -1,14 +1,20 @@
-from dynaconf import Validator
+from mobilizon_reshare.config.validators import Validator
 
-next_event_validators = [
-    Validator(
-        "selection.strategy_options.break_between_events_in_minutes", must_exist=True
-    )
-]
+
+def next_event_validators(env: str) -> list[Validator]:
+    return [
+        Validator(
+            "selection.strategy_options.break_between_events_in_minutes",
+            must_exist=True,
+            env=env,
+        )
+    ]
 
 
 strategy_name_to_validators = {"next_event": next_event_validators}
 
 
 def get_validators(settings):
-    return strategy_name_to_validators[settings["selection"]["strategy"]]
+    return strategy_name_to_validators[settings["selection"]["strategy"]](
+        settings.current_env
+    )
@@ -0,0 +1,16 @@
+import dynaconf
+
+
+class Validator(dynaconf.Validator):
+    """
+    A validator of the settings of a single environment. The config modules build their validators for the environment
+    of the settings every time they are validated, instead of sharing them, since a Dynaconf validator keeps validating
+    the environment it has been built for.
+    """
+
+    def __init__(self, *names: str, env: str, **kwargs):
+        super().__init__(*names, env=env, **kwargs)
+        # none of our validators casts values, but Dynaconf casts them with an identity function by default and stores
+        # them again, merging the whole section of the settings for each of them: skipping it makes validation several
+        # times faster. tests/config/test_config.py checks that values aren't stored again.
+        self.cast = None
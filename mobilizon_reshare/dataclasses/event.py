@@ -1,5 +1,5 @@
-from dataclasses import dataclass, asdict
-from typing import Optional, Iterable
+from dataclasses import dataclass, field, fields
+from typing import Callable, Hashable, Iterable, Optional, TypeVar
 from uuid import UUID
 
 import arrow
@@ -15,9 +15,13 @@ from mobilizon_reshare.models.event import Event
 from mobilizon_reshare.storage.query.read import (
     get_all_events,
     get_event,
+    get_events_with_publication_status,
+    get_next_event_without_publications,
     get_events_without_publications,
 )
 
+T = TypeVar("T")
+
 
 @dataclass
 class _MobilizonEvent:
@@ -34,6 +38,8 @@ class _MobilizonEvent:
     location: Optional[str] = None
     publication_time: Optional[dict[str, arrow.Arrow]] = None
     status: _EventPublicationStatus = _EventPublicationStatus.WAITING
+    # the same event is considered unchanged regardless of the source it has been pulled from
+    source: Optional[str] = field(default=None, compare=False)
 
     def __post_init__(self):
         assert self.begin_datetime.tzinfo == self.end_datetime.tzinfo
@@ -47,12 +53,46 @@ class _MobilizonEvent:
                 _EventPublicationStatus.FAILED,
             ]
 
-    def _fill_template(self, pattern: Template) -> str:
-        config = get_settings()
-        return pattern.render(locale=config["locale"], **asdict(self))
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # values derived from the fields are outdated as soon as one of them is replaced
+        self.__dict__.pop("_derived", None)
+
+    def _get_derived(self, key: Hashable, derive: Callable[[], T]) -> T:
+        """
+        Returns a value derived from the event, calling derive only once for each version of the event.
+        """
+        derived = self.__dict__.setdefault("_derived", {})
+        if key not in derived:
+            derived[key] = derive()
+        return derived[key]
+
+    def _get_template_context(self) -> dict:
+        """
+        Returns the fields of the event as template variables. Unlike ``asdict``, values are not copied and the
+        context is built only once for each version of the event.
+        """
+        return self._get_derived(
+            "template_context",
+            lambda: {f.name: getattr(self, f.name) for f in fields(self)},
+        )
+
+    def get_view(
+        self, key: Hashable, derive: Callable[["_MobilizonEvent"], "_MobilizonEvent"]
+    ) -> "_MobilizonEvent":
+        """
+        Returns a copy of the event transformed by derive, e.g. for a specific platform, building it only once for
+        each version of the event.
+        """
+        return self._get_derived(("view", key), lambda: derive(self))
 
-    def format(self, pattern: Template) -> str:
-        return self._fill_template(pattern)
+    def _fill_template(self, pattern: Template, locale: Optional[str] = None) -> str:
+        if locale is None:
+            locale = get_settings()["locale"]
+        return pattern.render(locale=locale, **self._get_template_context())
+
+    def format(self, pattern: Template, locale: Optional[str] = None) -> str:
+        return self._fill_template(pattern, locale)
 
     @classmethod
     def from_model(cls, event: Event):
@@ -77,6 +117,7 @@ class _MobilizonEvent:
             publication_time=publication_time,
             status=publication_status,
             last_update_time=arrow.get(event.last_update_time).to("local"),
+            source=event.source,
         )
 
     def to_model(self, db_id: Optional[UUID] = None) -> Event:
@@ -95,6 +136,7 @@ class _MobilizonEvent:
             "last_update_time": self.last_update_time.astimezone(
                 self.last_update_time.tzinfo
             ),
+            "source": self.source,
         }
         if db_id is not None:
             kwargs.update({"id": db_id})
@@ -134,15 +176,14 @@ async def get_mobilizon_events_with_status(
     from_date: Optional[Arrow] = None,
     to_date: Optional[Arrow] = None,
 ) -> Iterable[_MobilizonEvent]:
-    def _filter_event_with_status(event: Event) -> bool:
-        # This computes the status client-side instead of running in the DB. It shouldn't pose a performance problem
-        # in the short term, but should be moved to the query if possible.
-        event_status = _compute_event_status(list(event.publications))
-        return event_status in status
+    if not status:
+        return []
 
     return map(
         _MobilizonEvent.from_model,
-        filter(_filter_event_with_status, await get_all_events(from_date, to_date)),
+        await get_events_with_publication_status(
+            status, from_date=from_date, to_date=to_date
+        ),
     )
 
 
@@ -157,6 +198,11 @@ async def get_mobilizon_events_without_publications(
     ]
 
 
+async def get_next_unpublished_mobilizon_event() -> Optional[_MobilizonEvent]:
+    event = await get_next_event_without_publications()
+    return _MobilizonEvent.from_model(event) if event else None
+
+
 async def get_mobilizon_event_by_id(
     event_id: UUID,
 ) -> _MobilizonEvent:
@@ -1,13 +1,7 @@
-from enum import IntEnum
-
+from mobilizon_reshare.models.event import EventPublicationStatus
 from mobilizon_reshare.models.publication import Publication, PublicationStatus
 
-
-class _EventPublicationStatus(IntEnum):
-    WAITING = 1
-    FAILED = 2
-    COMPLETED = 3
-    PARTIAL = 4
+_EventPublicationStatus = EventPublicationStatus
 
 
 def _compute_event_status(publications: list[Publication],) -> _EventPublicationStatus:
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from functools import partial
-from typing import List, Iterator
+from typing import List, Iterator, Optional
 from uuid import UUID
 
 from tortoise.transactions import atomic
@@ -27,6 +27,8 @@ class BasePublication:
 class _EventPublication(BasePublication):
     event: _MobilizonEvent
     id: UUID
+    # the message built for the publisher, once it has been formatted
+    message: Optional[str] = None
 
     @classmethod
     def from_orm(cls, model: Publication, event: _MobilizonEvent):
@@ -40,6 +42,14 @@ class _EventPublication(BasePublication):
         formatter = get_formatter_class(model.publisher.name)()
         return cls(publisher, formatter, event, model.id,)
 
+    def get_message(self) -> str:
+        """
+        Retrieves the message to publish, formatting it only the first time.
+        """
+        if self.message is None:
+            self.message = self.formatter.get_message_from_event(self.event)
+        return self.message
+
     @classmethod
     async def retrieve(cls, publication_id):
         publication = await prefetch_publication_relations(
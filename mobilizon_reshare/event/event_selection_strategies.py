@@ -6,6 +6,12 @@ import arrow
 
 from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent
+from mobilizon_reshare.dataclasses.event import (
+    get_mobilizon_events_without_publications,
+    get_next_unpublished_mobilizon_event,
+    get_published_events,
+)
+from mobilizon_reshare.storage.query.read import get_last_publication_time
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +35,17 @@ class EventSelectionStrategy(ABC):
     ) -> Optional[List[MobilizonEvent]]:
         pass
 
+    async def select_from_storage(self) -> Optional[MobilizonEvent]:
+        """
+        Selects the event to publish among the ones in the database. Strategies that can express their choice as a
+        query should override this method, by default every published and unpublished event is loaded and passed
+        to `select`.
+        """
+        return self.select(
+            list(await get_published_events()),
+            await get_mobilizon_events_without_publications(),
+        )
+
 
 class SelectNextEventStrategy(EventSelectionStrategy):
     def _select(
@@ -50,18 +67,37 @@ class SelectNextEventStrategy(EventSelectionStrategy):
             return unpublished_events
 
         last_published_event = published_events[-1]
-        now = arrow.now()
         last_published_event_most_recent_publication_time = max(
             last_published_event.publication_time.values()
         )
+        if self._is_break_running(last_published_event_most_recent_publication_time):
+            return []
+
+        return unpublished_events
 
-        assert last_published_event_most_recent_publication_time < now, (
+    async def select_from_storage(self) -> Optional[MobilizonEvent]:
+        last_publication_time = await get_last_publication_time()
+        if last_publication_time is not None and self._is_break_running(
+            arrow.get(last_publication_time)
+        ):
+            return None
+
+        # the next event in the queue, if any
+        event = await get_next_unpublished_mobilizon_event()
+        if event is None:
+            logger.debug("No event to publish.")
+        return event
+
+    @staticmethod
+    def _is_break_running(last_publication_time: arrow.Arrow) -> bool:
+        now = arrow.now()
+        assert last_publication_time < now, (
             f"Last published event has been published in the future\n"
-            f"{last_published_event_most_recent_publication_time}\n"
+            f"{last_publication_time}\n"
             f"{now}"
         )
         if (
-            last_published_event_most_recent_publication_time.shift(
+            last_publication_time.shift(
                 minutes=get_settings()[
                     "selection.strategy_options.break_between_events_in_minutes"
                 ]
@@ -72,9 +108,8 @@ class SelectNextEventStrategy(EventSelectionStrategy):
             logger.debug(
                 "Last event was published recently. No event is going to be published."
             )
-            return []
-
-        return unpublished_events
+            return True
+        return False
 
 
 STRATEGY_NAME_TO_STRATEGY_CLASS = {"next_event": SelectNextEventStrategy}
@@ -100,3 +135,12 @@ def select_event_to_publish(
     ]()
 
     return strategy.select(published_events, unpublished_events)
+
+
+async def select_stored_event_to_publish() -> Optional[MobilizonEvent]:
+
+    strategy = STRATEGY_NAME_TO_STRATEGY_CLASS[
+        get_settings()["selection"]["strategy"]
+    ]()
+
+    return await strategy.select_from_storage()
@@ -1,6 +1,17 @@
 from bs4 import BeautifulSoup, Tag
 import markdownify
 
+from mobilizon_reshare.config.config import get_settings
+
+_MARKDOWN_CONVERTER = markdownify.MarkdownConverter()
+
+
+def parse_html(content) -> BeautifulSoup:
+    """
+    Parses a HTML fragment with the tree builder selected by the ``html_parser`` setting.
+    """
+    return BeautifulSoup(content, features=get_settings()["html_parser"])
+
 
 def get_bottom_paragraphs(soup: BeautifulSoup) -> list[Tag]:
     return [d for d in soup.findAll("p") if not d.find("p")]
@@ -14,7 +25,7 @@ def html_to_plaintext(content) -> str:
     :return:
     """
     # TODO: support links and quotes
-    soup = BeautifulSoup(content, features="html.parser")
+    soup = parse_html(content)
     p_list = get_bottom_paragraphs(soup)
     if p_list:
         return "\n".join(" ".join(tag.stripped_strings) for tag in p_list)
@@ -23,6 +34,6 @@ def html_to_plaintext(content) -> str:
 
 
 def html_to_markdown(content) -> str:
-    markdown = markdownify.markdownify(content)
+    markdown = _MARKDOWN_CONVERTER.convert_soup(parse_html(content))
     escaped_markdown = markdown.replace(">", "\\>")
     return escaped_markdown.strip()
@@ -0,0 +1,272 @@
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import Optional
+
+# tags that can't have any content, serialized as self-closing tags
+VOID_ELEMENTS = {
+    "area",
+    "base",
+    "basefont",
+    "bgsound",
+    "br",
+    "col",
+    "command",
+    "embed",
+    "frame",
+    "hr",
+    "image",
+    "img",
+    "input",
+    "isindex",
+    "keygen",
+    "link",
+    "menuitem",
+    "meta",
+    "nextid",
+    "param",
+    "source",
+    "spacer",
+    "track",
+    "wbr",
+}
+HEADERS = {"h1", "h2", "h3"}
+# tags whose text is kept as it is, while elsewhere text made only of whitespace is reduced to a single character
+PRESERVE_WHITESPACE = {"pre", "textarea"}
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+# kinds of the pieces of the converted message, only text is visible
+_TEXT, _MARKUP, _COMMENT, _DECLARATION = range(4)
+
+
+def _serialize_attributes(attrs: list[tuple[str, Optional[str]]]) -> str:
+    serialized = []
+    # like BeautifulSoup, the last value of repeated attributes wins and attributes are sorted
+    for name, value in sorted(dict(attrs).items()):
+        value = escape(value or "", quote=False)
+        if '"' in value and "'" not in value:
+            serialized.append(f" {name}='{value}'")
+        else:
+            serialized.append(f' {name}="{value.replace(chr(34), "&quot;")}"')
+    return "".join(serialized)
+
+
+class _Frame:
+    """An element that is still open."""
+
+    def __init__(self, tag: str, start: str):
+        self.tag = tag
+        self.start = start
+        # headers and void elements collect their content, as it decides how they are converted
+        self.pieces: Optional[list[tuple[int, str]]] = (
+            [] if tag in HEADERS or tag in VOID_ELEMENTS else None
+        )
+        self.has_text = False
+
+
+class TelegramHTMLConverter(HTMLParser):
+    """
+    Converts HTML5 to Telegram's HTML dialect in a single pass, keeping track of the length of the visible text:
+
+      - paragraphs and line breaks are replaced by a new line;
+      - non empty headers become bold text on their own line, empty ones are dropped;
+      - unordered lists are removed and their elements start with a dot;
+      - multiple empty lines are collapsed.
+
+    Other tags are kept. Unbalanced tags are closed as BeautifulSoup does.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._root: list[tuple[int, str]] = []
+        self._stack: list[_Frame] = []
+        self._data: list[str] = []
+        # void elements already closed by their start tag, whose end tag has to be ignored
+        self._closed_void_elements: list[str] = []
+
+    def _pieces(self) -> list[tuple[int, str]]:
+        for frame in reversed(self._stack):
+            if frame.pieces is not None:
+                return frame.pieces
+        return self._root
+
+    def _add_text(self, text: str, visible_in_headers: bool = True) -> None:
+        if visible_in_headers and text:
+            for frame in self._stack:
+                frame.has_text = True
+        self._pieces().append((_TEXT, text))
+
+    def _flush_data(self) -> None:
+        """
+        Adds the text collected since the last tag, reducing whitespace as BeautifulSoup does.
+        """
+        text = "".join(self._data)
+        self._data = []
+        if not text:
+            return
+        if not text.strip(ASCII_SPACES) and not any(
+            frame.tag in PRESERVE_WHITESPACE for frame in self._stack
+        ):
+            text = "\n" if "\n" in text else " "
+        self._add_text(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_data()
+        if tag in VOID_ELEMENTS:
+            self._add_void(tag, attrs)
+            self._closed_void_elements.append(tag)
+        else:
+            self._open(tag, attrs)
+
+    def _open(self, tag, attrs):
+        start = f"<{tag}{_serialize_attributes(attrs)}>"
+        if tag not in {"p", "ul", "li"} | HEADERS | VOID_ELEMENTS:
+            self._pieces().append((_MARKUP, start))
+        self._stack.append(_Frame(tag, start))
+        if tag == "li":
+            self._add_text("• ", visible_in_headers=False)
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush_data()
+        if tag not in VOID_ELEMENTS:
+            self._open(tag, attrs)
+            self.handle_endtag(tag)
+        elif tag in self._closed_void_elements:
+            # BeautifulSoup takes this tag as the end of a previous one, leaving it open and containing what follows
+            self._closed_void_elements.remove(tag)
+            self._open(tag, attrs)
+        else:
+            self._add_void(tag, attrs)
+
+    def _add_void(self, tag, attrs):
+        if tag == "br":
+            self._add_text("\n")
+        else:
+            self._pieces().append((_MARKUP, f"<{tag}{_serialize_attributes(attrs)}/>"))
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void_elements:
+            self._closed_void_elements.remove(tag)
+            return
+        self._flush_data()
+        if not any(frame.tag == tag for frame in self._stack):
+            return
+        while True:
+            frame = self._stack[-1]
+            self._close(frame)
+            if frame.tag == tag:
+                return
+
+    def _close(self, frame: _Frame) -> None:
+        self._stack.pop()
+        if frame.tag in {"p", "br"}:
+            self._pieces().extend(frame.pieces or [])
+            self._add_text("\n")
+        elif frame.tag in VOID_ELEMENTS:
+            if frame.pieces:
+                pieces = self._pieces()
+                pieces.append((_MARKUP, frame.start))
+                pieces.extend(frame.pieces)
+                pieces.append((_MARKUP, f"</{frame.tag}>"))
+            else:
+                self._pieces().append((_MARKUP, frame.start[:-1] + "/>"))
+        elif frame.tag in HEADERS:
+            if frame.has_text:
+                pieces = self._pieces()
+                pieces.append((_TEXT, "\n"))
+                pieces.append((_MARKUP, "<b" + frame.start[len(frame.tag) + 1:]))
+                pieces.extend(frame.pieces)
+                pieces.append((_MARKUP, "</b>"))
+                pieces.append((_TEXT, "\n"))
+        elif frame.tag not in {"ul", "li"}:
+            self._pieces().append((_MARKUP, f"</{frame.tag}>"))
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_comment(self, data):
+        self._flush_data()
+        self._pieces().append((_COMMENT, data))
+
+    def handle_decl(self, decl):
+        self._flush_data()
+        if decl.startswith("DOCTYPE "):
+            decl = decl[len("DOCTYPE "):]
+        # BeautifulSoup writes every declaration as a doctype on its own line
+        self._pieces().append((_DECLARATION, decl))
+        self._pieces().append((_TEXT, "\n"))
+
+    def convert(self, content: str) -> tuple[str, int]:
+        """
+        Returns the converted content and the length of its visible text.
+        """
+        self.feed(content)
+        self.close()
+        self._flush_data()
+        while self._stack:
+            self._close(self._stack[-1])
+
+        pieces = []
+        for kind, value in self._root:
+            if kind == _TEXT and pieces and pieces[-1][0] == _TEXT:
+                pieces[-1] = (_TEXT, pieces[-1][1] + value)
+            else:
+                pieces.append((kind, value))
+        # new lines can't span across markup, so each piece can be cleaned up on its own
+        pieces = [(kind, re.sub(r"\n{2,}", "\n\n", value)) for kind, value in pieces]
+        if pieces and pieces[0][0] == _TEXT:
+            pieces[0] = (_TEXT, pieces[0][1].lstrip())
+        if pieces and pieces[-1][0] == _TEXT:
+            pieces[-1] = (_TEXT, pieces[-1][1].rstrip())
+
+        serialized = []
+        text_length = 0
+        for kind, value in pieces:
+            if kind == _MARKUP:
+                serialized.append(value)
+                continue
+            if kind == _TEXT:
+                text_length += len(value)
+                serialized.append(escape(value, quote=False))
+            elif kind == _COMMENT:
+                serialized.append(f"<!--{value}-->")
+            else:
+                serialized.append(f"<!DOCTYPE {value}>")
+        return "".join(serialized), text_length
+
+
+class TelegramMessage(str):
+    """
+    A message in Telegram's HTML dialect that knows the length of its visible text.
+    """
+
+    def __new__(cls, message: str, text_length: int):
+        instance = super().__new__(cls, message)
+        instance.text_length = text_length
+        return instance
+
+
+class _TextLengthCounter(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text_length = 0
+
+    def handle_data(self, data):
+        self.text_length += len(data)
+
+
+def get_text_length(message: str) -> int:
+    """
+    Returns the length of the visible text of a message in Telegram's HTML dialect.
+    """
+    counter = _TextLengthCounter()
+    counter.feed(message)
+    counter.close()
+    return counter.text_length
+
+
+def html_to_telegram(content: str) -> tuple[str, int]:
+    """
+    Converts HTML5 to Telegram's HTML dialect, returning the converted message and the length of its visible text.
+    """
+    return TelegramHTMLConverter().convert(content)
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+import signal
+from functools import partial
+from typing import Awaitable, Callable, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+
+from mobilizon_reshare.config.command import CommandConfig
+from mobilizon_reshare.config.config import get_settings, reload_settings_if_changed
+from mobilizon_reshare.main.publish import select_and_publish
+from mobilizon_reshare.main.pull import pull
+from mobilizon_reshare.main.recap import recap
+from mobilizon_reshare.main.retry import retry_failed_events
+from mobilizon_reshare.main.start import start
+from mobilizon_reshare.publishers import get_active_publishers
+from mobilizon_reshare.publishers.abstract import precompile_templates
+
+logger = logging.getLogger(__name__)
+
+
+def get_jobs(command_config: CommandConfig) -> dict[str, Callable[[], Awaitable]]:
+    """
+    Returns the jobs run by the daemon, by the name of the setting that schedules them.
+    """
+    return {
+        "pull": pull,
+        "publish": partial(select_and_publish, command_config),
+        "recap": partial(recap, command_config),
+        "retry": partial(retry_failed_events, command_config),
+        # pull followed by publish, in the same run
+        "start": partial(start, command_config),
+    }
+
+
+class Daemon:
+    """
+    Runs the jobs of mobilizon-reshare on the schedules in the daemon section of the settings, in the same process and
+    event loop, so that the database connections and the HTTP clients are shared by all the runs. A job that is still
+    running when it's due again is skipped, and runs missed e.g. while the system was suspended are collapsed in one.
+    """
+
+    def __init__(
+        self,
+        command_config: CommandConfig,
+        scheduler: Optional[AsyncIOScheduler] = None,
+    ):
+        self.jobs = get_jobs(command_config)
+        self.scheduler = scheduler or AsyncIOScheduler()
+        self._running_jobs: set[asyncio.Task] = set()
+        self._stopped = asyncio.Event()
+
+    def schedule(self) -> None:
+        schedules = get_settings()["daemon"]
+        for name, job in self.jobs.items():
+            crontab = schedules[name].strip()
+            if not crontab:
+                logger.info(f"Job {name} is disabled")
+                continue
+            self.scheduler.add_job(
+                partial(self.run_job, name, job),
+                CronTrigger.from_crontab(crontab, timezone=self.scheduler.timezone),
+                id=name,
+                name=name,
+                max_instances=1,
+                coalesce=True,
+                misfire_grace_time=None,
+            )
+            logger.info(f"Job {name} scheduled with '{crontab}'")
+
+    async def run_job(self, name: str, job: Callable[[], Awaitable]) -> None:
+        task = asyncio.current_task()
+        self._running_jobs.add(task)
+        try:
+            try:
+                reload_settings_if_changed()
+            except Exception:
+                logger.exception(
+                    "Invalid configuration, the previous settings are kept"
+                )
+            logger.info(f"Running job {name}")
+            await job()
+        except Exception:
+            # a failed run must not stop the daemon, the job runs again at its next schedule
+            logger.exception(f"Job {name} failed")
+        finally:
+            self._running_jobs.discard(task)
+
+    def stop(self) -> None:
+        logger.info("Stopping the daemon")
+        self._stopped.set()
+
+    async def run(self) -> int:
+        precompile_templates(get_active_publishers())
+        self.schedule()
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, self.stop)
+        self.scheduler.start()
+        try:
+            await self._stopped.wait()
+        finally:
+            for signal_number in (signal.SIGINT, signal.SIGTERM):
+                loop.remove_signal_handler(signal_number)
+            self.scheduler.shutdown(wait=False)
+            # jobs are left to finish, so that the connections they use are closed only afterwards
+            if self._running_jobs:
+                logger.info(f"Waiting for {len(self._running_jobs)} running jobs")
+                await asyncio.gather(*self._running_jobs, return_exceptions=True)
+        return 0
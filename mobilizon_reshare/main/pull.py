@@ -1,22 +1,140 @@
+import asyncio
 import logging.config
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
 
+import arrow
+import httpx
+from arrow import Arrow
+
+from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent
-from mobilizon_reshare.mobilizon.events import get_mobilizon_future_events
-from mobilizon_reshare.storage.query.write import create_unpublished_events
+from mobilizon_reshare.mobilizon.events import (
+    MobilizonRequestFailed,
+    MobilizonSource,
+    get_sources,
+    iter_mobilizon_future_events,
+)
+from mobilizon_reshare.models.source import Source
+from mobilizon_reshare.storage.query.read import get_source
+from mobilizon_reshare.storage.query.write import (
+    create_unpublished_events,
+    update_source,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def get_watermark(source: Optional[Source]) -> Optional[Arrow]:
+    """
+    Returns the watermark to pull incrementally from, or None when a full pull is due: when incremental pulls are
+    disabled, on the first pull and every ``full_pull_interval_in_hours`` hours to reconcile missed changes.
+    """
+    settings = get_settings()["source"]["mobilizon"]
+    if not settings["incremental"]:
+        return None
+    if source is None or source.last_update_time is None:
+        return None
+    if source.last_full_pull_time is None or arrow.get(
+        source.last_full_pull_time
+    ).shift(hours=settings["full_pull_interval_in_hours"]) <= arrow.now():
+        return None
+    return arrow.get(source.last_update_time)
+
+
+@dataclass
+class SourcePull:
+    """State of the pull of a single source."""
+
+    source: MobilizonSource
+    watermark: Optional[Arrow]
+    pulled_events: int = 0
+    last_update_time: Optional[Arrow] = None
+    error: Optional[Exception] = None
+
+
+async def _pull_source(
+    source_pull: SourcePull, queue: asyncio.Queue, semaphore: asyncio.Semaphore
+) -> None:
+    async with semaphore:
+        try:
+            async for event in iter_mobilizon_future_events(
+                source_pull.source, updated_after=source_pull.watermark
+            ):
+                source_pull.pulled_events += 1
+                if (
+                    source_pull.last_update_time is None
+                    or event.last_update_time > source_pull.last_update_time
+                ):
+                    source_pull.last_update_time = event.last_update_time
+                await queue.put(event)
+        except (MobilizonRequestFailed, httpx.HTTPError) as e:
+            logger.error(f"Failed to pull events from {source_pull.source.name}: {e}")
+            source_pull.error = e
+        except Exception as e:
+            # any other failure, e.g. a malformed answer, must not advance the watermark of the source either
+            logger.exception(f"Failed to pull events from {source_pull.source.name}")
+            source_pull.error = e
+        finally:
+            await queue.put(None)
+
+
+async def _pull_sources(
+    source_pulls: list[SourcePull],
+) -> AsyncIterator[MobilizonEvent]:
+    """
+    Pulls all the sources concurrently, at most ``source.mobilizon.max_concurrent_sources`` at a time, merging their
+    events in a single stream.
+    """
+    settings = get_settings()["source"]["mobilizon"]
+    semaphore = asyncio.Semaphore(settings["max_concurrent_sources"])
+    queue = asyncio.Queue(maxsize=settings["page_size"])
+    tasks = [
+        asyncio.create_task(_pull_source(source_pull, queue, semaphore))
+        for source_pull in source_pulls
+    ]
+    completed = 0
+    try:
+        while completed < len(tasks):
+            event = await queue.get()
+            if event is None:
+                completed += 1
+            else:
+                yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 async def pull() -> list[MobilizonEvent]:
     """
-    Fetches the latest events from Mobilizon and stores them.
+    Fetches the latest events from all the configured sources and stores them.
     :return:
     """
+    source_pulls = []
+    for source in get_sources():
+        watermark = get_watermark(await get_source(source.name))
+        if watermark:
+            logger.info(
+                f"Pulling events of {source.name} updated after {watermark.isoformat()}."
+            )
+        source_pulls.append(SourcePull(source, watermark))
+
+    # Pull future events from Mobilizon, page by page, and store in the DB only the ones we didn't know about
+    events = await create_unpublished_events(_pull_sources(source_pulls))
+    logger.info(
+        f"Pulled {sum(p.pulled_events for p in source_pulls)} events from Mobilizon."
+    )
+
+    for source_pull in source_pulls:
+        if source_pull.error is None:
+            await update_source(
+                source_pull.source.name,
+                source_pull.last_update_time,
+                full_pull=source_pull.watermark is None,
+            )
+    if all(source_pull.error is not None for source_pull in source_pulls):
+        raise source_pulls[0].error
 
-    # Pull future events from Mobilizon
-    future_events = get_mobilizon_future_events()
-    logger.info(f"Pulled {len(future_events)} events from Mobilizon.")
-    # Store in the DB only the ones we didn't know about
-    events = await create_unpublished_events(future_events)
     logger.debug(f"There are now {len(events)} unpublished events.")
     return events
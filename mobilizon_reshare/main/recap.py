@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Optional, List
 
@@ -49,14 +50,18 @@ async def recap(command_config: CommandConfig) -> Optional[BaseCoordinatorReport
             )
             for publisher in get_active_publishers()
         ]
+        # coordinators block until every platform has answered, so they run in a thread to keep the event loop free
         if command_config.dry_run:
-            reports = DryRunRecapCoordinator(recap_publications).run()
+            coordinator = DryRunRecapCoordinator(recap_publications)
         else:
-            reports = RecapCoordinator(recap_publications).run()
+            coordinator = RecapCoordinator(recap_publications)
+        reports = await asyncio.to_thread(coordinator.run)
 
         for report in reports.reports:
             if report.status == EventPublicationStatus.FAILED:
-                PublicationFailureNotifiersCoordinator(report).notify_failure()
+                await asyncio.to_thread(
+                    PublicationFailureNotifiersCoordinator(report).notify_failure
+                )
         return reports
     else:
         logger.info("Found no events")
@@ -2,11 +2,18 @@ import logging
 from typing import Optional
 from uuid import UUID
 
+from arrow import now
 from tortoise.exceptions import DoesNotExist
 
-from mobilizon_reshare.dataclasses import MobilizonEvent, EventPublication
+from mobilizon_reshare.config.command import CommandConfig
+from mobilizon_reshare.dataclasses import (
+    MobilizonEvent,
+    EventPublication,
+    EventPublicationStatus,
+)
+from mobilizon_reshare.dataclasses.event import get_mobilizon_events_with_status
 from mobilizon_reshare.dataclasses.publication import get_failed_publications_for_event
-from mobilizon_reshare.main.publish import publish_publications
+from mobilizon_reshare.main.publish import perform_dry_run, publish_publications
 from mobilizon_reshare.publishers.coordinators.event_publishing.publish import (
     PublisherCoordinatorReport,
 )
@@ -15,7 +22,9 @@ from mobilizon_reshare.storage.query.exceptions import EventNotFound
 logger = logging.getLogger(__name__)
 
 
-async def retry_event_publications(event_id) -> Optional[PublisherCoordinatorReport]:
+async def retry_event_publications(
+    event_id, command_config: Optional[CommandConfig] = None
+) -> Optional[PublisherCoordinatorReport]:
     event = await MobilizonEvent.retrieve(event_id)
     failed_publications = await get_failed_publications_for_event(event)
     if not failed_publications:
@@ -23,9 +32,31 @@ async def retry_event_publications(event_id) -> Optional[PublisherCoordinatorRep
         return
 
     logger.info(f"Found {len(failed_publications)} publications.")
+    if command_config and command_config.dry_run:
+        logger.info("Executing in dry run mode. No event is going to be published.")
+        return await perform_dry_run(failed_publications)
     return await publish_publications(failed_publications)
 
 
+async def retry_failed_events(
+    command_config: CommandConfig,
+) -> list[PublisherCoordinatorReport]:
+    """
+    Retries the failed publications of the events that haven't begun yet.
+    """
+    events = await get_mobilizon_events_with_status(
+        [EventPublicationStatus.FAILED, EventPublicationStatus.PARTIAL],
+        from_date=now(),
+    )
+    reports = []
+    for event in events:
+        logger.info(f"Retrying the failed publications of event {event.mobilizon_id}")
+        report = await retry_event_publications(event.mobilizon_id, command_config)
+        if report:
+            reports.append(report)
+    return reports
+
+
 async def retry_publication(publication_id) -> Optional[PublisherCoordinatorReport]:
     try:
         publication = await EventPublication.retrieve(publication_id)
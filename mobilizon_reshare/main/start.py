@@ -15,5 +15,5 @@ async def start(command_config: CommandConfig) -> PublisherCoordinatorReport:
     STUB
     :return:
     """
-    events = await pull()
-    return await select_and_publish(command_config, events,)
+    await pull()
+    return await select_and_publish(command_config)
@@ -0,0 +1,9 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "source" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "name" VARCHAR(256) NOT NULL UNIQUE,
+    "last_update_time" TIMESTAMPTZ,
+    "last_full_pull_time" TIMESTAMPTZ
+);
+-- downgrade --
+DROP TABLE IF EXISTS "source";
@@ -0,0 +1,26 @@
+-- upgrade --
+-- events stored more than once with the same mobilizon_id are merged, before it becomes unique, into the one with the
+-- most publications or, among those, the most recently updated one
+CREATE TABLE "event_duplicate" AS SELECT "event"."id" AS "id", (
+    SELECT "kept"."id" FROM "event" AS "kept"
+    WHERE "kept"."mobilizon_id" = "event"."mobilizon_id"
+    ORDER BY (
+        SELECT COUNT(*) FROM "publication" WHERE "publication"."event_id" = "kept"."id"
+    ) DESC, "kept"."last_update_time" DESC, "kept"."id"
+    LIMIT 1
+) AS "kept_id" FROM "event";
+DELETE FROM "event_duplicate" WHERE "id" = "kept_id";
+UPDATE "publication" SET "event_id" = (
+    SELECT "kept_id" FROM "event_duplicate" WHERE "event_duplicate"."id" = "publication"."event_id"
+) WHERE "event_id" IN (SELECT "id" FROM "event_duplicate");
+DELETE FROM "event" WHERE "id" IN (SELECT "id" FROM "event_duplicate");
+DROP TABLE "event_duplicate";
+CREATE UNIQUE INDEX "uid_event_mobiliz_181cfb" ON "event" ("mobilizon_id");
+CREATE INDEX "idx_event_begin_d_f0f833" ON "event" ("begin_datetime");
+CREATE INDEX "idx_publication_timesta_9af706" ON "publication" ("timestamp");
+CREATE INDEX "idx_publication_event_i_662f72" ON "publication" ("event_id", "status");
+-- downgrade --
+DROP INDEX "idx_publication_event_i_662f72";
+DROP INDEX "idx_publication_timesta_9af706";
+DROP INDEX "idx_event_begin_d_f0f833";
+DROP INDEX "uid_event_mobiliz_181cfb";
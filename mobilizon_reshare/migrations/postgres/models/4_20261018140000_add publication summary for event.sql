@@ -0,0 +1,18 @@
+-- upgrade --
+ALTER TABLE "event" ADD "publication_status" SMALLINT NOT NULL DEFAULT 1;
+ALTER TABLE "event" ADD "last_published_at" TIMESTAMPTZ;
+COMMENT ON COLUMN "event"."publication_status" IS 'WAITING: 1\nFAILED: 2\nCOMPLETED: 3\nPARTIAL: 4';
+UPDATE "event" SET "last_published_at" = (
+    SELECT MAX("publication"."timestamp") FROM "publication" WHERE "publication"."event_id" = "event"."id"
+);
+UPDATE "event" SET "publication_status" = CASE
+    WHEN NOT EXISTS (SELECT 1 FROM "publication" WHERE "publication"."event_id" = "event"."id") THEN 1
+    WHEN NOT EXISTS (SELECT 1 FROM "publication" WHERE "publication"."event_id" = "event"."id" AND "publication"."status" = 1) THEN 2
+    WHEN NOT EXISTS (SELECT 1 FROM "publication" WHERE "publication"."event_id" = "event"."id" AND "publication"."status" = 0) THEN 3
+    ELSE 4
+END;
+CREATE INDEX "idx_event_last_pu_198e97" ON "event" ("last_published_at");
+-- downgrade --
+DROP INDEX "idx_event_last_pu_198e97";
+ALTER TABLE "event" DROP COLUMN "last_published_at";
+ALTER TABLE "event" DROP COLUMN "publication_status";
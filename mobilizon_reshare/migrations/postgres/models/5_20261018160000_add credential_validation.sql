@@ -0,0 +1,9 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "credential_validation" (
+    "id" UUID NOT NULL  PRIMARY KEY,
+    "platform" VARCHAR(256) NOT NULL UNIQUE,
+    "credentials_hash" VARCHAR(64) NOT NULL,
+    "validated_at" TIMESTAMPTZ NOT NULL
+);
+-- downgrade --
+DROP TABLE IF EXISTS "credential_validation";
@@ -0,0 +1,9 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "source" (
+    "id" CHAR(36) NOT NULL  PRIMARY KEY,
+    "name" VARCHAR(256) NOT NULL UNIQUE,
+    "last_update_time" TIMESTAMP,
+    "last_full_pull_time" TIMESTAMP
+);
+-- downgrade --
+DROP TABLE IF EXISTS "source";
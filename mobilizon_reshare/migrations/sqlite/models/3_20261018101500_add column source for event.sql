@@ -0,0 +1,4 @@
+-- upgrade --
+ALTER TABLE "event" ADD "source" VARCHAR(256);
+-- downgrade --
+ALTER TABLE "event" DROP COLUMN "source";
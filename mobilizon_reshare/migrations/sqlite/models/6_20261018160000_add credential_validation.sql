@@ -0,0 +1,9 @@
+-- upgrade --
+CREATE TABLE IF NOT EXISTS "credential_validation" (
+    "id" CHAR(36) NOT NULL  PRIMARY KEY,
+    "platform" VARCHAR(256) NOT NULL UNIQUE,
+    "credentials_hash" VARCHAR(64) NOT NULL,
+    "validated_at" TIMESTAMP NOT NULL
+);
+-- downgrade --
+DROP TABLE IF EXISTS "credential_validation";
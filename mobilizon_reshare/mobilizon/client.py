@@ -0,0 +1,44 @@
+import importlib.util
+import logging
+from typing import Optional
+
+import httpx
+
+from mobilizon_reshare.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# The client is shared by every request to Mobilizon for the whole life of the process, so that connections are kept
+# alive and reused across pages, sources and successive pulls.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    # httpx speaks HTTP/2 only when the optional h2 package is installed
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Returns the process-wide client used to query Mobilizon, creating it on first use.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        settings = get_settings()["source"]["mobilizon"]
+        _client = httpx.AsyncClient(
+            http2=_http2_available(),
+            timeout=settings["timeout"],
+            limits=httpx.Limits(
+                max_connections=settings["max_connections"],
+                max_keepalive_connections=settings["max_connections"],
+            ),
+        )
+        logger.debug("Created HTTP client for Mobilizon")
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
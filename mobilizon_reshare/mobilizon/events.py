@@ -1,14 +1,16 @@
 import json
 import logging
+from dataclasses import dataclass
 from http import HTTPStatus
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
+from urllib.parse import urlparse
 from uuid import UUID
 
 import arrow
-import requests
 
 from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent, _EventPublicationStatus
+from mobilizon_reshare.mobilizon.client import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +34,7 @@ def parse_picture(data):
     return (data.get("picture", {}) or {}).get("url")
 
 
-def parse_event(data):
+def parse_event(data, source: Optional[str] = None):
     return MobilizonEvent(
         name=data["title"],
         description=data.get("description", None),
@@ -45,12 +47,14 @@ def parse_event(data):
         publication_time=None,
         status=_EventPublicationStatus.WAITING,
         last_update_time=arrow.get(data["updatedAt"]) if "updatedAt" in data else None,
+        source=source,
     )
 
 
 query_future_events = """{{
             group(preferredUsername: "{group}") {{
-              organizedEvents(page:{page}, afterDatetime:"{afterDatetime}"){{
+              organizedEvents(page:{page}, limit:{limit}, afterDatetime:"{afterDatetime}"{order}){{
+                total,
                 elements {{
                   title,
                   url,
@@ -78,29 +82,131 @@ query_future_events = """{{
           }}"""
 
 
-def get_mobilizon_future_events(
-    page: int = 1, from_date: Optional[arrow.Arrow] = None
-) -> List[MobilizonEvent]:
+# used in incremental pulls, so that the events changed since the last pull come first
+order_by_update_time = ", order:UPDATED_AT, orderDirection:DESC"
+
+
+@dataclass(frozen=True)
+class MobilizonSource:
+    """A Mobilizon group events are pulled from."""
+
+    url: str
+    group: str
+
+    @property
+    def name(self) -> str:
+        """
+        Identifies the group with its federated handle, e.g. ``my_group@mobilizon.example.org``.
+        """
+        return f"{self.group}@{urlparse(self.url).netloc}"
+
+
+def get_sources() -> List[MobilizonSource]:
+    """
+    Returns the configured sources: either the list in ``source.mobilizon.sources`` or the single group
+    configured through ``source.mobilizon.url`` and ``source.mobilizon.group``.
+    """
+    settings = get_settings()["source"]["mobilizon"]
+    sources = settings.get("sources") or [
+        {"url": settings["url"], "group": settings["group"]}
+    ]
+    return [MobilizonSource(url=s["url"], group=s["group"]) for s in sources]
 
-    url = get_settings()["source"]["mobilizon"]["url"]
+
+async def get_mobilizon_future_events_page(
+    source: MobilizonSource,
+    page: int = 1,
+    limit: int = 50,
+    from_date: Optional[arrow.Arrow] = None,
+    by_update_time: bool = False,
+) -> tuple[List[MobilizonEvent], Optional[int]]:
+    """
+    Retrieves a single page of future events of the given source, sorted by begin time or, when
+    ``by_update_time`` is set, from the most to the least recently updated.
+
+    Returns the events in the page together with the total number of future events, as reported by Mobilizon.
+    """
     query = query_future_events.format(
-        group=get_settings()["source"]["mobilizon"]["group"],
+        group=source.group,
         page=page,
+        limit=limit,
         afterDatetime=from_date or arrow.now().isoformat(),
+        order=order_by_update_time if by_update_time else "",
     )
-    r = requests.post(url, json={"query": query})
+    r = await get_client().post(source.url, json={"query": query})
     if r.status_code != HTTPStatus.OK:
         raise MobilizonRequestFailed(
-            f"Request for events failed with code:{r.status_code}"
+            f"Request for events of {source.name} failed with code:{r.status_code}"
         )
 
     response_json = r.json()
     logger.debug(f"Response:\n{json.dumps(response_json, indent=4)}")
     if "errors" in response_json:
         raise MobilizonRequestFailed(
-            f"Request for events failed because of the following errors: "
+            f"Request for events of {source.name} failed because of the following errors: "
             f"{json.dumps(response_json['errors'],indent=4)}"
         )
-    return list(
-        map(parse_event, response_json["data"]["group"]["organizedEvents"]["elements"])
+    organized_events = response_json["data"]["group"]["organizedEvents"]
+    return (
+        [parse_event(e, source=source.name) for e in organized_events["elements"]],
+        organized_events.get("total"),
     )
+
+
+async def iter_mobilizon_future_events(
+    source: MobilizonSource,
+    from_date: Optional[arrow.Arrow] = None,
+    updated_after: Optional[arrow.Arrow] = None,
+) -> AsyncIterator[MobilizonEvent]:
+    """
+    Lazily walks all the pages of future events of the given source, requesting a new page only when the
+    previous one has been consumed. At most ``source.mobilizon.max_events`` events are returned.
+
+    When ``updated_after`` is given, only the events updated after it are returned: events are requested from
+    the most recently updated and the walk stops at the first event that didn't change.
+    """
+    settings = get_settings()["source"]["mobilizon"]
+    page_size = settings["page_size"]
+    max_events = settings["max_events"]
+    from_date = from_date or arrow.now().isoformat()
+
+    page = 1
+    pulled = 0
+    while True:
+        events, total = await get_mobilizon_future_events_page(
+            source,
+            page=page,
+            limit=page_size,
+            from_date=from_date,
+            by_update_time=updated_after is not None,
+        )
+        for event in events:
+            if updated_after is not None and event.last_update_time <= updated_after:
+                return
+            yield event
+            pulled += 1
+            if pulled >= max_events:
+                if total is None or total > max_events:
+                    logger.warning(
+                        f"Reached the limit of {max_events} events to pull from {source.name}. "
+                        f"The remaining events will be ignored."
+                    )
+                return
+
+        # a short page means there's nothing left, otherwise we rely on the total reported by Mobilizon
+        if len(events) < page_size or (total is not None and pulled >= total):
+            return
+        page += 1
+
+
+async def get_mobilizon_future_events(
+    source: MobilizonSource,
+    from_date: Optional[arrow.Arrow] = None,
+    updated_after: Optional[arrow.Arrow] = None,
+) -> List[MobilizonEvent]:
+    return [
+        event
+        async for event in iter_mobilizon_future_events(
+            source, from_date=from_date, updated_after=updated_after
+        )
+    ]
@@ -0,0 +1,17 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class CredentialValidation(Model):
+    id = fields.UUIDField(pk=True)
+    # kind and name of the platform, i.e. publisher.telegram
+    platform = fields.CharField(max_length=256, unique=True)
+    # hash of the settings the credentials have been validated with
+    credentials_hash = fields.CharField(max_length=64)
+    validated_at = fields.DatetimeField()
+
+    def __str__(self):
+        return str(self.platform)
+
+    class Meta:
+        table = "credential_validation"
@@ -1,3 +1,4 @@
+from enum import IntEnum
 from typing import Iterator
 
 from tortoise import fields
@@ -9,21 +10,37 @@ from mobilizon_reshare.models.publication import PublicationStatus, Publication
 from mobilizon_reshare.models.publisher import Publisher
 
 
+class EventPublicationStatus(IntEnum):
+    WAITING = 1
+    FAILED = 2
+    COMPLETED = 3
+    PARTIAL = 4
+
+
 class Event(Model, WithPydantic):
     id = fields.UUIDField(pk=True)
     name = fields.TextField()
     description = fields.TextField(null=True)
 
-    mobilizon_id = fields.UUIDField()
+    mobilizon_id = fields.UUIDField(unique=True)
     mobilizon_link = fields.TextField()
     thumbnail_link = fields.TextField(null=True)
 
     location = fields.TextField(null=True)
 
-    begin_datetime = fields.DatetimeField()
+    begin_datetime = fields.DatetimeField(index=True)
     end_datetime = fields.DatetimeField()
     last_update_time = fields.DatetimeField()
 
+    # name of the source the event has been pulled from
+    source = fields.CharField(max_length=256, null=True)
+
+    # summary of the publications of the event, kept up to date when a publication report is saved
+    publication_status = fields.IntEnumField(
+        EventPublicationStatus, default=EventPublicationStatus.WAITING
+    )
+    last_published_at = fields.DatetimeField(null=True, index=True)
+
     publications: fields.ReverseRelation["Publication"]
 
     def __str__(self):
@@ -15,7 +15,7 @@ class Publication(Model, WithPydantic):
     id = fields.UUIDField(pk=True)
     status = fields.IntEnumField(PublicationStatus)
 
-    timestamp = fields.DatetimeField()
+    timestamp = fields.DatetimeField(index=True)
     reason = fields.TextField(null=True)
 
     event = fields.ForeignKeyField("models.Event", related_name="publications")
@@ -26,3 +26,4 @@ class Publication(Model, WithPydantic):
 
     class Meta:
         table = "publication"
+        indexes = (("event_id", "status"),)
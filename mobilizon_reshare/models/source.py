@@ -0,0 +1,17 @@
+from tortoise import fields
+from tortoise.models import Model
+
+
+class Source(Model):
+    id = fields.UUIDField(pk=True)
+    name = fields.CharField(max_length=256, unique=True)
+
+    # most recent update time among the events pulled from this source, used as watermark for incremental pulls
+    last_update_time = fields.DatetimeField(null=True)
+    last_full_pull_time = fields.DatetimeField(null=True)
+
+    def __str__(self):
+        return str(self.name)
+
+    class Meta:
+        table = "source"
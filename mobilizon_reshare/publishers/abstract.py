@@ -1,20 +1,120 @@
 import importlib
 import inspect
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Callable, Hashable, Iterable, Mapping, Optional
 
-from dynaconf.utils.boxing import DynaBox
 from jinja2 import Environment, FileSystemLoader, Template
 
 from mobilizon_reshare.config.config import get_settings
-from .exceptions import InvalidAttribute
+from . import credentials
+from .exceptions import InvalidAttribute, InvalidCredentials
 from ..dataclasses import _MobilizonEvent
 
 JINJA_ENV = Environment(loader=FileSystemLoader("/"))
 
 logger = logging.getLogger(__name__)
 
+# Compiled templates shared by every formatter of the process, keyed by publisher, kind of template (message, recap
+# fragment or recap header), path and modification time of the file. Templates bundled with the package don't change
+# while the process is running, so they are stored without a modification time.
+_TEMPLATE_CACHE: dict[tuple[str, str, str, Optional[float]], Template] = {}
+
+TEMPLATE_KINDS = ("", "_recap", "_recap_header")
+
+# Messages and recap fragments already formatted, keyed by revision of the event, formatter, kind of template, compiled
+# template and locale, so that an event is formatted again only when one of them changes. Only the
+# ``publishing.message_cache_size`` most recently used ones are kept.
+_MESSAGE_CACHE: OrderedDict[Hashable, str] = OrderedDict()
+_message_cache_lock = threading.Lock()
+
+# HTTP status codes with which a service refuses the credentials of a platform
+UNAUTHORIZED_STATUS_CODES = (401, 403)
+
+
+def invalidate_template_cache() -> None:
+    """
+    Drops every compiled template, so that they are read again from the filesystem when next used.
+    """
+    _TEMPLATE_CACHE.clear()
+
+
+def _get_cached_template(
+    publisher: str, kind: str, path: str, mtime: Optional[float]
+) -> Template:
+    key = (publisher, kind, path, mtime)
+    template = _TEMPLATE_CACHE.get(key)
+    if template is None:
+        # older versions of the same file are not going to be used anymore
+        for stale_key in [k for k in list(_TEMPLATE_CACHE) if k[:3] == key[:3]]:
+            _TEMPLATE_CACHE.pop(stale_key, None)
+        template = JINJA_ENV.get_template(path)
+        _TEMPLATE_CACHE[key] = template
+    return template
+
+
+def _get_configured_template(publisher: str, kind: str, path: str) -> Template:
+    # JINJA_ENV resolves every path from the root of the filesystem
+    mtime = os.stat(os.path.join("/", path)).st_mtime
+    return _get_cached_template(publisher, kind, path, mtime)
+
+
+def _bundled_template_ref(publisher: str, kind: str):
+    return importlib.resources.files(
+        "mobilizon_reshare.publishers.templates"
+    ) / f"{publisher}{kind}.tmpl.j2"
+
+
+def _get_bundled_template(publisher: str, kind: str) -> Template:
+    template_ref = _bundled_template_ref(publisher, kind)
+    key = (publisher, kind, str(template_ref), None)
+    if key not in _TEMPLATE_CACHE:
+        with importlib.resources.as_file(template_ref) as template_path:
+            _TEMPLATE_CACHE[key] = JINJA_ENV.get_template(template_path.as_posix())
+    return _TEMPLATE_CACHE[key]
+
+
+def invalidate_message_cache() -> None:
+    """
+    Drops every formatted message, so that events are formatted again when next used.
+    """
+    with _message_cache_lock:
+        _MESSAGE_CACHE.clear()
+
+
+def _get_cached_message(key: Hashable, format_message: Callable[[], str]) -> str:
+    size = get_settings()["publishing"]["message_cache_size"]
+    if size <= 0:
+        return format_message()
+
+    with _message_cache_lock:
+        message = _MESSAGE_CACHE.get(key)
+        if message is not None:
+            _MESSAGE_CACHE.move_to_end(key)
+            return message
+
+    message = format_message()
+    with _message_cache_lock:
+        _MESSAGE_CACHE[key] = message
+        _MESSAGE_CACHE.move_to_end(key)
+        while len(_MESSAGE_CACHE) > size:
+            _MESSAGE_CACHE.popitem(last=False)
+    return message
+
+
+def precompile_templates(publishers: Iterable[str]) -> None:
+    """
+    Compiles ahead of time the templates bundled with the package for the given publishers, so that the first
+    messages don't pay for it.
+    """
+    for publisher in publishers:
+        for kind in TEMPLATE_KINDS:
+            _get_bundled_template(publisher, kind)
+
 
 class LoggerMixin:
     def _log_debug(self, msg, *args, **kwargs):
@@ -39,19 +139,43 @@ class LoggerMixin:
             raise raise_error(msg)
 
 
+class PlatformSettings:
+    """
+    Read-only copy of the settings of a platform. Its values are plain attributes, so reading them doesn't go
+    through Dynaconf.
+    """
+
+    def __init__(self, values: Mapping[str, Any]):
+        # Dynaconf lets settings be read regardless of their case, platforms read them in lower case
+        self.__dict__.update((name.lower(), value) for name, value in values.items())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Platform settings are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("Platform settings are read-only")
+
+    def __getitem__(self, name: str) -> Any:
+        return self.__dict__[name.lower()]
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.__dict__)
+
+
 class ConfLoaderMixin:
     _conf = tuple()
 
-    @property
-    def conf(self) -> DynaBox:
+    @cached_property
+    def conf(self) -> PlatformSettings:
         """
-        Retrieves class's settings.
+        Retrieves class's settings. They are read once for each instance, so that changes to the settings apply to
+        the instances created afterwards.
         """
         cls = type(self)
 
         try:
             t, n = cls._conf or tuple()
-            return get_settings()[t][n]
+            return PlatformSettings(get_settings()[t][n])
         except (KeyError, ValueError):
             raise InvalidAttribute(
                 f"Class {cls.__name__} has invalid ``_conf`` attribute"
@@ -89,8 +213,12 @@ class AbstractPlatform(ABC, LoggerMixin, ConfLoaderMixin):
         """
         Sends a message to the target channel
         """
-        response = self._send(message, event)
-        self._validate_response(response)
+        try:
+            response = self._send(message, event)
+            self._validate_response(response)
+        except InvalidCredentials:
+            credentials.invalidate_credentials(self)
+            raise
 
     @abstractmethod
     def _validate_response(self, response):
@@ -129,19 +257,14 @@ class AbstractEventFormatter(LoggerMixin, ConfLoaderMixin):
         return self._conf[1]
 
 
-    def _get_template(self, configured_template, default_generator) -> Template:
+    def _get_template(self, kind: str, configured_template: Optional[str]) -> Template:
         if configured_template:
-            return JINJA_ENV.get_template(configured_template)
+            return _get_configured_template(self._get_name(), kind, configured_template)
         else:
-            template_ref = default_generator()
-            with importlib.resources.as_file(template_ref) as template_path:
-                return JINJA_ENV.get_template(template_path.as_posix())
-
+            return _get_bundled_template(self._get_name(), kind)
 
     def get_default_template_path(self, type=""):
-        return importlib.resources.files(
-        "mobilizon_reshare.publishers.templates"
-    ) / f"{self._get_name()}{type}.tmpl.j2"
+        return _bundled_template_ref(self._get_name(), type)
 
 
     def get_default_recap_template_path(self):
@@ -153,22 +276,54 @@ class AbstractEventFormatter(LoggerMixin, ConfLoaderMixin):
 
 
     def validate_event(self, event: _MobilizonEvent) -> None:
+        self.get_validated_message(event)
+
+    def get_validated_message(self, event: _MobilizonEvent) -> str:
+        """
+        Validates the event and retrieves the message built from it, once it has been validated as well.
+        """
         self._validate_event(event)
-        self._validate_message(self.get_message_from_event(event))
+        message = self.get_message_from_event(event)
+        self._validate_message(message)
+        return message
 
     @abstractmethod
     def _preprocess_event(self, event):
         """
-        Allows publishers to preprocess events before feeding them to the template
+        Allows publishers to preprocess events before feeding them to the template. The event can be shared with
+        other formatters, so it should be left untouched and a modified copy returned instead.
         """
         return event
 
+    def _get_preprocessed_event(self, event: _MobilizonEvent) -> _MobilizonEvent:
+        return event.get_view(type(self), self._preprocess_event)
+
+    def _get_message_key(
+        self, event: _MobilizonEvent, kind: str, template: Template, locale: str
+    ) -> Hashable:
+        return (
+            event.mobilizon_id,
+            event.last_update_time,
+            type(self),
+            kind,
+            template,
+            locale,
+        )
+
     def get_message_from_event(self, event: _MobilizonEvent) -> str:
         """
         Retrieves a message from the event itself.
         """
-        event = self._preprocess_event(event)
-        message = event.format(self.get_message_template())
+        template = self.get_message_template()
+        locale = get_settings()["locale"]
+        return _get_cached_message(
+            self._get_message_key(event, "", template, locale),
+            lambda: self._format_message(event, template, locale),
+        )
+
+    def _format_message(self, event: _MobilizonEvent, template: Template, locale: str) -> str:
+        event = self._get_preprocessed_event(event)
+        message = event.format(template, locale)
         message = self._preprocess_message(message)
         return message
 
@@ -176,27 +331,40 @@ class AbstractEventFormatter(LoggerMixin, ConfLoaderMixin):
         """
         Retrieves publisher's message template.
         """
-        return self._get_template(self.conf.msg_template_path, self.get_default_template_path)
+        return self._get_template("", self.conf.msg_template_path)
 
-    def get_recap_header(self) -> Template:
-        return self._get_template(
-            self.conf.recap_header_template_path,
-            self.get_default_recap_header_template_path
-        )
+    def get_recap_header_template(self) -> Template:
+        return self._get_template("_recap_header", self.conf.recap_header_template_path)
 
+    def get_recap_header(self) -> str:
+        return self.get_recap_header_template().render()
 
     def get_recap_fragment_template(self) -> Template:
-        return self._get_template(
-            self.conf.recap_template_path,
-            self.get_default_recap_template_path
-        )
+        return self._get_template("_recap", self.conf.recap_template_path)
 
     def get_recap_fragment(self, event: _MobilizonEvent) -> str:
         """
         Retrieves the fragment that describes a single event inside the event recap.
         """
-        event = self._preprocess_event(event)
-        return event.format(self.get_recap_fragment_template())
+        return self.get_recap_fragments([event])[0]
+
+    def get_recap_fragments(self, events: Iterable[_MobilizonEvent]) -> list[str]:
+        """
+        Retrieves the fragments describing the given events, resolving the template and the locale only once.
+        """
+        template = self.get_recap_fragment_template()
+        locale = get_settings()["locale"]
+        return [
+            self._format_recap_fragment(event, template, locale) for event in events
+        ]
+
+    def _format_recap_fragment(
+        self, event: _MobilizonEvent, template: Template, locale: str
+    ) -> str:
+        return _get_cached_message(
+            self._get_message_key(event, "_recap", template, locale),
+            lambda: self._get_preprocessed_event(event).format(template, locale),
+        )
 
     def _preprocess_message(self, message: str):
         return message
@@ -1,10 +1,14 @@
 import dataclasses
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence, Union
 
+from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses.publication import _EventPublication
 from mobilizon_reshare.models.publication import PublicationStatus
+from mobilizon_reshare.publishers import credentials
 from mobilizon_reshare.publishers.coordinators import BasePublicationReport
 
 logger = logging.getLogger(__name__)
@@ -31,6 +35,46 @@ class BaseEventPublishingCoordinator:
     def __init__(self, publications: List[_EventPublication]):
         self.publications = publications
 
+    @staticmethod
+    def _run_concurrently(
+        f: Callable[[_EventPublication], Any],
+        publications: Sequence[_EventPublication],
+    ) -> List[Union[Any, Exception]]:
+        """
+        Calls f on every publication from a pool of threads and returns, in the same order of the publications,
+        either its result or the exception it raised. Calls still running when the timeout, counted from the
+        start of the round, expires are reported as a TimeoutError.
+
+        Python threads can't be interrupted: a call reported as timed out keeps running until its pending request
+        fails after `publishing.request_timeout` seconds, and it might still reach the platform in the meantime.
+        """
+        if not publications:
+            return []
+        settings = get_settings()["publishing"]
+        executor = ThreadPoolExecutor(
+            max_workers=min(settings["max_concurrent_publications"], len(publications))
+        )
+        deadline = time.monotonic() + settings["timeout"]
+        try:
+            futures = [executor.submit(f, publication) for publication in publications]
+            results = []
+            for future in futures:
+                try:
+                    results.append(
+                        future.result(timeout=max(deadline - time.monotonic(), 0))
+                    )
+                except TimeoutError:
+                    results.append(
+                        TimeoutError(f"No answer after {settings['timeout']} seconds")
+                    )
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            # the round doesn't wait for calls that timed out, but the interpreter still joins their threads before
+            # exiting, which happens at most after `publishing.request_timeout` seconds
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _safe_run(self, reasons, f, *args, **kwargs):
         try:
             f(*args, **kwargs)
@@ -38,17 +82,29 @@ class BaseEventPublishingCoordinator:
         except Exception as e:
             return reasons + [str(e)]
 
+    def _validate_publication(self, publication: _EventPublication) -> List[str]:
+        reasons = []
+        reasons = self._safe_run(
+            reasons, credentials.validate_credentials, publication.publisher
+        )
+        reasons = self._safe_run(reasons, self._validate_message, publication)
+        return reasons
+
+    @staticmethod
+    def _validate_message(publication: _EventPublication) -> None:
+        # the message is kept with the publication, so that it's formatted only once
+        publication.message = publication.formatter.get_validated_message(
+            publication.event
+        )
+
     def _validate(self) -> List[EventPublicationReport]:
         errors = []
 
-        for publication in self.publications:
-            reasons = []
-            reasons = self._safe_run(
-                reasons, publication.publisher.validate_credentials,
-            )
-            reasons = self._safe_run(
-                reasons, publication.formatter.validate_event, publication.event
-            )
+        # validating credentials requires a round-trip to each platform, so they are all validated at the same time
+        results = self._run_concurrently(self._validate_publication, self.publications)
+        for publication, reasons in zip(self.publications, results):
+            if isinstance(reasons, Exception):
+                reasons = [str(reasons)]
 
             if len(reasons) > 0:
                 errors.append(
@@ -22,9 +22,7 @@ class DryRunPublisherCoordinator(PublisherCoordinator):
                 status=PublicationStatus.COMPLETED,
                 publication=publication,
                 reason=None,
-                published_content=publication.formatter.get_message_from_event(
-                    publication.event
-                ),
+                published_content=publication.get_message(),
             )
             for publication in publications
         ]
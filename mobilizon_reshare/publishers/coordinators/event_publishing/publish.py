@@ -1,5 +1,6 @@
 import dataclasses
 import logging
+from concurrent.futures import TimeoutError
 from dataclasses import dataclass
 from typing import Sequence, List
 
@@ -50,20 +51,26 @@ class PublisherCoordinator(BaseEventPublishingCoordinator):
     def _publish(self, publications: Sequence[_EventPublication]) -> List[EventPublicationReport]:
         reports = []
 
-        for publication in publications:
-
-            try:
-                publication_report = self._publish_publication(publication)
-                reports.append(publication_report)
-            except PublisherError as e:
-                logger.error(str(e))
+        # platforms are independent from each other, so the slowest one doesn't delay the others
+        results = self._run_concurrently(self._publish_publication, publications)
+        for publication, result in zip(publications, results):
+            if isinstance(result, Exception):
+                if isinstance(result, (PublisherError, TimeoutError)):
+                    logger.error(f"{publication.publisher.name}: {result}")
+                else:
+                    logger.error(
+                        f"{publication.publisher.name}: unexpected error",
+                        exc_info=result,
+                    )
                 reports.append(
                     EventPublicationReport(
                         status=PublicationStatus.FAILED,
-                        reason=str(e),
+                        reason=str(result),
                         publication=publication,
                     )
                 )
+            else:
+                reports.append(result)
 
         return reports
 
@@ -76,7 +83,7 @@ class PublisherCoordinator(BaseEventPublishingCoordinator):
         """
 
         logger.info("Publishing to %s", publication.publisher.name)
-        message = publication.formatter.get_message_from_event(publication.event)
+        message = publication.get_message()
         publication.publisher.send(message, publication.event)
         return EventPublicationReport(
             status=PublicationStatus.COMPLETED,
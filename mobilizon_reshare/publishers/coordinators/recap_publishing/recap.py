@@ -44,8 +44,9 @@ class RecapCoordinator:
 
     def _build_recap_content(self, recap_publication: RecapPublication):
         fragments = [recap_publication.formatter.get_recap_header()]
-        for event in recap_publication.events:
-            fragments.append(recap_publication.formatter.get_recap_fragment(event))
+        fragments.extend(
+            recap_publication.formatter.get_recap_fragments(recap_publication.events)
+        )
         return "\n\n".join(fragments)
 
     def _send(self, content, recap_publication):
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Optional
+
+import arrow
+
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.publishers.exceptions import InvalidAttribute
+
+logger = logging.getLogger(__name__)
+
+# Platforms whose credentials have been successfully validated, with the hash of the settings they were validated with
+# and the time of the validation. It lives as long as the process and is stored in the database between CLI runs.
+_validations: dict[str, tuple[str, datetime]] = {}
+# whether _validations differs from what has been loaded with set_validations, i.e. whether it needs to be stored
+_changed = False
+# publications validate the credentials of the platforms in parallel threads, hence the lock
+_lock = threading.Lock()
+
+
+def _get_platform_key(platform) -> Optional[tuple[str, str]]:
+    """
+    Returns the name of the platform and the hash of its settings, or None if the platform has no settings.
+    """
+    try:
+        conf = platform.conf
+    except InvalidAttribute:
+        return None
+    kind, name = type(platform)._conf
+    serialized_conf = json.dumps(conf.to_dict(), sort_keys=True, default=str)
+    return (
+        f"{kind}.{name}",
+        hashlib.sha256(serialized_conf.encode("utf-8")).hexdigest(),
+    )
+
+
+def _get_ttl_in_minutes() -> int:
+    return get_settings()["publishing"]["credentials_ttl_in_minutes"]
+
+
+def _is_valid(platform_key: tuple[str, str]) -> bool:
+    name, credentials_hash = platform_key
+    validation = _validations.get(name)
+    if validation is None or validation[0] != credentials_hash:
+        return False
+    return arrow.get(validation[1]).shift(minutes=_get_ttl_in_minutes()) > arrow.now()
+
+
+def validate_credentials(platform) -> None:
+    """
+    Validates the credentials of the platform, unless they have been validated successfully within the configured
+    time to live.
+    """
+    global _changed
+    platform_key = _get_platform_key(platform)
+    if platform_key is not None:
+        with _lock:
+            is_valid = _is_valid(platform_key)
+        if is_valid:
+            logger.debug(f"Credentials of {platform_key[0]} have been validated recently")
+            return
+
+    # the platform is queried without holding the lock, so that the other platforms aren't delayed
+    platform.validate_credentials()
+
+    if platform_key is not None and _get_ttl_in_minutes() > 0:
+        with _lock:
+            _validations[platform_key[0]] = (platform_key[1], arrow.now().datetime)
+            _changed = True
+
+
+def invalidate_credentials(platform) -> None:
+    """
+    Forgets the validation of the credentials of the platform, i.e. after they have been refused.
+    """
+    global _changed
+    platform_key = _get_platform_key(platform)
+    if platform_key is None:
+        return
+    with _lock:
+        removed = _validations.pop(platform_key[0], None)
+        if removed:
+            _changed = True
+    if removed:
+        logger.info(f"Credentials of {platform_key[0]} are going to be validated again")
+
+
+def get_validations() -> dict[str, tuple[str, datetime]]:
+    now = arrow.now()
+    ttl = _get_ttl_in_minutes()
+    with _lock:
+        validations = dict(_validations)
+    return {
+        name: validation
+        for name, validation in validations.items()
+        if arrow.get(validation[1]).shift(minutes=ttl) > now
+    }
+
+
+def set_validations(validations: dict[str, tuple[str, datetime]]) -> None:
+    global _changed
+    with _lock:
+        _validations.clear()
+        _validations.update(validations)
+        _changed = False
+
+
+def validations_changed() -> bool:
+    """
+    Returns whether any validation has been added or removed since the last call to set_validations.
+    """
+    with _lock:
+        return _changed
@@ -36,3 +36,7 @@ class ZulipError(PublisherError):
 
 class HTTPResponseError(PublisherError):
     """Publisher receives a HTTP error"""
+
+
+class HTTPUnauthorized(HTTPResponseError, InvalidCredentials):
+    """Publisher's credentials are refused by its service"""
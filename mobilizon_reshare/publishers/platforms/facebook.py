@@ -1,3 +1,4 @@
+import dataclasses
 from typing import Optional
 
 import facebook
@@ -15,6 +16,11 @@ from mobilizon_reshare.publishers.exceptions import (
     InvalidMessage,
     PublisherError,
 )
+from mobilizon_reshare.publishers.sessions import (
+    get_client,
+    get_request_timeout,
+    get_session,
+)
 
 
 class FacebookFormatter(AbstractEventFormatter):
@@ -30,9 +36,11 @@ class FacebookFormatter(AbstractEventFormatter):
             self._log_error("Message is too long", raise_error=InvalidMessage)
 
     def _preprocess_event(self, event: MobilizonEvent):
-        event.description = html_to_plaintext(event.description)
-        event.name = html_to_plaintext(event.name)
-        return event
+        return dataclasses.replace(
+            event,
+            description=html_to_plaintext(event.description),
+            name=html_to_plaintext(event.name),
+        )
 
 
 class FacebookPlatform(AbstractPlatform):
@@ -43,7 +51,15 @@ class FacebookPlatform(AbstractPlatform):
     name = "facebook"
 
     def _get_api(self) -> facebook.GraphAPI:
-        return facebook.GraphAPI(access_token=self.conf["page_access_token"])
+        access_token = self.conf["page_access_token"]
+        return get_client(
+            (self.name, access_token),
+            lambda: facebook.GraphAPI(
+                access_token=access_token,
+                timeout=get_request_timeout(),
+                session=get_session(self.name),
+            ),
+        )
 
     def _send(self, message: str, event: Optional[MobilizonEvent] = None):
         try:
@@ -53,9 +69,13 @@ class FacebookPlatform(AbstractPlatform):
                 message=message,
                 link=event.mobilizon_link if event else None,
             )
-        except GraphAPIError:
+        except GraphAPIError as e:
             self._log_error(
-                "Facebook send failed", raise_error=PublisherError,
+                "Facebook send failed",
+                # Facebook reports expired or revoked access tokens as OAuthException
+                raise_error=InvalidCredentials
+                if e.type == "OAuthException"
+                else PublisherError,
             )
 
     def validate_credentials(self):
@@ -8,6 +8,7 @@ from mobilizon_reshare.dataclasses import MobilizonEvent
 from mobilizon_reshare.publishers.abstract import (
     AbstractPlatform,
     AbstractEventFormatter,
+    UNAUTHORIZED_STATUS_CODES,
 )
 from mobilizon_reshare.publishers.exceptions import (
     InvalidBot,
@@ -15,7 +16,9 @@ from mobilizon_reshare.publishers.exceptions import (
     InvalidResponse,
     HTTPResponseError,
     InvalidMessage,
+    HTTPUnauthorized,
 )
+from mobilizon_reshare.publishers.sessions import get_request_timeout, get_session
 
 
 class MastodonFormatter(AbstractEventFormatter):
@@ -44,16 +47,18 @@ class MastodonPlatform(AbstractPlatform):
         """
         Send messages
         """
-        return requests.post(
+        return get_session(self.name).post(
             url=urljoin(self.conf.instance, self.api_uri) + "statuses",
             headers={"Authorization": f"Bearer {self.conf.token}"},
             data={"status": message, "visibility": "public"},
+            timeout=get_request_timeout(),
         )
 
     def validate_credentials(self):
-        res = requests.get(
+        res = get_session(self.name).get(
             headers={"Authorization": f"Bearer {self.conf.token}"},
             url=urljoin(self.conf.instance, self.api_uri) + "apps/verify_credentials",
+            timeout=get_request_timeout(),
         )
         data = self._validate_response(res)
 
@@ -71,7 +76,10 @@ class MastodonPlatform(AbstractPlatform):
         except requests.exceptions.HTTPError as e:
             self._log_debug(str(res))
             self._log_error(
-                str(e), raise_error=HTTPResponseError,
+                str(e),
+                raise_error=HTTPUnauthorized
+                if res.status_code in UNAUTHORIZED_STATUS_CODES
+                else HTTPResponseError,
             )
 
         try:
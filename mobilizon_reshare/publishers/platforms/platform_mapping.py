@@ -1,55 +1,60 @@
-from mobilizon_reshare.publishers.platforms.facebook import (
-    FacebookPublisher,
-    FacebookFormatter,
-    FacebookNotifier,
-)
-from mobilizon_reshare.publishers.platforms.mastodon import (
-    MastodonPublisher,
-    MastodonFormatter,
-    MastodonNotifier,
-)
-from mobilizon_reshare.publishers.platforms.telegram import (
-    TelegramPublisher,
-    TelegramFormatter,
-    TelegramNotifier,
-)
-from mobilizon_reshare.publishers.platforms.twitter import (
-    TwitterPublisher,
-    TwitterFormatter,
-    TwitterNotifier,
-)
-from mobilizon_reshare.publishers.platforms.zulip import (
-    ZulipPublisher,
-    ZulipFormatter,
-    ZulipNotifier,
-)
+import importlib
+from collections.abc import Mapping
 
 """
 This module is required to have an explicit mapping between platform names and the classes implementing those platforms.
 It could be refactored in a different pattern but this way makes it more explicit and linear. Eventually this could be
 turned into a plugin system with a plugin for each platform."""
 
-name_to_publisher_class = {
-    "mastodon": MastodonPublisher,
-    "telegram": TelegramPublisher,
-    "zulip": ZulipPublisher,
-    "twitter": TwitterPublisher,
-    "facebook": FacebookPublisher,
-}
-name_to_formatter_class = {
-    "mastodon": MastodonFormatter,
-    "telegram": TelegramFormatter,
-    "zulip": ZulipFormatter,
-    "twitter": TwitterFormatter,
-    "facebook": FacebookFormatter,
-}
-name_to_notifier_class = {
-    "mastodon": MastodonNotifier,
-    "telegram": TelegramNotifier,
-    "zulip": ZulipNotifier,
-    "twitter": TwitterNotifier,
-    "facebook": FacebookNotifier,
-}
+
+class _PlatformClasses(Mapping):
+    """
+    Maps the name of each platform to one of its classes, given as "module:class". The module of a platform, and
+    its SDK, is imported only when one of its classes is requested, so that each command loads only the platforms
+    it uses.
+    """
+
+    def __init__(self, paths: dict[str, str]):
+        self._paths = paths
+
+    def __getitem__(self, platform):
+        module_name, class_name = self._paths[platform].split(":")
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def __iter__(self):
+        return iter(self._paths)
+
+    def __len__(self):
+        return len(self._paths)
+
+
+name_to_publisher_class = _PlatformClasses(
+    {
+        "mastodon": "mobilizon_reshare.publishers.platforms.mastodon:MastodonPublisher",
+        "telegram": "mobilizon_reshare.publishers.platforms.telegram:TelegramPublisher",
+        "zulip": "mobilizon_reshare.publishers.platforms.zulip:ZulipPublisher",
+        "twitter": "mobilizon_reshare.publishers.platforms.twitter:TwitterPublisher",
+        "facebook": "mobilizon_reshare.publishers.platforms.facebook:FacebookPublisher",
+    }
+)
+name_to_formatter_class = _PlatformClasses(
+    {
+        "mastodon": "mobilizon_reshare.publishers.platforms.mastodon:MastodonFormatter",
+        "telegram": "mobilizon_reshare.publishers.platforms.telegram:TelegramFormatter",
+        "zulip": "mobilizon_reshare.publishers.platforms.zulip:ZulipFormatter",
+        "twitter": "mobilizon_reshare.publishers.platforms.twitter:TwitterFormatter",
+        "facebook": "mobilizon_reshare.publishers.platforms.facebook:FacebookFormatter",
+    }
+)
+name_to_notifier_class = _PlatformClasses(
+    {
+        "mastodon": "mobilizon_reshare.publishers.platforms.mastodon:MastodonNotifier",
+        "telegram": "mobilizon_reshare.publishers.platforms.telegram:TelegramNotifier",
+        "zulip": "mobilizon_reshare.publishers.platforms.zulip:ZulipNotifier",
+        "twitter": "mobilizon_reshare.publishers.platforms.twitter:TwitterNotifier",
+        "facebook": "mobilizon_reshare.publishers.platforms.facebook:FacebookNotifier",
+    }
+)
 
 
 def get_notifier_class(platform):
@@ -1,21 +1,27 @@
-import re
 from typing import Optional
 
 import requests
-from bs4 import BeautifulSoup
 from requests import Response
 
 from mobilizon_reshare.dataclasses import MobilizonEvent
+from mobilizon_reshare.formatting.telegram import (
+    TelegramMessage,
+    get_text_length,
+    html_to_telegram,
+)
 from mobilizon_reshare.publishers.abstract import (
     AbstractEventFormatter,
     AbstractPlatform,
+    UNAUTHORIZED_STATUS_CODES,
 )
 from mobilizon_reshare.publishers.exceptions import (
     InvalidBot,
     InvalidEvent,
     InvalidResponse,
     InvalidMessage,
+    HTTPUnauthorized,
 )
+from mobilizon_reshare.publishers.sessions import get_request_timeout, get_session
 
 
 class TelegramFormatter(AbstractEventFormatter):
@@ -28,11 +34,10 @@ class TelegramFormatter(AbstractEventFormatter):
             self._log_error("No description was found", raise_error=InvalidEvent)
 
     def _validate_message(self, message: str) -> None:
-
-        if (
-            len("".join(BeautifulSoup(message, "html.parser").findAll(text=True)))
-            >= 4096
-        ):
+        text_length = getattr(message, "text_length", None)
+        if text_length is None:
+            text_length = get_text_length(message)
+        if text_length >= 4096:
             self._log_error("Message is too long", raise_error=InvalidMessage)
 
     def _preprocess_message(self, message: str) -> str:
@@ -41,32 +46,7 @@ class TelegramFormatter(AbstractEventFormatter):
         :param message: a HTML5 string
         :return: a HTML string compatible with Telegram
         """
-        html = BeautifulSoup(message, "html.parser")
-        # replacing paragraphs
-        for tag in html.findAll(["p", "br"]):
-            tag.append("\n")
-            tag.replaceWithChildren()
-        # replacing headers
-        for tag in html.findAll(["h1", "h2", "h3"]):
-            if tag.text:  # only if they are not empty
-                tag.name = "b"
-                tag.insert_after("\n")
-                tag.insert_before("\n")
-            else:
-                tag.decompose()
-        # removing lists
-        for tag in html.findAll("ul"):
-            tag.unwrap()
-        # replacing list elements with dots
-        for tag in html.findAll(["li"]):
-            tag.insert(0, "• ")
-            tag.unwrap()
-        # cleaning html trailing whitespace
-        for tag in html.findAll("a"):
-            if "href" in tag:
-                tag["href"] = tag["href"].replace(" ", "").strip().lstrip()
-        s = str(html)
-        return re.sub(r"\n{2,}", "\n\n", s).strip()  # remove multiple newlines
+        return TelegramMessage(*html_to_telegram(message))
 
 
 class TelegramPlatform(AbstractPlatform):
@@ -77,7 +57,10 @@ class TelegramPlatform(AbstractPlatform):
     name = "telegram"
 
     def validate_credentials(self):
-        res = requests.get(f"https://api.telegram.org/bot{self.conf.token}/getMe")
+        res = get_session(self.name).get(
+            f"https://api.telegram.org/bot{self.conf.token}/getMe",
+            timeout=get_request_timeout(),
+        )
         data = self._validate_response(res)
 
         if not self.conf.username == data.get("result", {}).get("username"):
@@ -91,9 +74,10 @@ class TelegramPlatform(AbstractPlatform):
         if self.conf.message_thread_id:
             json_message["message_thread_id"] = self.conf.message_thread_id
 
-        return requests.post(
+        return get_session(self.name).post(
             url=f"https://api.telegram.org/bot{self.conf.token}/sendMessage",
             json=json_message,
+            timeout=get_request_timeout(),
         )
 
     def _validate_response(self, res):
@@ -102,7 +86,9 @@ class TelegramPlatform(AbstractPlatform):
         except requests.exceptions.HTTPError as e:
             self._log_error(
                 f"Server returned invalid data: {str(e)}\n{res.text}",
-                raise_error=InvalidResponse,
+                raise_error=HTTPUnauthorized
+                if res.status_code in UNAUTHORIZED_STATUS_CODES
+                else InvalidResponse,
             )
 
         try:
@@ -1,6 +1,6 @@
 from typing import Optional
 
-from tweepy import OAuthHandler, API, TweepyException
+from tweepy import OAuthHandler, API, Forbidden, TweepyException, Unauthorized
 from tweepy.models import Status
 
 from mobilizon_reshare.dataclasses import MobilizonEvent
@@ -13,6 +13,7 @@ from mobilizon_reshare.publishers.exceptions import (
     PublisherError,
     InvalidMessage,
 )
+from mobilizon_reshare.publishers.sessions import get_client, get_request_timeout
 
 
 class TwitterFormatter(AbstractEventFormatter):
@@ -42,13 +43,22 @@ class TwitterPlatform(AbstractPlatform):
         api_key_secret = self.conf.api_key_secret
         access_token = self.conf.access_token
         access_secret = self.conf.access_secret
-        auth = OAuthHandler(api_key, api_key_secret)
-        auth.set_access_token(access_token, access_secret)
-        return API(auth)
+
+        def _build_api():
+            auth = OAuthHandler(api_key, api_key_secret)
+            auth.set_access_token(access_token, access_secret)
+            return API(auth, timeout=get_request_timeout())
+
+        return get_client(
+            (self.name, api_key, api_key_secret, access_token, access_secret),
+            _build_api,
+        )
 
     def _send(self, message: str, event: Optional[MobilizonEvent] = None) -> Status:
         try:
             return self._get_api().update_status(message)
+        except (Unauthorized, Forbidden) as e:
+            self._log_error(e.args[0], raise_error=InvalidCredentials)
         except TweepyException as e:
             self._log_error(e.args[0], raise_error=PublisherError)
 
@@ -1,3 +1,4 @@
+import dataclasses
 from typing import Optional
 from urllib.parse import urljoin
 
@@ -10,6 +11,7 @@ from mobilizon_reshare.formatting.description import html_to_markdown
 from mobilizon_reshare.publishers.abstract import (
     AbstractPlatform,
     AbstractEventFormatter,
+    UNAUTHORIZED_STATUS_CODES,
 )
 from mobilizon_reshare.publishers.exceptions import (
     InvalidBot,
@@ -18,7 +20,9 @@ from mobilizon_reshare.publishers.exceptions import (
     ZulipError,
     InvalidMessage,
     HTTPResponseError,
+    HTTPUnauthorized,
 )
+from mobilizon_reshare.publishers.sessions import get_request_timeout, get_session
 
 
 class ZulipFormatter(AbstractEventFormatter):
@@ -34,9 +38,11 @@ class ZulipFormatter(AbstractEventFormatter):
             self._log_error("Message is too long", raise_error=InvalidMessage)
 
     def _preprocess_event(self, event: MobilizonEvent):
-        event.description = html_to_markdown(event.description)
-        event.name = html_to_markdown(event.name)
-        return event
+        return dataclasses.replace(
+            event,
+            description=html_to_markdown(event.description),
+            name=html_to_markdown(event.name),
+        )
 
 
 class ZulipPlatform(AbstractPlatform):
@@ -52,7 +58,7 @@ class ZulipPlatform(AbstractPlatform):
         """
         Send stream messages
         """
-        return requests.post(
+        return get_session(self.name).post(
             url=urljoin(self.conf.instance, self.api_uri) + "messages",
             auth=HTTPBasicAuth(self.conf.bot_email, self.conf.bot_token),
             data={
@@ -61,14 +67,16 @@ class ZulipPlatform(AbstractPlatform):
                 "subject": self.conf.subject,
                 "content": message,
             },
+            timeout=get_request_timeout(),
         )
 
     def validate_credentials(self):
         conf = self.conf
 
-        res = requests.get(
+        res = get_session(self.name).get(
             auth=HTTPBasicAuth(self.conf.bot_email, self.conf.bot_token),
             url=urljoin(self.conf.instance, self.api_uri) + "users/me",
+            timeout=get_request_timeout(),
         )
         data = self._validate_response(res)
 
@@ -91,7 +99,10 @@ class ZulipPlatform(AbstractPlatform):
         except requests.exceptions.HTTPError as e:
             self._log_debug(str(response.text))
             self._log_error(
-                str(e), raise_error=HTTPResponseError,
+                str(e),
+                raise_error=HTTPUnauthorized
+                if response.status_code in UNAUTHORIZED_STATUS_CODES
+                else HTTPResponseError,
             )
 
         # See https://zulip.com/api/rest-error-handling
@@ -0,0 +1,63 @@
+import logging
+import threading
+from typing import Any, Callable, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from mobilizon_reshare.config.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# HTTP sessions and API clients of the platforms, shared by publishers and notifiers for the whole life of the process
+# so that connections to the same host are kept alive and reused. Publications run in parallel threads, hence the lock.
+_sessions: dict[str, requests.Session] = {}
+_clients: dict[tuple, Any] = {}
+_lock = threading.Lock()
+
+
+def get_request_timeout() -> float:
+    return get_settings()["publishing"]["request_timeout"]
+
+
+def get_session(platform_name: str) -> requests.Session:
+    """
+    Returns the pooled session used to talk with the given platform, creating it on first use.
+    """
+    with _lock:
+        session = _sessions.get(platform_name)
+        if session is None:
+            pool_size = get_settings()["publishing"]["pool_size"]
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[platform_name] = session
+            logger.debug(f"Created HTTP session for {platform_name}")
+        return session
+
+
+def get_client(key: tuple, factory: Callable[[], T]) -> T:
+    """
+    Returns the API client identified by the key, building it with the factory on first use. The key should include
+    the credentials the client is built with, so that a change in the settings produces a new client.
+    """
+    with _lock:
+        client = _clients.get(key)
+    if client is None:
+        # the factory might need a session, so it's called without holding the lock. If another thread built the
+        # same client in the meantime, the first one stored is kept.
+        client = factory()
+        with _lock:
+            client = _clients.setdefault(key, client)
+    return client
+
+
+def close_sessions() -> None:
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+        _clients.clear()
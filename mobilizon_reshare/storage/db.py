@@ -4,7 +4,9 @@ from pathlib import Path
 import importlib
 import urllib3.util
 from aerich import Command
+from aerich.models import Aerich
 from tortoise import Tortoise
+from tortoise.exceptions import OperationalError
 
 from mobilizon_reshare.config.config import (
     get_settings,
@@ -27,10 +29,12 @@ def get_tortoise_orm():
         "apps": {
             "models": {
                 "models": [
+                    "mobilizon_reshare.models.credential_validation",
                     "mobilizon_reshare.models.event",
                     "mobilizon_reshare.models.notification",
                     "mobilizon_reshare.models.publication",
                     "mobilizon_reshare.models.publisher",
+                    "mobilizon_reshare.models.source",
                     "aerich.models",
                 ],
                 "default_connection": "default",
@@ -63,7 +67,24 @@ class MoReDB:
         if migrations:
             logging.info("Updated database to latest version")
 
-    async def setup(self):
+    def get_migration_versions(self) -> set[str]:
+        return {
+            path.name for path in (self.get_migration_location() / "models").glob("*.sql")
+        }
+
+    async def get_applied_migration_versions(self) -> set[str]:
+        try:
+            return set(
+                await Aerich.filter(app="models").values_list("version", flat=True)
+            )
+        except OperationalError:
+            # the database has never been migrated
+            return set()
+
+    async def is_up_to_date(self) -> bool:
+        return self.get_migration_versions() <= await self.get_applied_migration_versions()
+
+    async def migrate(self):
         tortoise_config = get_tortoise_orm()
         Tortoise.init_models(
             tortoise_config["apps"]["models"]["models"], "models", _init_relations=True
@@ -73,6 +94,20 @@ class MoReDB:
         await Tortoise.generate_schemas()
         await update_publishers(publisher_names)
 
+    async def setup(self, read_only: bool = False, auto_migrate: bool = True):
+        """
+        Connects to the database, migrating it only if some migration hasn't been applied yet, unless
+        ``auto_migrate`` is false, e.g. because the caller migrates it explicitly. Read-only commands don't register
+        the active publishers.
+        """
+        await Tortoise.init(config=get_tortoise_orm())
+        if not auto_migrate:
+            return
+        if not await self.is_up_to_date():
+            await self.migrate()
+        elif not read_only:
+            await update_publishers(publisher_names)
+
 
 class MoReSQLiteDB(MoReDB):
     def __init__(self):
@@ -91,11 +126,17 @@ async def tear_down():
     return await Tortoise.close_connections()
 
 
-async def init():
-    # init storage
+def _get_db() -> MoReDB:
     url = get_db_url()
     if url.scheme == "sqlite":
-        db = MoReSQLiteDB()
-    else:
-        db = MoReDB()
-    await db.setup()
+        return MoReSQLiteDB()
+    return MoReDB()
+
+
+async def init(read_only: bool = False, auto_migrate: bool = True):
+    # init storage
+    await _get_db().setup(read_only=read_only, auto_migrate=auto_migrate)
+
+
+async def migrate():
+    await _get_db().migrate()
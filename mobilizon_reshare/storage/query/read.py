@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Iterable, Optional
 from uuid import UUID
 
@@ -5,9 +6,11 @@ from arrow import Arrow
 from tortoise.queryset import QuerySet
 from tortoise.transactions import atomic
 
-from mobilizon_reshare.models.event import Event
+from mobilizon_reshare.models.credential_validation import CredentialValidation
+from mobilizon_reshare.models.event import Event, EventPublicationStatus
 from mobilizon_reshare.models.publication import Publication, PublicationStatus
 from mobilizon_reshare.models.publisher import Publisher
+from mobilizon_reshare.models.source import Source
 from mobilizon_reshare.storage.query.exceptions import EventNotFound
 
 
@@ -27,6 +30,21 @@ async def get_all_events(
     )
 
 
+async def get_events_with_publication_status(
+    statuses: Iterable[EventPublicationStatus],
+    from_date: Optional[Arrow] = None,
+    to_date: Optional[Arrow] = None,
+) -> list[Event]:
+    """
+    Retrieves the events whose publication status, as maintained by ``save_publication_report``, is among the given
+    ones.
+    """
+    query = Event.filter(publication_status__in=list(statuses))
+    return await prefetch_event_relations(
+        _add_date_window(query, "begin_datetime", from_date, to_date)
+    )
+
+
 async def get_all_publishers() -> list[Publisher]:
     return await Publisher.all()
 
@@ -92,6 +110,24 @@ async def get_event(event_mobilizon_id: UUID) -> Event:
     return events[0]
 
 
+async def get_last_publication_time() -> Optional[datetime]:
+    return await (
+        Event.filter(last_published_at__isnull=False)
+        .order_by("-last_published_at")
+        .first()
+        .values_list("last_published_at", flat=True)
+    )
+
+
+async def get_next_event_without_publications() -> Optional[Event]:
+    return await (
+        Event.filter(publications__id=None)
+        .order_by("begin_datetime")
+        .first()
+        .prefetch_related("publications__publisher", "publications__notifications")
+    )
+
+
 async def get_events_without_publications(
     from_date: Optional[Arrow] = None, to_date: Optional[Arrow] = None,
 ) -> list[Event]:
@@ -99,3 +135,14 @@ async def get_events_without_publications(
     return await prefetch_event_relations(
         _add_date_window(query, "begin_datetime", from_date, to_date)
     )
+
+
+async def get_source(name: str) -> Optional[Source]:
+    return await Source.get_or_none(name=name)
+
+
+async def get_credential_validations() -> dict[str, tuple[str, datetime]]:
+    return {
+        validation.platform: (validation.credentials_hash, validation.validated_at)
+        for validation in await CredentialValidation.all()
+    }
@@ -1,17 +1,35 @@
 import logging
-from typing import Iterable
+from datetime import datetime
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+)
+from uuid import UUID
 
 import arrow
+from arrow import Arrow
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.models import Model
 from tortoise.transactions import atomic
 
 from mobilizon_reshare.dataclasses import MobilizonEvent
 from mobilizon_reshare.dataclasses.event import (
     get_mobilizon_events_without_publications,
 )
+from mobilizon_reshare.dataclasses.event_publication_status import (
+    _compute_event_status,
+)
+from mobilizon_reshare.models.credential_validation import CredentialValidation
 from mobilizon_reshare.models.event import Event
 from mobilizon_reshare.models.notification import Notification
 from mobilizon_reshare.models.publication import Publication
 from mobilizon_reshare.models.publisher import Publisher
+from mobilizon_reshare.models.source import Source
 from mobilizon_reshare.publishers.coordinators.event_publishing import (
     EventPublicationReport,
 )
@@ -21,7 +39,6 @@ from mobilizon_reshare.publishers.coordinators.event_publishing.notify import (
 from mobilizon_reshare.publishers.coordinators.event_publishing.publish import (
     PublisherCoordinatorReport,
 )
-from mobilizon_reshare.storage.query.read import get_event
 
 
 @atomic()
@@ -61,11 +78,30 @@ async def save_publication_report(
     """
     Store a publication process outcome
     """
+    event_ids = set()
     for publication_report in coordinator_report.reports:
         event = await Event.filter(
             mobilizon_id=publication_report.publication.event.mobilizon_id
         ).first()
         await upsert_publication(publication_report, event)
+        event_ids.add(event.id)
+    await update_events_publication_status(event_ids)
+
+
+@atomic()
+async def update_events_publication_status(event_ids: Iterable[UUID]) -> None:
+    """
+    Brings the publication status and the last publication time stored on the events up to date with their
+    publications
+    """
+    for event_id in event_ids:
+        publications = await Publication.filter(event_id=event_id)
+        await Event.filter(id=event_id).update(
+            publication_status=_compute_event_status(publications),
+            last_published_at=max(
+                (publication.timestamp for publication in publications), default=None
+            ),
+        )
 
 
 @atomic()
@@ -86,30 +122,155 @@ async def save_notification_report(
         )
 
 
-@atomic()
-async def create_unpublished_events(
-    events_from_mobilizon: Iterable[MobilizonEvent],
-) -> list[MobilizonEvent]:
+# number of incoming events reconciled with the database at once
+EVENTS_BATCH_SIZE = 100
+
+# fields of an event that are overwritten when Mobilizon reports a change
+EVENT_UPDATE_FIELDS = [
+    "name",
+    "description",
+    "mobilizon_link",
+    "thumbnail_link",
+    "location",
+    "begin_datetime",
+    "end_datetime",
+    "last_update_time",
+    "source",
+]
+
+
+async def _batches(
+    events: Union[Iterable, AsyncIterable], size: int
+) -> AsyncIterator[list]:
+    batch = []
+    if isinstance(events, AsyncIterable):
+        async for event in events:
+            batch.append(event)
+            if len(batch) == size:
+                yield batch
+                batch = []
+    else:
+        for event in events:
+            batch.append(event)
+            if len(batch) == size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+# ``_bulk_update_statement`` builds its statement from the internals of the query executors of tortoise-orm, which
+# are not part of its public API: it's written against tortoise-orm 0.19, pinned in pyproject.toml, and it has to be
+# checked again, with tests/storage/test_update.py, on every upgrade.
+def _bulk_update_statement(
+    db: BaseDBAsyncClient, model_class: Type[Model], fields: list[str]
+) -> tuple[str, Callable[[Model], list]]:
+    """
+    Returns the parametrized statement that updates the given fields of a model of the given class, in the dialect
+    of the given database, and the function that returns the values of its parameters for a model.
     """
-    Computes the difference between remote and local events and store it.
+    meta = model_class._meta
+    executor = db.executor_class(model=model_class, db=db)
+    table = meta.basetable
+    query = db.query_class.update(table)
+    for i, field_name in enumerate(fields):
+        query = query.set(meta.fields_db_projection[field_name], executor.parameter(i))
+    query = query.where(
+        table[meta.db_pk_column] == executor.parameter(len(fields))
+    )
 
-    Returns the unpublished events merged state.
+    def _get_values(model: Model) -> list:
+        return [
+            executor.column_map[field_name](getattr(model, field_name), model)
+            for field_name in fields
+        ] + [executor.column_map[meta.pk_attr](model.pk, model)]
+
+    return query.get_sql(), _get_values
+
+
+async def _bulk_update(models: list[Model], fields: list[str]) -> None:
+    """
+    Updates the given fields of the models with a single parametrized statement. Unlike ``Model.bulk_update``,
+    values are converted as in a regular save, so that datetimes are stored consistently.
     """
-    # There are three cases:
-    for event in events_from_mobilizon:
-        if not await Event.exists(mobilizon_id=event.mobilizon_id):
+    if not models:
+        return
+    db = models[0]._meta.db
+    statement, get_values = _bulk_update_statement(db, type(models[0]), fields)
+    await db.execute_many(statement, [get_values(model) for model in models])
+
+
+@atomic()
+async def _reconcile_events(events: list[MobilizonEvent]) -> None:
+    # the same event could be pulled more than once, for example from different sources
+    latest_events = {}
+    for event in events:
+        known = latest_events.get(event.mobilizon_id)
+        if known is None or event.last_update_time > known.last_update_time:
+            latest_events[event.mobilizon_id] = event
+
+    known_events = {
+        mobilizon_id: (db_id, arrow.get(last_update_time))
+        for mobilizon_id, db_id, last_update_time in await Event.filter(
+            mobilizon_id__in=list(latest_events.keys())
+        ).values_list("mobilizon_id", "id", "last_update_time")
+    }
+
+    new_events, changed_events = [], []
+    for event in latest_events.values():
+        if event.mobilizon_id not in known_events:
             # Either an event is unknown
-            await event.to_model().save()
+            new_events.append(event.to_model())
         else:
             # Or it's known and changed
-            event_model = await get_event(event.mobilizon_id)
-            if event.last_update_time > event_model.last_update_time:
-                await event.to_model(db_id=event_model.id).save(force_update=True)
+            db_id, last_update_time = known_events[event.mobilizon_id]
+            if event.last_update_time > last_update_time:
+                changed_events.append(event.to_model(db_id=db_id))
             # Or it's known and unchanged, in which case we do nothing.
 
+    if new_events:
+        await Event.bulk_create(new_events)
+    await _bulk_update(changed_events, EVENT_UPDATE_FIELDS)
+
+
+async def create_unpublished_events(
+    events_from_mobilizon: Union[Iterable[MobilizonEvent], AsyncIterable[MobilizonEvent]],
+) -> list[MobilizonEvent]:
+    """
+    Computes the difference between remote and local events and store it. Events can be provided either
+    as a collection or as an asynchronous stream, in which case they are stored as they arrive.
+
+    Events are reconciled in batches, with a constant number of queries for each batch. Each batch is committed in
+    its own transaction, so that no transaction is kept open while waiting for the stream, e.g. for Mobilizon to
+    answer, and the other queries of the process aren't blocked meanwhile.
+
+    Returns the unpublished events merged state.
+    """
+    async for events in _batches(events_from_mobilizon, EVENTS_BATCH_SIZE):
+        await _reconcile_events(events)
+
     return await get_mobilizon_events_without_publications()
 
 
+@atomic()
+async def update_source(
+    name: str, last_update_time: Optional[Arrow], full_pull: bool
+) -> None:
+    """
+    Stores the outcome of a pull: the watermark is moved to the most recent update time seen so far and,
+    for full pulls, the time of the last full reconciliation is recorded.
+    """
+    source, _ = await Source.get_or_create(name=name)
+    if last_update_time is not None and (
+        source.last_update_time is None
+        or last_update_time > arrow.get(source.last_update_time)
+    ):
+        source.last_update_time = last_update_time.datetime
+    if full_pull:
+        source.last_full_pull_time = arrow.now().datetime
+    await source.save()
+
+
 @atomic()
 async def update_publishers(names: Iterable[str],) -> None:
     names = set(names)
@@ -117,3 +278,15 @@ async def update_publishers(names: Iterable[str],) -> None:
     for name in names.difference(known_publisher_names):
         logging.info(f"Creating {name} publisher")
         await Publisher.create(name=name, account_ref=None)
+
+
+@atomic()
+async def save_credential_validations(
+    validations: dict[str, tuple[str, datetime]]
+) -> None:
+    await CredentialValidation.exclude(platform__in=list(validations)).delete()
+    for platform, (credentials_hash, validated_at) in validations.items():
+        await CredentialValidation.update_or_create(
+            platform=platform,
+            defaults={"credentials_hash": credentials_hash, "validated_at": validated_at},
+        )
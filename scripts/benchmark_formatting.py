@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmark of the conversion of event descriptions, comparing the available HTML parsers.
+
+It's not part of the test suite: run it from the root of the repository, with a valid configuration as for any other
+command and after installing the lxml extra to compare both parsers, e.g.:
+
+    python scripts/benchmark_formatting.py --repeat 200
+"""
+import argparse
+import timeit
+
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.formatting.description import (
+    html_to_markdown,
+    html_to_plaintext,
+)
+
+# a block of HTML as produced by the editor of Mobilizon
+BLOCK = (
+    "<h2>About the event</h2>"
+    "<p>Join us for an <strong>evening</strong> of talks and <em>discussion</em> about "
+    "<a href='https://example.org/topic'>workers' rights</a> in the tech industry.</p>"
+    "<ul><li>Welcome and introductions</li><li>Talks from the speakers</li><li>Q&amp;A</li></ul>"
+    "<blockquote><p>Everyone is welcome, no registration needed.</p></blockquote>"
+    "<p></p>"
+)
+
+# number of blocks of a short, average, long and very long description
+SIZES = (1, 5, 25, 125)
+
+CONVERSIONS = {
+    "plaintext": html_to_plaintext,
+    "markdown": html_to_markdown,
+}
+
+
+def get_available_parsers() -> list[str]:
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+
+        parsers.append("lxml")
+    except ImportError:
+        pass
+    return parsers
+
+
+def main(repeat: int):
+    settings = get_settings()
+    old_parser = settings["html_parser"]
+    print(f"{'conversion':<12}{'parser':<14}{'size':>10}{'time (ms)':>12}")
+    try:
+        for conversion_name, conversion in CONVERSIONS.items():
+            for size in SIZES:
+                description = BLOCK * size
+                for parser in get_available_parsers():
+                    settings.update({"html_parser": parser})
+                    elapsed = timeit.timeit(
+                        lambda: conversion(description), number=repeat
+                    )
+                    print(
+                        f"{conversion_name:<12}{parser:<14}{len(description):>10}"
+                        f"{elapsed / repeat * 1000:>12.3f}"
+                    )
+    finally:
+        settings.update({"html_parser": old_parser})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeat", type=int, default=100, help="conversions timed for each case"
+    )
+    main(parser.parse_args().repeat)
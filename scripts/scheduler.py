@@ -1,51 +1,30 @@
 #!/usr/bin/env python3
 
 """
-This module allows to customize the scheduling logic for mobilizon-reshare.
+This module starts the daemon of mobilizon-reshare, that schedules its commands in a single process.
 
-It's not intended to be part of the supported code base but just an example on how to schedule the commands of
-mobilizon-reshare.
+It's kept as the entry point of the Docker image and schedules the commands as previous versions of this script did:
+MOBILIZON_RESHARE_INTERVAL schedules the start command, i.e. a pull followed by a publication, by default every 15
+minutes from 10 to 18, Monday to Thursday, while MOBILIZON_RESHARE_RECAP_INTERVAL schedules the recap, by default on
+Sunday at 11:05. The other jobs are disabled. These schedules take precedence over the daemon section of the settings,
+that is used by `mobilizon-reshare daemon`.
 """
-import asyncio
 import os
-from functools import partial
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from mobilizon_reshare.cli.cli import mobilizon_reshare
 
-from mobilizon_reshare.cli import _safe_execution
-from mobilizon_reshare.cli.commands.recap.main import recap as recap_main
-from mobilizon_reshare.cli.commands.start.main import start as start_main
-from mobilizon_reshare.config.command import CommandConfig
-
-sched = AsyncIOScheduler()
-config = CommandConfig(dry_run=False)
-
-
-async def start():
-    await start_main(config)
-
-
-async def recap():
-    await recap_main(config)
-
-
-# Runs "start" from Monday to Friday every 15 mins
-sched.add_job(
-    partial(_safe_execution, start),
-    CronTrigger.from_crontab(
-        os.environ.get("MOBILIZON_RESHARE_INTERVAL", "*/15 10-18 * * 1-4")
+# Dynaconf reads the daemon settings from these variables
+DAEMON_SCHEDULES = {
+    "MOBILIZON_RESHARE_DAEMON__START": os.environ.get(
+        "MOBILIZON_RESHARE_INTERVAL", "*/15 10-18 * * 1-4"
     ),
-)
-# Runs "recap" once a week
-sched.add_job(
-    partial(_safe_execution, recap),
-    CronTrigger.from_crontab(
-        os.environ.get("MOBILIZON_RESHARE_RECAP_INTERVAL", "5 11 * * 0")
+    "MOBILIZON_RESHARE_DAEMON__RECAP": os.environ.get(
+        "MOBILIZON_RESHARE_RECAP_INTERVAL", "5 11 * * 0"
     ),
-)
-sched.start()
-try:
-    asyncio.get_event_loop().run_forever()
-except (KeyboardInterrupt, SystemExit):
-    pass
+    "MOBILIZON_RESHARE_DAEMON__PULL": "",
+    "MOBILIZON_RESHARE_DAEMON__PUBLISH": "",
+    "MOBILIZON_RESHARE_DAEMON__RETRY": "",
+}
+
+os.environ.update(DAEMON_SCHEDULES)
+mobilizon_reshare(["daemon"])
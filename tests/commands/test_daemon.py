@@ -0,0 +1,82 @@
+import asyncio
+from logging import ERROR
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from mobilizon_reshare.config.command import CommandConfig
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.main.daemon import Daemon
+
+
+@pytest.fixture
+def daemon_schedules(request):
+    old_value = get_settings()["daemon"].to_dict()
+    get_settings().update({"daemon": request.param})
+    yield
+    get_settings().update({"daemon": old_value})
+
+
+@pytest.fixture
+def daemon():
+    # the local timezone set by the tests isn't a zoneinfo one
+    return Daemon(CommandConfig(dry_run=False), AsyncIOScheduler(timezone="UTC"))
+
+
+@pytest.mark.parametrize(
+    "daemon_schedules",
+    [
+        {
+            "pull": "*/5 * * * *",
+            "publish": "0 * * * *",
+            "recap": "",
+            "retry": "",
+            "start": "",
+        }
+    ],
+    indirect=True,
+)
+def test_schedule(daemon_schedules, daemon):
+    daemon.schedule()
+
+    jobs = {job.id: job for job in daemon.scheduler.get_jobs()}
+    assert set(jobs) == {"pull", "publish"}
+    for job in jobs.values():
+        # runs of the same job never overlap and missed runs are collapsed in one
+        assert job.max_instances == 1
+        assert job.coalesce
+
+
+@pytest.mark.asyncio
+async def test_failed_job(daemon, caplog):
+    async def failing_job():
+        raise ValueError("some error")
+
+    with caplog.at_level(ERROR):
+        await daemon.run_job("pull", failing_job)
+    assert "Job pull failed" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "daemon_schedules",
+    [{"pull": "", "publish": "", "recap": "", "retry": "", "start": ""}],
+    indirect=True,
+)
+@pytest.mark.asyncio
+async def test_stop_waits_for_running_jobs(daemon_schedules, daemon):
+    finished_jobs = []
+
+    async def slow_job():
+        await asyncio.sleep(0.1)
+        finished_jobs.append("pull")
+
+    run = asyncio.create_task(daemon.run())
+    await asyncio.sleep(0)
+    job = asyncio.create_task(daemon.run_job("pull", slow_job))
+    await asyncio.sleep(0)
+    daemon.stop()
+
+    assert await run == 0
+    assert job.done()
+    assert finished_jobs == ["pull"]
+    assert not daemon.scheduler.running
@@ -1,18 +1,27 @@
+import json
 from logging import DEBUG, INFO
 
+import arrow
+import httpx
 import pytest
 
+import mobilizon_reshare.mobilizon.client
+from mobilizon_reshare.config.config import get_settings
+
 from mobilizon_reshare.dataclasses.event import (
     get_all_mobilizon_events,
     get_mobilizon_events_without_publications,
 )
 from mobilizon_reshare.main.pull import pull
 from mobilizon_reshare.main.start import start
+from mobilizon_reshare.mobilizon.events import get_sources, MobilizonRequestFailed
+from mobilizon_reshare.models.event import Event
+from mobilizon_reshare.models.source import Source
 from tests.commands.conftest import (
     second_event_element,
     first_event_element,
 )
-from tests.conftest import event_0, event_1
+from tests.conftest import event_0, event_1, event_3_updated
 
 empty_specification = {"event": 0, "publications": [], "publisher": []}
 one_unpublished_event_specification = {
@@ -212,3 +221,189 @@ async def test_multiple_pull(
             await get_mobilizon_events_without_publications()
             == await get_all_mobilizon_events()
         )
+
+
+@pytest.fixture()
+def set_incremental():
+    settings = get_settings()
+    yield settings.update({"source.mobilizon.incremental": True})
+    settings.update({"source.mobilizon.incremental": False})
+
+
+def updated_event_element():
+    return {
+        "beginsOn": event_3_updated.begin_datetime.isoformat(),
+        "description": "desc_3",
+        "endsOn": event_3_updated.end_datetime.isoformat(),
+        "onlineAddress": None,
+        "options": {"showEndTime": True, "showStartTime": True},
+        "physicalAddress": {"description": "", "locality": "loc_6", "region": ""},
+        "picture": {"url": "https://example.org/thumblink_3"},
+        "title": "event_3",
+        "url": "https://example.org/moblink_3",
+        "uuid": str(event_3_updated.mobilizon_id),
+        "updatedAt": event_3_updated.last_update_time.isoformat(),
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "multiple_elements, specification",
+    [
+        [
+            [
+                [second_event_element(), first_event_element()],
+                [second_event_element(), first_event_element()],
+                [updated_event_element(), second_event_element()],
+            ],
+            empty_specification,
+        ],
+    ],
+)
+async def test_incremental_pull(
+    generate_models,
+    set_incremental,
+    mock_multiple_success_answer,
+    multiple_answers,
+    caplog,
+    multiple_elements,
+    specification,
+):
+    await generate_models(specification)
+
+    # the first pull is always a full pull and sets the watermark
+    await pull()
+    source = await Source.get(name=get_sources()[0].name)
+    assert source.last_full_pull_time is not None
+    assert arrow.get(source.last_update_time) == event_1.last_update_time
+
+    # nothing changed since the last pull
+    caplog.clear()
+    with caplog.at_level(INFO):
+        await pull()
+        assert "Pulled 0 events from Mobilizon." in caplog.text
+
+    # only the updated event is processed and the watermark moves forward
+    caplog.clear()
+    with caplog.at_level(INFO):
+        await pull()
+        assert "Pulled 1 events from Mobilizon." in caplog.text
+    source = await Source.get(name=get_sources()[0].name)
+    assert arrow.get(source.last_update_time) == event_3_updated.last_update_time
+    assert len(await get_all_mobilizon_events()) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "multiple_elements, specification",
+    [
+        [
+            [
+                [second_event_element(), first_event_element()],
+                [second_event_element(), first_event_element()],
+            ],
+            empty_specification,
+        ],
+    ],
+)
+async def test_incremental_pull_full_reconciliation(
+    generate_models,
+    set_incremental,
+    mock_multiple_success_answer,
+    multiple_answers,
+    caplog,
+    multiple_elements,
+    specification,
+):
+    await generate_models(specification)
+    await pull()
+
+    # the last full pull is too old, so every event is pulled again
+    await Source.filter(name=get_sources()[0].name).update(
+        last_full_pull_time=arrow.now().shift(days=-2).datetime
+    )
+    caplog.clear()
+    with caplog.at_level(INFO):
+        await pull()
+        assert "Pulled 2 events from Mobilizon." in caplog.text
+    source = await Source.get(name=get_sources()[0].name)
+    assert arrow.get(source.last_full_pull_time) > arrow.now().shift(minutes=-1)
+
+
+@pytest.fixture()
+def mock_multiple_sources(monkeypatch, sources_elements):
+    """
+    Configures a source for each group in ``sources_elements``, each on its own instance, answering with the
+    given elements, failing when they are None or answering with a malformed body when they are "malformed".
+    """
+    settings = get_settings()
+    settings.update(
+        {
+            "source.mobilizon.sources": [
+                {"url": f"https://{group}.example.org/api", "group": group}
+                for group in sources_elements
+            ]
+        }
+    )
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        group = request.url.host.split(".")[0]
+        assert f'preferredUsername: "{group}"' in json.loads(request.content)["query"]
+        elements = sources_elements[group]
+        if elements is None:
+            return httpx.Response(500)
+        if elements == "malformed":
+            return httpx.Response(200, text="<html>Maintenance</html>")
+        return httpx.Response(
+            200, json={"data": {"group": {"organizedEvents": {"elements": elements}}}}
+        )
+
+    monkeypatch.setattr(
+        mobilizon_reshare.mobilizon.client,
+        "_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+    )
+    yield
+    settings.update({"source.mobilizon.sources": []})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sources_elements, expected_sources",
+    [
+        [
+            {"first": [first_event_element()], "second": [second_event_element()]},
+            {
+                event_0.mobilizon_id: "first@first.example.org",
+                event_1.mobilizon_id: "second@second.example.org",
+            },
+        ],
+        [
+            {"first": [first_event_element()], "second": None},
+            {event_0.mobilizon_id: "first@first.example.org"},
+        ],
+        [
+            {"first": [first_event_element()], "second": "malformed"},
+            {event_0.mobilizon_id: "first@first.example.org"},
+        ],
+    ],
+)
+async def test_pull_multiple_sources(
+    mock_multiple_sources, caplog, sources_elements, expected_sources
+):
+    with caplog.at_level(INFO):
+        await pull()
+        assert f"Pulled {len(expected_sources)} events from Mobilizon." in caplog.text
+
+    assert {e.mobilizon_id: e.source for e in await Event.all()} == expected_sources
+    # the watermark is stored only for the sources that have been pulled successfully
+    assert {s.name for s in await Source.all()} == set(expected_sources.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "sources_elements", [{"first": None, "second": None}],
+)
+async def test_pull_multiple_sources_failure(mock_multiple_sources, sources_elements):
+    with pytest.raises(MobilizonRequestFailed):
+        await pull()
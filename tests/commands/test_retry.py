@@ -1,9 +1,16 @@
 import uuid
 from logging import INFO, ERROR
 
+import arrow
 import pytest
 
-from mobilizon_reshare.main.retry import retry_event, retry_publication
+from mobilizon_reshare.config.command import CommandConfig
+from mobilizon_reshare.main.retry import (
+    retry_event,
+    retry_failed_events,
+    retry_publication,
+)
+from mobilizon_reshare.models.event import Event
 from mobilizon_reshare.models.publication import PublicationStatus, Publication
 
 
@@ -158,3 +165,63 @@ async def test_publication_retry_failure(
         )
     p = await Publication.filter(id=failed_publication.id).first()
     assert p.status == PublicationStatus.FAILED, p.id
+
+
+@pytest.mark.parametrize(
+    "publisher_class", [pytest.lazy_fixture("mock_publisher_class")]
+)
+@pytest.mark.asyncio
+async def test_retry_failed_events(
+    event_with_failed_publication,
+    mock_publisher_config,
+    message_collector,
+    failed_publication,
+):
+    tomorrow = arrow.now().shift(days=1)
+    await Event.filter(id=event_with_failed_publication.id).update(
+        begin_datetime=tomorrow.datetime, end_datetime=tomorrow.shift(hours=1).datetime
+    )
+
+    reports = await retry_failed_events(CommandConfig(dry_run=False))
+    assert len(reports) == 1
+    p = await Publication.filter(id=failed_publication.id).first()
+    assert p.status == PublicationStatus.COMPLETED
+    assert len(message_collector) == 1
+
+
+@pytest.mark.parametrize(
+    "publisher_class", [pytest.lazy_fixture("mock_publisher_class")]
+)
+@pytest.mark.asyncio
+async def test_retry_failed_events_past_event(
+    event_with_failed_publication,
+    mock_publisher_config,
+    message_collector,
+    failed_publication,
+):
+    assert await retry_failed_events(CommandConfig(dry_run=False)) == []
+    p = await Publication.filter(id=failed_publication.id).first()
+    assert p.status == PublicationStatus.FAILED
+    assert len(message_collector) == 0
+
+
+@pytest.mark.parametrize(
+    "publisher_class", [pytest.lazy_fixture("mock_publisher_class")]
+)
+@pytest.mark.asyncio
+async def test_retry_failed_events_dry_run(
+    event_with_failed_publication,
+    mock_publisher_config,
+    message_collector,
+    failed_publication,
+):
+    tomorrow = arrow.now().shift(days=1)
+    await Event.filter(id=event_with_failed_publication.id).update(
+        begin_datetime=tomorrow.datetime, end_datetime=tomorrow.shift(hours=1).datetime
+    )
+
+    reports = await retry_failed_events(CommandConfig(dry_run=True))
+    assert len(reports) == 1
+    p = await Publication.filter(id=failed_publication.id).first()
+    assert p.status == PublicationStatus.FAILED
+    assert len(message_collector) == 0
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+import pytest
+
+PLATFORM_SDKS = ["bs4", "facebook", "markdownify", "requests", "tweepy"]
+# import time of the CLI, well above what's expected, to catch modules imported again at startup without
+# failing on slow machines
+STARTUP_BUDGET_US = 800_000
+
+
+def get_import_times(statement: str) -> dict[str, int]:
+    """
+    Returns the cumulative import time, in microseconds, of each module imported by the statement.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def test_cli_startup():
+    import_times = get_import_times("import mobilizon_reshare.cli.cli")
+
+    assert import_times["mobilizon_reshare.cli.cli"] < STARTUP_BUDGET_US
+    for module in PLATFORM_SDKS + [
+        "aerich",
+        "apscheduler",
+        "httpx",
+        "tortoise",
+        "uvicorn",
+    ]:
+        assert module not in import_times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "mobilizon_reshare.cli.commands.list.list_event",
+        "mobilizon_reshare.cli.commands.list.list_publication",
+        "mobilizon_reshare.cli.commands.start.main",
+        "mobilizon_reshare.cli.commands.recap.main",
+    ],
+)
+def test_commands_load_platforms_on_demand(module):
+    import_times = get_import_times(f"import {module}")
+
+    for sdk in PLATFORM_SDKS:
+        assert sdk not in import_times
+
+
+def test_platform_loaded_on_demand():
+    import_times = get_import_times(
+        "from mobilizon_reshare.publishers.platforms.platform_mapping import get_formatter_class;"
+        "get_formatter_class('zulip')"
+    )
+
+    # modules imported with importlib aren't listed, but their dependencies are
+    assert "requests" in import_times
+    assert "tweepy" not in import_times
@@ -0,0 +1,95 @@
+import os
+import shutil
+import sys
+
+import pytest
+from dynaconf.validator import ValidationError
+
+from mobilizon_reshare.config.config import (
+    CustomConfig,
+    build_and_validate_settings,
+    build_settings,
+    get_settings,
+    get_settings_without_validation,
+    reload_settings,
+    reload_settings_if_changed,
+)
+
+
+@pytest.fixture
+def secrets_path(monkeypatch, tmp_path):
+    path = tmp_path / ".secrets.toml"
+    shutil.copy(os.environ["SECRETS_FOR_DYNACONF"], path)
+    monkeypatch.setenv("SECRETS_FOR_DYNACONF", str(path))
+    reload_settings()
+    yield path
+    # the next test loads the settings with the original secrets
+    CustomConfig.clear()
+
+
+def test_settings_loaded_once():
+    settings = get_settings()
+
+    assert get_settings() is settings
+    assert get_settings_without_validation() is settings
+
+
+def test_reload_settings():
+    settings = get_settings()
+    settings.update({"locale": "it"})
+
+    reloaded_settings = reload_settings()
+
+    assert reloaded_settings is not settings
+    assert get_settings() is reloaded_settings
+    assert get_settings_without_validation() is reloaded_settings
+    assert reloaded_settings["locale"] == "en-us"
+
+
+def test_reload_invalid_settings(secrets_path):
+    settings = get_settings()
+    with open(secrets_path, "a") as fp:
+        fp.write('[default]\nhtml_parser="unknown"\n')
+
+    with pytest.raises(ValidationError):
+        reload_settings()
+
+    assert get_settings() is settings
+
+
+def test_reload_settings_if_changed(secrets_path):
+    settings = get_settings()
+    assert not reload_settings_if_changed()
+    assert get_settings() is settings
+
+    with open(secrets_path, "a") as fp:
+        fp.write('[default]\nlocale="it"\n')
+    # the modification time may not change within the resolution of the filesystem
+    os.utime(secrets_path, (0, 0))
+
+    assert reload_settings_if_changed()
+    assert get_settings()["locale"] == "it"
+
+
+def test_lxml_not_installed(secrets_path, monkeypatch):
+    with open(secrets_path, "a") as fp:
+        fp.write('[default]\nhtml_parser="lxml"\n')
+    monkeypatch.setitem(sys.modules, "lxml", None)
+
+    with pytest.raises(ValidationError, match="lxml isn't installed"):
+        reload_settings()
+
+
+def test_validation_doesnt_store_values(monkeypatch):
+    settings = build_settings()
+    stored = []
+    monkeypatch.setattr(
+        settings, "set", lambda key, *args, **kwargs: stored.append(key)
+    )
+
+    build_and_validate_settings(settings)
+
+    # only the defaults of missing values are stored, besides the environment the validators select
+    stored = [key for key in stored if not key.endswith("_FOR_DYNACONF")]
+    assert "db_url" not in stored
+    assert all(settings.get(key) is None for key in stored)
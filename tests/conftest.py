@@ -7,11 +7,12 @@ from typing import Union
 from uuid import UUID
 
 import arrow
+import httpx
 import pytest
-import responses
 from tortoise import Tortoise
 
 import mobilizon_reshare
+import mobilizon_reshare.mobilizon.client
 from mobilizon_reshare.config.command import CommandConfig
 from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent, EventPublicationStatus
@@ -19,11 +20,13 @@ from mobilizon_reshare.models.event import Event
 from mobilizon_reshare.models.notification import Notification, NotificationStatus
 from mobilizon_reshare.models.publication import Publication, PublicationStatus
 from mobilizon_reshare.models.publisher import Publisher
+from mobilizon_reshare.publishers import abstract, credentials, sessions
 from mobilizon_reshare.publishers.abstract import (
     AbstractPlatform,
     AbstractEventFormatter,
 )
 from mobilizon_reshare.publishers.exceptions import PublisherError, InvalidResponse
+from mobilizon_reshare.storage.query.write import update_events_publication_status
 from tests import today
 
 with importlib.resources.path(
@@ -54,6 +57,25 @@ def generate_notification_status(published):
     return NotificationStatus.COMPLETED if published else NotificationStatus.FAILED
 
 
+@pytest.fixture(autouse=True)
+def clear_credentials_validations():
+    credentials.set_validations({})
+    yield
+    credentials.set_validations({})
+
+
+@pytest.fixture(autouse=True)
+def clear_message_cache():
+    yield
+    abstract.invalidate_message_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_platform_sessions():
+    yield
+    sessions.close_sessions()
+
+
 @pytest.fixture(scope="session", autouse=True)
 def set_dynaconf_environment() -> None:
     os.environ["ENV_FOR_DYNACONF"] = "testing"
@@ -135,10 +157,12 @@ async def initialize_db_tests(request) -> None:
         "apps": {
             "models": {
                 "models": [
+                    "mobilizon_reshare.models.credential_validation",
                     "mobilizon_reshare.models.event",
                     "mobilizon_reshare.models.notification",
                     "mobilizon_reshare.models.publication",
                     "mobilizon_reshare.models.publisher",
+                    "mobilizon_reshare.models.source",
                     "aerich.models",
                 ],
                 "default_connection": "default",
@@ -281,6 +305,7 @@ async def _generate_publications(events, publishers, specification):
                 event_id=events[publication["event_idx"]].id,
                 publisher_id=publishers[publication["publisher_idx"]].id,
             )
+        await update_events_publication_status(event.id for event in events)
 
 
 @pytest.fixture(scope="module")
@@ -432,45 +457,64 @@ def mobilizon_url():
     return get_settings()["source"]["mobilizon"]["url"]
 
 
-@responses.activate
 @pytest.fixture
-def mock_mobilizon_success_answer(mobilizon_answer, mobilizon_url):
-    with responses.RequestsMock() as rsps:
-
-        rsps.add(
-            responses.POST, mobilizon_url, json=mobilizon_answer, status=200,
+def mock_mobilizon_client(monkeypatch, mobilizon_url):
+    """
+    Replaces the shared Mobilizon client with one answering the given responses, in order, to
+    the requests sent to the Mobilizon url. Once exhausted, the last response is repeated.
+    """
+    answers = []
+    requests_count = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests_count
+        assert str(request.url) == mobilizon_url
+        answer = answers[min(requests_count, len(answers) - 1)]
+        requests_count += 1
+        return answer
+
+    def _mock_mobilizon_client(mobilizon_answers: list[httpx.Response]):
+        answers.extend(mobilizon_answers)
+        monkeypatch.setattr(
+            mobilizon_reshare.mobilizon.client,
+            "_client",
+            httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
         )
-        yield
+
+    yield _mock_mobilizon_client
+    assert requests_count >= len(answers), "Not all the Mobilizon answers have been requested"
 
 
-@responses.activate
 @pytest.fixture
-def mock_multiple_success_answer(multiple_answers, mobilizon_url):
-    with responses.RequestsMock() as rsps:
+def mock_mobilizon_success_answer(mock_mobilizon_client, mobilizon_answer):
+    mock_mobilizon_client([httpx.Response(200, json=mobilizon_answer)])
 
-        for answer in multiple_answers:
-            rsps.add(
-                responses.POST, mobilizon_url, json=answer, status=200,
-            )
 
-        yield
+@pytest.fixture
+def mock_multiple_success_answer(mock_mobilizon_client, multiple_answers):
+    mock_mobilizon_client(
+        [httpx.Response(200, json=answer) for answer in multiple_answers]
+    )
 
 
 @pytest.fixture
 def mock_formatter_class():
     class MockFormatter(AbstractEventFormatter):
-        def validate_event(self, event) -> None:
+        def _validate_event(self, event) -> None:
             pass
 
         def get_message_from_event(self, event) -> str:
             return f"{event.name}|{event.description}"
 
-        def validate_message(self, event) -> None:
+        def _validate_message(self, message) -> None:
             pass
 
         def get_recap_fragment(self, event):
             return event.name
 
+        def get_recap_fragments(self, events):
+            return [self.get_recap_fragment(event) for event in events]
+
         def get_recap_header(self):
             return "Upcoming"
 
@@ -524,6 +568,7 @@ async def failed_publication(stored_event, mock_publisher) -> Publication:
         publisher=mock_publisher,
     )
     await p.save()
+    await update_events_publication_status([stored_event.id])
     return p
 
 
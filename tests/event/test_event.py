@@ -53,3 +53,22 @@ def test_locale(event, template_with_locale, set_locale):
         event.format(template_with_locale)
         == "test event|description of the event|location|01 gennaio, 11:30|01 gennaio, 12:30"
     )
+
+
+def test_format_given_locale(event, template_with_locale):
+    assert (
+        event.format(template_with_locale, "it-it")
+        == "test event|description of the event|location|01 gennaio, 11:30|01 gennaio, 12:30"
+    )
+
+
+def test_template_context(event, simple_template):
+    context = event._get_template_context()
+
+    # values are shared with the event, not copied
+    assert context["begin_datetime"] is event.begin_datetime
+    assert event._get_template_context() is context
+
+    event.name = "updated event"
+    assert event._get_template_context()["name"] == "updated event"
+    assert event.format(simple_template).startswith("updated event|")
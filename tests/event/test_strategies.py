@@ -1,3 +1,6 @@
+from datetime import timedelta
+from uuid import UUID
+
 import arrow
 import pytest
 from unittest.mock import patch
@@ -7,7 +10,10 @@ from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.event.event_selection_strategies import (
     SelectNextEventStrategy,
     select_event_to_publish,
+    select_stored_event_to_publish,
 )
+from mobilizon_reshare.models.publication import PublicationStatus
+from tests import today
 
 
 @pytest.fixture
@@ -200,6 +206,86 @@ def test_window_multi_event_found(
     assert selected_event is unpublished_events[0]
 
 
+def _stored_events_specification(hours_passed_from_publication):
+    return {
+        "event": 3,
+        "publications": [
+            {
+                "event_idx": 0,
+                "publisher_idx": 0,
+                "status": PublicationStatus.COMPLETED,
+                "timestamp": today - timedelta(hours=hours_passed_from_publication + 2),
+            },
+            {
+                "event_idx": 0,
+                "publisher_idx": 1,
+                "status": PublicationStatus.FAILED,
+                "timestamp": today - timedelta(hours=hours_passed_from_publication),
+            },
+        ],
+        "publisher": ["telegram", "zulip"],
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy_name", ["next_event"])
+@pytest.mark.parametrize(
+    "desired_break_window_days,hours_passed_from_publication,expected_mobilizon_id",
+    [[1, 25, UUID(int=1)], [1, 23, None], [2, 36, None]],
+)
+async def test_select_stored_event(
+    generate_models,
+    desired_break_window_days,
+    hours_passed_from_publication,
+    expected_mobilizon_id,
+    set_break_window_config,
+    set_strategy,
+):
+    "Testing that the strategy selects the next unpublished event in the database once the break is over"
+    await generate_models(_stored_events_specification(hours_passed_from_publication))
+
+    with patch("arrow.now", lambda: arrow.get(today)):
+        selected_event = await select_stored_event_to_publish()
+
+    if expected_mobilizon_id is None:
+        assert selected_event is None
+    else:
+        assert selected_event.mobilizon_id == expected_mobilizon_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy_name", ["next_event"])
+async def test_select_stored_event_no_published_events(generate_models, set_strategy):
+    "Testing that if no event is published, the strategy takes the first event in the database"
+    await generate_models({"event": 2, "publisher": ["telegram"]})
+
+    selected_event = await select_stored_event_to_publish()
+
+    assert selected_event.mobilizon_id == UUID(int=0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("strategy_name", ["next_event"])
+async def test_select_stored_event_no_unpublished_events(
+    generate_models, set_strategy
+):
+    await generate_models(
+        {
+            "event": 1,
+            "publications": [
+                {
+                    "event_idx": 0,
+                    "publisher_idx": 0,
+                    "timestamp": today - timedelta(days=10),
+                }
+            ],
+            "publisher": ["telegram"],
+        }
+    )
+
+    assert await select_stored_event_to_publish() is None
+
+
 @pytest.fixture
 def mock_arrow_now(current_hour):
     def mock_now():
@@ -0,0 +1,13 @@
+import pytest
+
+from mobilizon_reshare.config.config import get_settings
+
+
+@pytest.fixture(params=["html.parser", "lxml"])
+def html_parser(request):
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+    old_value = get_settings()["html_parser"]
+    get_settings().update({"html_parser": request.param})
+    yield request.param
+    get_settings().update({"html_parser": old_value})
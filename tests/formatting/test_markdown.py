@@ -19,5 +19,5 @@ from mobilizon_reshare.formatting.description import html_to_markdown
         ],
     ],
 )
-def test_html_to_markdown(description, expected_output):
+def test_html_to_markdown(description, expected_output, html_parser):
     assert html_to_markdown(description) == expected_output
@@ -1,10 +1,13 @@
+import os
 from datetime import datetime
 from uuid import UUID
 
 import arrow
 import pytest
 
+from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent
+from mobilizon_reshare.publishers import abstract
 from mobilizon_reshare.publishers.platforms.platform_mapping import get_formatter_class
 
 begin_date = arrow.get(datetime(year=2021, month=1, day=1, hour=11, minute=30,))
@@ -71,3 +74,135 @@ def test_output_format(
         .strip()
         == expected_output.strip()
     )
+
+
+def test_recap_format(event_to_format: MobilizonEvent):
+    formatter = get_formatter_class("telegram")()
+
+    assert formatter.get_recap_header() == "📅 Upcoming events"
+    assert formatter.get_recap_fragments([event_to_format, event_to_format]) == [
+        formatter.get_recap_fragment(event_to_format)
+    ] * 2
+
+
+@pytest.fixture()
+def configured_template(tmp_path):
+    template_path = tmp_path / "message.tmpl.j2"
+    template_path.write_text("first {{ name }}")
+    old_value = get_settings()["publisher"]["telegram"]["msg_template_path"]
+    get_settings().update(
+        {"publisher.telegram.msg_template_path": template_path.as_posix()}
+    )
+    yield template_path
+    get_settings().update({"publisher.telegram.msg_template_path": old_value})
+    abstract.invalidate_template_cache()
+
+
+def test_configured_template_reload(event_to_format, configured_template):
+    formatter = get_formatter_class("telegram")()
+    assert formatter.get_message_template() is formatter.get_message_template()
+    assert formatter.get_message_from_event(event_to_format) == "first test event"
+
+    configured_template.write_text("second {{ name }}")
+    mtime = os.stat(configured_template).st_mtime
+    os.utime(configured_template, (mtime + 1, mtime + 1))
+
+    assert formatter.get_message_from_event(event_to_format) == "second test event"
+
+
+def test_precompile_templates():
+    abstract.invalidate_template_cache()
+    abstract.precompile_templates(["telegram", "zulip"])
+
+    assert len(abstract._TEMPLATE_CACHE) == 2 * len(abstract.TEMPLATE_KINDS)
+    assert get_formatter_class("zulip")().get_recap_header_template() in set(
+        abstract._TEMPLATE_CACHE.values()
+    )
+
+
+@pytest.fixture()
+def counting_formatter():
+    class CountingFormatter(get_formatter_class("telegram")):
+        formatted_messages = 0
+
+        def _get_preprocessed_event(self, event):
+            type(self).formatted_messages += 1
+            return super()._get_preprocessed_event(event)
+
+    return CountingFormatter()
+
+
+@pytest.fixture()
+def set_message_cache_size(message_cache_size):
+    old_value = get_settings()["publishing"]["message_cache_size"]
+    get_settings().update({"publishing.message_cache_size": message_cache_size})
+    yield
+    get_settings().update({"publishing.message_cache_size": old_value})
+
+
+def test_message_cache(event_to_format, counting_formatter):
+    message = counting_formatter.get_message_from_event(event_to_format)
+    assert counting_formatter.get_message_from_event(event_to_format) == message
+    assert counting_formatter.get_recap_fragments([event_to_format] * 2) == [
+        counting_formatter.get_recap_fragment(event_to_format)
+    ] * 2
+    assert counting_formatter.formatted_messages == 2
+
+    # an updated event is formatted again
+    event_to_format.name = "updated test event"
+    event_to_format.last_update_time = event_to_format.last_update_time.shift(hours=1)
+    assert "updated test event" in counting_formatter.get_message_from_event(
+        event_to_format
+    )
+    assert counting_formatter.formatted_messages == 3
+
+
+@pytest.mark.parametrize("message_cache_size", [1])
+def test_message_cache_eviction(
+    event_to_format, counting_formatter, set_message_cache_size
+):
+    counting_formatter.get_message_from_event(event_to_format)
+    counting_formatter.get_recap_fragment(event_to_format)
+    counting_formatter.get_message_from_event(event_to_format)
+
+    assert counting_formatter.formatted_messages == 3
+    assert len(abstract._MESSAGE_CACHE) == 1
+
+
+@pytest.mark.parametrize("message_cache_size", [0])
+def test_message_cache_disabled(
+    event_to_format, counting_formatter, set_message_cache_size
+):
+    counting_formatter.get_message_from_event(event_to_format)
+    counting_formatter.get_message_from_event(event_to_format)
+
+    assert counting_formatter.formatted_messages == 2
+    assert len(abstract._MESSAGE_CACHE) == 0
+
+
+def test_preprocessing_leaves_event_untouched(event_to_format):
+    description = event_to_format.description
+    zulip_formatter = get_formatter_class("zulip")()
+    facebook_formatter = get_formatter_class("facebook")()
+
+    zulip_message = zulip_formatter.get_message_from_event(event_to_format)
+    facebook_message = facebook_formatter.get_message_from_event(event_to_format)
+    abstract.invalidate_message_cache()
+
+    assert event_to_format.description == description
+    assert zulip_formatter.get_message_from_event(event_to_format) == zulip_message
+    assert facebook_formatter.get_message_from_event(event_to_format) == facebook_message
+
+
+def test_preprocessed_event_memoized(event_to_format):
+    formatter = get_formatter_class("zulip")()
+    preprocessed_event = formatter._get_preprocessed_event(event_to_format)
+
+    assert preprocessed_event is not event_to_format
+    assert formatter._get_preprocessed_event(event_to_format) is preprocessed_event
+    assert preprocessed_event.description.startswith("description of the event\n===")
+
+    event_to_format.description = "<p>updated description</p>"
+    assert formatter._get_preprocessed_event(event_to_format).description == (
+        "updated description"
+    )
@@ -16,5 +16,18 @@ from mobilizon_reshare.formatting.description import html_to_plaintext
         ["<p><a href='https://some_link.com'>Some Link</a></p>", "Some Link"],
     ],
 )
-def test_html_to_plaintext(description, expected_output):
+def test_html_to_plaintext(description, expected_output, html_parser):
     assert html_to_plaintext(description) == expected_output
+
+
+@pytest.mark.parametrize(
+    "html_parser, expected_output",
+    [["html.parser", "description of the event another header"], ["lxml", ""]],
+    indirect=["html_parser"],
+)
+def test_html_to_plaintext_nested_blocks(html_parser, expected_output):
+    # lxml doesn't allow headers inside paragraphs, so the paragraph is left empty
+    assert (
+        html_to_plaintext("<p><h1>description of the event</h1><h1>another header</h1></p>")
+        == expected_output
+    )
@@ -0,0 +1,32 @@
+import pytest
+
+from mobilizon_reshare.formatting.telegram import get_text_length, html_to_telegram
+
+
+@pytest.mark.parametrize(
+    "content, expected_message, expected_length",
+    [
+        ["", "", 0],
+        ["<p>Description</p>", "Description", 11],
+        [
+            "<p><h1>description of the event</h1><h1>another header</h1></p>",
+            "<b>description of the event</b>\n\n<b>another header</b>",
+            40,
+        ],
+        ["<h2 class='title'>Header</h2>text", '<b class="title">Header</b>\ntext', 11],
+        ["<h1></h1><h2><!-- comment --></h2>text", "text", 4],
+        ["<ul><li>one</li><li>two</li></ul>", "• one• two", 10],
+        ["first<br>second<br>third", "first\nsecond\nthird", 18],
+        ["<p>one</p>\n\n\n<p>two</p>\n\n\n\n", "one\n\ntwo", 8],
+        ["<p>a &amp; b &lt; c&nbsp;d</p>", "a &amp; b &lt; c\xa0d", 11],
+        ["<b><i>unbalanced</b> tags</i>", "<b><i>unbalanced</i></b> tags", 15],
+        ["<a title='say \"hi\"' href=link>Link</a>", "<a href=\"link\" title='say \"hi\"'>Link</a>", 4],
+        ["<pre>  </pre><p>  </p>", "<pre>  </pre>", 2],
+    ],
+)
+def test_html_to_telegram(content, expected_message, expected_length):
+    message, text_length = html_to_telegram(content)
+
+    assert message == expected_message
+    assert text_length == expected_length
+    assert get_text_length(message) == expected_length
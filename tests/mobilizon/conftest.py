@@ -1,13 +1,7 @@
+import httpx
 import pytest
-import responses
 
 
-@responses.activate
 @pytest.fixture
-def mock_mobilizon_failure_answer(mobilizon_url):
-    with responses.RequestsMock() as rsps:
-
-        rsps.add(
-            responses.POST, mobilizon_url, status=500,
-        )
-        yield
+def mock_mobilizon_failure_answer(mock_mobilizon_client):
+    mock_mobilizon_client([httpx.Response(500)])
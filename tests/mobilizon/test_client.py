@@ -0,0 +1,15 @@
+import pytest
+
+from mobilizon_reshare.mobilizon.client import close_client, get_client
+
+
+@pytest.mark.asyncio
+async def test_client_is_shared():
+    client = get_client()
+    assert get_client() is client
+
+    await close_client()
+    assert client.is_closed
+    new_client = get_client()
+    assert new_client is not client
+    await close_client()
@@ -3,12 +3,20 @@ from uuid import UUID
 import arrow
 import pytest
 
+from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent
 from mobilizon_reshare.mobilizon.events import (
     get_mobilizon_future_events,
+    get_sources,
     MobilizonRequestFailed,
+    MobilizonSource,
 )
 
+@pytest.fixture
+def mobilizon_source():
+    return get_sources()[0]
+
+
 simple_event_element = {
     "beginsOn": "2021-05-23T12:15:00Z",
     "description": None,
@@ -85,16 +93,20 @@ full_event = MobilizonEvent(
         [two_events_response, [simple_event, full_event]],
     ],
 )
-def test_event_response(mock_mobilizon_success_answer, expected_result):
+@pytest.mark.asyncio
+async def test_event_response(
+    mock_mobilizon_success_answer, expected_result, mobilizon_source
+):
     """
     Testing the request and parsing logic
     """
-    assert get_mobilizon_future_events() == expected_result
+    assert await get_mobilizon_future_events(mobilizon_source) == expected_result
 
 
-def test_failure_404(mock_mobilizon_failure_answer):
+@pytest.mark.asyncio
+async def test_failure_404(mock_mobilizon_failure_answer, mobilizon_source):
     with pytest.raises(MobilizonRequestFailed):
-        get_mobilizon_future_events()
+        await get_mobilizon_future_events(mobilizon_source)
 
 
 @pytest.mark.parametrize(
@@ -115,6 +127,135 @@ def test_failure_404(mock_mobilizon_failure_answer):
         },
     ],
 )
-def test_failure_wrong_group(mock_mobilizon_success_answer):
+@pytest.mark.asyncio
+async def test_failure_wrong_group(mock_mobilizon_success_answer, mobilizon_source):
     with pytest.raises(MobilizonRequestFailed):
-        get_mobilizon_future_events()
+        await get_mobilizon_future_events(mobilizon_source)
+
+
+@pytest.fixture()
+def set_page_size(page_size, max_events):
+    settings = get_settings()
+    old_page_size = settings["source.mobilizon.page_size"]
+    old_max_events = settings["source.mobilizon.max_events"]
+    yield settings.update(
+        {
+            "source.mobilizon.page_size": page_size,
+            "source.mobilizon.max_events": max_events,
+        }
+    )
+    settings.update(
+        {
+            "source.mobilizon.page_size": old_page_size,
+            "source.mobilizon.max_events": old_max_events,
+        }
+    )
+
+
+def paginated_response(elements, total):
+    return {
+        "data": {"group": {"organizedEvents": {"elements": elements, "total": total}}}
+    }
+
+
+@pytest.mark.parametrize(
+    "page_size, max_events, multiple_answers, expected_result",
+    [
+        [
+            1,
+            1000,
+            [
+                paginated_response([simple_event_element], 2),
+                paginated_response([full_event_element], 2),
+            ],
+            [simple_event, full_event],
+        ],
+        [
+            2,
+            1000,
+            [
+                paginated_response([simple_event_element, full_event_element], 3),
+                paginated_response([simple_event_element], 3),
+            ],
+            [simple_event, full_event, simple_event],
+        ],
+        [
+            1,
+            1,
+            [paginated_response([simple_event_element], 2)],
+            [simple_event],
+        ],
+    ],
+)
+@pytest.mark.asyncio
+async def test_event_response_pagination(
+    set_page_size, mock_multiple_success_answer, expected_result, mobilizon_source
+):
+    """
+    Testing that all the pages are requested, up to the configured maximum number of events
+    """
+    assert await get_mobilizon_future_events(mobilizon_source) == expected_result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mobilizon_answer, updated_after, expected_result",
+    [
+        [
+            paginated_response([full_event_element, simple_event_element], 2),
+            arrow.get("2021-05-24T00:00:00Z"),
+            [full_event],
+        ],
+        [
+            paginated_response([full_event_element, simple_event_element], 2),
+            arrow.get("2021-05-25T15:15:00Z"),
+            [],
+        ],
+        [
+            paginated_response([full_event_element, simple_event_element], 2),
+            arrow.get("2021-05-01T00:00:00Z"),
+            [full_event, simple_event],
+        ],
+    ],
+)
+async def test_event_response_updated_after(
+    mock_mobilizon_success_answer, updated_after, expected_result, mobilizon_source
+):
+    """
+    Testing that incremental requests stop at the first event that didn't change
+    """
+    assert (
+        await get_mobilizon_future_events(mobilizon_source, updated_after=updated_after)
+        == expected_result
+    )
+
+
+@pytest.fixture()
+def set_sources(sources):
+    settings = get_settings()
+    yield settings.update({"source.mobilizon.sources": sources})
+    settings.update({"source.mobilizon.sources": []})
+
+
+@pytest.mark.parametrize(
+    "sources, expected_result",
+    [
+        [[], [MobilizonSource("https://some_mobilizon", "my_group")]],
+        [
+            [
+                {"url": "https://a.example.org/api", "group": "a"},
+                {"url": "https://b.example.org/api", "group": "b"},
+            ],
+            [
+                MobilizonSource("https://a.example.org/api", "a"),
+                MobilizonSource("https://b.example.org/api", "b"),
+            ],
+        ],
+    ],
+)
+def test_get_sources(set_sources, expected_result):
+    assert get_sources() == expected_result
+
+
+def test_source_name():
+    assert MobilizonSource("https://a.example.org/api", "a").name == "a@a.example.org"
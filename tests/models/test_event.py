@@ -4,6 +4,7 @@ from uuid import UUID
 import arrow
 import pytest
 import tortoise.timezone
+from tortoise.exceptions import IntegrityError
 
 from mobilizon_reshare.dataclasses import EventPublicationStatus
 from mobilizon_reshare.dataclasses import MobilizonEvent
@@ -45,6 +46,15 @@ async def test_event_timezone_storage(event_model_generator):
     assert events[0].begin_datetime == events[1].begin_datetime
 
 
+@pytest.mark.asyncio
+async def test_event_mobilizon_id_unique(event_model_generator):
+    await event_model_generator().save()
+    with pytest.raises(IntegrityError):
+        await event_model_generator(
+            begin_date=datetime(year=2021, month=6, day=6, tzinfo=timezone.utc)
+        ).save()
+
+
 @pytest.mark.asyncio
 async def test_event_sort_by_date(event_model_generator):
     today = datetime(
@@ -32,13 +32,13 @@ def test_event():
 @pytest.fixture
 def mock_formatter_invalid():
     class MockFormatter(AbstractEventFormatter):
-        def validate_event(self, event) -> None:
+        def _validate_event(self, event) -> None:
             raise PublisherError("Invalid event error")
 
         def get_message_from_event(self, event) -> str:
             return ""
 
-        def validate_message(self, event) -> None:
+        def _validate_message(self, message) -> None:
             raise PublisherError("Invalid message error")
 
     return MockFormatter()
@@ -1,10 +1,12 @@
 import logging
+import time
 from datetime import timedelta
 from unittest.mock import MagicMock
 from uuid import UUID
 
 import pytest
 
+from mobilizon_reshare.config.config import get_settings
 from mobilizon_reshare.dataclasses import MobilizonEvent
 from mobilizon_reshare.dataclasses.publication import (
     _EventPublication,
@@ -94,9 +96,9 @@ async def mock_publications(
     mock_formatter_valid,
 ):
     result = []
+    event = test_event.to_model()
+    await event.save()
     for i in range(num_publications):
-        event = test_event.to_model()
-        await event.save()
         publisher = Publisher(name="telegram")
         await publisher.save()
         publication = PublicationModel(
@@ -126,6 +128,28 @@ async def test_publication_coordinator_run_success(
     assert report.successful, "\n".join(map(lambda rep: rep.reason, report.reports))
 
 
+@pytest.mark.parametrize("num_publications", [2])
+@pytest.mark.asyncio
+async def test_publication_coordinator_formats_once(
+    mock_publications, mock_formatter_class, message_collector
+):
+    class CountingFormatter(mock_formatter_class):
+        messages = 0
+
+        def get_message_from_event(self, event) -> str:
+            type(self).messages += 1
+            return super().get_message_from_event(event)
+
+    for publication in mock_publications:
+        publication.formatter = CountingFormatter()
+
+    report = PublisherCoordinator(publications=mock_publications).run()
+
+    assert report.successful
+    assert CountingFormatter.messages == 2
+    assert [r.published_content for r in report.reports] == message_collector
+
+
 @pytest.mark.parametrize("num_publications", [1])
 @pytest.mark.asyncio
 async def test_publication_coordinator_run_failure(
@@ -160,6 +184,133 @@ async def test_publication_coordinator_run_partial_failure(
     assert list(report.reports)[1].reason is None
 
 
+@pytest.fixture
+def mock_slow_publisher(mock_publisher_class, send_delay):
+    class MockSlowPublisher(mock_publisher_class):
+        def _send(self, message, event):
+            time.sleep(send_delay)
+            super()._send(message, event)
+
+    return MockSlowPublisher()
+
+
+@pytest.fixture
+def set_publishing_timeout(publishing_timeout):
+    old_timeout = get_settings()["publishing"]["timeout"]
+    get_settings().update({"publishing.timeout": publishing_timeout})
+    yield
+    get_settings().update({"publishing.timeout": old_timeout})
+
+
+@pytest.mark.parametrize("num_publications", [3])
+@pytest.mark.parametrize("send_delay", [0.3])
+@pytest.mark.asyncio
+async def test_publication_coordinator_run_concurrently(
+    mock_publications, mock_slow_publisher, message_collector
+):
+    for pub in mock_publications:
+        pub.publisher = mock_slow_publisher
+    coordinator = PublisherCoordinator(publications=mock_publications)
+
+    start = time.monotonic()
+    report = coordinator.run()
+
+    assert time.monotonic() - start < 0.6
+    assert report.successful
+    assert [r.publication for r in report.reports] == mock_publications
+    assert len(message_collector) == 3
+
+
+@pytest.mark.parametrize("num_publications", [2])
+@pytest.mark.parametrize("send_delay,publishing_timeout", [[0.5, 0.1]])
+@pytest.mark.asyncio
+async def test_publication_coordinator_run_timeout(
+    mock_publications, mock_slow_publisher, set_publishing_timeout
+):
+    mock_publications[0].publisher = mock_slow_publisher
+    coordinator = PublisherCoordinator(publications=mock_publications)
+
+    start = time.monotonic()
+    report = coordinator.run()
+
+    assert time.monotonic() - start < 0.4
+    assert len(report.reports) == 2
+    assert not list(report.reports)[0].successful
+    assert list(report.reports)[0].reason == "No answer after 0.1 seconds"
+    assert list(report.reports)[1].successful
+
+
+@pytest.fixture
+def mock_broken_connection_publisher(mock_publisher_class):
+    class MockBrokenConnectionPublisher(mock_publisher_class):
+        def _send(self, message, event):
+            raise ConnectionError("Connection reset by peer")
+
+    return MockBrokenConnectionPublisher()
+
+
+@pytest.mark.parametrize("num_publications", [2])
+@pytest.mark.asyncio
+async def test_publication_coordinator_run_unexpected_error(
+    mock_publications, mock_broken_connection_publisher, message_collector
+):
+    mock_publications[0].publisher = mock_broken_connection_publisher
+    coordinator = PublisherCoordinator(publications=mock_publications)
+
+    report = coordinator.run()
+
+    assert len(report.reports) == 2
+    assert list(report.reports)[0].status == PublicationStatus.FAILED
+    assert list(report.reports)[0].reason == "Connection reset by peer"
+    assert list(report.reports)[1].successful
+    assert len(message_collector) == 1
+
+
+@pytest.fixture
+def mock_slow_validation_publisher(mock_publisher_class, validation_delay):
+    class MockSlowValidationPublisher(mock_publisher_class):
+        def validate_credentials(self) -> None:
+            time.sleep(validation_delay)
+
+    return MockSlowValidationPublisher()
+
+
+@pytest.mark.parametrize("num_publications", [3])
+@pytest.mark.parametrize("validation_delay", [0.3])
+@pytest.mark.asyncio
+async def test_publication_coordinator_validate_concurrently(
+    mock_publications, mock_slow_validation_publisher
+):
+    for pub in mock_publications:
+        pub.publisher = mock_slow_validation_publisher
+    coordinator = PublisherCoordinator(publications=mock_publications)
+
+    start = time.monotonic()
+    report = coordinator.run()
+
+    assert time.monotonic() - start < 0.6
+    assert report.successful
+    assert len(report.reports) == 3
+
+
+@pytest.mark.parametrize("num_publications", [2])
+@pytest.mark.parametrize("validation_delay,publishing_timeout", [[0.5, 0.1]])
+@pytest.mark.asyncio
+async def test_publication_coordinator_validate_timeout(
+    mock_publications, mock_slow_validation_publisher, set_publishing_timeout
+):
+    mock_publications[1].publisher = mock_slow_validation_publisher
+    coordinator = PublisherCoordinator(publications=mock_publications)
+
+    report = coordinator.run()
+
+    assert len(report.reports) == 2
+    failed_report = list(report.reports)[0]
+    assert failed_report.publication is mock_publications[1]
+    assert failed_report.reason == "No answer after 0.1 seconds"
+    assert list(report.reports)[1].successful
+
+
 @pytest.mark.parametrize("num_publications", [1])
 @pytest.mark.asyncio
 async def test_publication_coordinator_run_failure_response(
@@ -0,0 +1,128 @@
+import arrow
+import pytest
+import requests
+
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.publishers import credentials
+from mobilizon_reshare.publishers.exceptions import HTTPUnauthorized, InvalidCredentials
+from mobilizon_reshare.publishers.platforms.zulip import ZulipPublisher
+from mobilizon_reshare.storage.query.read import get_credential_validations
+from mobilizon_reshare.storage.query.write import save_credential_validations
+
+
+@pytest.fixture
+def counting_publisher():
+    class CountingPublisher(ZulipPublisher):
+        validations = 0
+
+        def validate_credentials(self):
+            type(self).validations += 1
+
+        def _send(self, message, event=None):
+            response = requests.Response()
+            response.status_code = 401
+            response._content = b"""{"result":"error", "msg":"Invalid API key"}"""
+            return response
+
+    return CountingPublisher()
+
+
+@pytest.fixture
+def set_credentials_ttl(credentials_ttl):
+    old_ttl = get_settings()["publishing"]["credentials_ttl_in_minutes"]
+    get_settings().update({"publishing.credentials_ttl_in_minutes": credentials_ttl})
+    yield
+    get_settings().update({"publishing.credentials_ttl_in_minutes": old_ttl})
+
+
+def test_validate_credentials_cached(counting_publisher):
+    credentials.validate_credentials(counting_publisher)
+    credentials.validate_credentials(counting_publisher)
+
+    assert counting_publisher.validations == 1
+
+
+@pytest.mark.parametrize("credentials_ttl", [0])
+def test_validate_credentials_cache_disabled(counting_publisher, set_credentials_ttl):
+    credentials.validate_credentials(counting_publisher)
+    credentials.validate_credentials(counting_publisher)
+
+    assert counting_publisher.validations == 2
+
+
+def test_validate_credentials_expired(counting_publisher):
+    credentials.validate_credentials(counting_publisher)
+    credentials.set_validations(
+        {
+            name: (credentials_hash, arrow.now().shift(hours=-2).datetime)
+            for name, (credentials_hash, _) in credentials.get_validations().items()
+        }
+    )
+    credentials.validate_credentials(counting_publisher)
+
+    assert counting_publisher.validations == 2
+
+
+def test_validate_credentials_changed(counting_publisher):
+    credentials.validate_credentials(counting_publisher)
+    old_token = get_settings()["publisher"]["zulip"]["bot_token"]
+    get_settings()["publisher"]["zulip"]["bot_token"] = "another token"
+    try:
+        # platforms created after the change see the new settings
+        credentials.validate_credentials(type(counting_publisher)())
+    finally:
+        get_settings()["publisher"]["zulip"]["bot_token"] = old_token
+
+    assert counting_publisher.validations == 2
+
+
+def test_validate_credentials_failure_not_cached(counting_publisher):
+    def _refuse():
+        raise InvalidCredentials("refused")
+
+    counting_publisher.validate_credentials = _refuse
+    with pytest.raises(InvalidCredentials):
+        credentials.validate_credentials(counting_publisher)
+
+    assert credentials.get_validations() == {}
+
+
+def test_send_unauthorized_invalidates_credentials(counting_publisher):
+    credentials.validate_credentials(counting_publisher)
+
+    with pytest.raises(HTTPUnauthorized):
+        counting_publisher.send("message")
+    credentials.validate_credentials(counting_publisher)
+
+    assert counting_publisher.validations == 2
+
+
+@pytest.mark.asyncio
+async def test_credential_validations_storage(counting_publisher):
+    credentials.validate_credentials(counting_publisher)
+    validations = credentials.get_validations()
+
+    await save_credential_validations(validations)
+    credentials.set_validations({})
+    credentials.set_validations(await get_credential_validations())
+    credentials.validate_credentials(counting_publisher)
+
+    assert list(validations) == ["publisher.zulip"]
+    assert counting_publisher.validations == 1
+
+    await save_credential_validations({})
+    assert await get_credential_validations() == {}
+
+
+def test_validations_changed(counting_publisher):
+    assert not credentials.validations_changed()
+
+    credentials.validate_credentials(counting_publisher)
+    assert credentials.validations_changed()
+
+    credentials.set_validations(credentials.get_validations())
+    credentials.validate_credentials(counting_publisher)
+    assert not credentials.validations_changed()
+
+    credentials.invalidate_credentials(counting_publisher)
+    assert credentials.validations_changed()
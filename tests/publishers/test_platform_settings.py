@@ -0,0 +1,48 @@
+import pytest
+
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.publishers.abstract import PlatformSettings
+from mobilizon_reshare.publishers.exceptions import InvalidAttribute
+from mobilizon_reshare.publishers.platforms.zulip import ZulipPublisher
+
+
+@pytest.fixture
+def zulip_instance():
+    old_instance = get_settings()["publisher"]["zulip"]["instance"]
+    yield old_instance
+    get_settings()["publisher"]["zulip"]["instance"] = old_instance
+
+
+def test_platform_settings():
+    conf = ZulipPublisher().conf
+
+    assert isinstance(conf, PlatformSettings)
+    assert conf.to_dict() == get_settings()["publisher"]["zulip"].to_dict()
+    assert conf.instance == conf["instance"] == conf["INSTANCE"]
+
+
+def test_platform_settings_read_only():
+    conf = ZulipPublisher().conf
+
+    with pytest.raises(AttributeError):
+        conf.instance = "https://another.zulip"
+    with pytest.raises(AttributeError):
+        del conf.instance
+
+
+def test_platform_settings_read_once(zulip_instance):
+    publisher = ZulipPublisher()
+    assert publisher.conf is publisher.conf
+
+    get_settings()["publisher"]["zulip"]["instance"] = "https://another.zulip"
+
+    assert publisher.conf.instance == zulip_instance
+    assert ZulipPublisher().conf.instance == "https://another.zulip"
+
+
+def test_platform_settings_invalid_conf():
+    class InvalidPublisher(ZulipPublisher):
+        _conf = ("publisher",)
+
+    with pytest.raises(InvalidAttribute):
+        InvalidPublisher().conf
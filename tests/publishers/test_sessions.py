@@ -0,0 +1,87 @@
+from unittest.mock import patch
+
+import responses
+from facebook import GraphAPI
+from tweepy import API
+
+from mobilizon_reshare.config.config import get_settings
+from mobilizon_reshare.publishers import sessions
+from mobilizon_reshare.publishers.platforms.facebook import (
+    FacebookNotifier,
+    FacebookPublisher,
+)
+from mobilizon_reshare.publishers.platforms.twitter import TwitterPublisher
+from mobilizon_reshare.publishers.platforms.zulip import ZulipPublisher
+
+api_uri = "https://zulip.twc-italia.org/api/v1/"
+
+
+def test_session_is_shared():
+    session = sessions.get_session("zulip")
+
+    assert sessions.get_session("zulip") is session
+    assert sessions.get_session("telegram") is not session
+    assert session.get_adapter("https://example.org")._pool_maxsize == (
+        get_settings()["publishing"]["pool_size"]
+    )
+
+
+def test_close_sessions():
+    session = sessions.get_session("zulip")
+    client = sessions.get_client(("zulip",), object)
+
+    sessions.close_sessions()
+
+    assert sessions.get_session("zulip") is not session
+    assert sessions.get_client(("zulip",), object) is not client
+
+
+def test_platform_uses_session():
+    get_settings()["publisher"]["zulip"]["instance"] = "https://zulip.twc-italia.org"
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            responses.POST,
+            api_uri + "messages",
+            json={"result": "success", "msg": "", "id": 8049},
+            status=200,
+        )
+        with patch.object(
+            sessions.get_session("zulip"), "post", wraps=sessions.get_session("zulip").post
+        ) as mock:
+            ZulipPublisher().send("message")
+            mock.assert_called_once()
+            assert mock.call_args.kwargs["timeout"] == (
+                get_settings()["publishing"]["request_timeout"]
+            )
+
+
+def test_facebook_client_is_shared(event):
+    with patch.object(GraphAPI, "put_object", return_value=None):
+        FacebookPublisher().send("abc", event)
+        FacebookNotifier().send("abc", event)
+
+    api = FacebookPublisher()._get_api()
+    assert FacebookPublisher()._get_api() is api
+    assert api.session is sessions.get_session("facebook")
+    assert api.timeout == get_settings()["publishing"]["request_timeout"]
+
+
+def test_facebook_client_rebuilt_on_new_credentials():
+    api = FacebookPublisher()._get_api()
+    old_token = get_settings()["publisher"]["facebook"]["page_access_token"]
+    get_settings()["publisher"]["facebook"]["page_access_token"] = "another token"
+    try:
+        assert FacebookPublisher()._get_api() is not api
+    finally:
+        get_settings()["publisher"]["facebook"]["page_access_token"] = old_token
+
+
+def test_twitter_client_is_shared(event):
+    with patch.object(API, "update_status", return_value=None) as mock:
+        TwitterPublisher().send("abc", event)
+        TwitterPublisher().send("abc", event)
+        assert mock.call_count == 2
+
+    api = TwitterPublisher()._get_api()
+    assert TwitterPublisher()._get_api() is api
+    assert api.timeout == get_settings()["publishing"]["request_timeout"]
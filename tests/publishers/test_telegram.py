@@ -69,3 +69,9 @@ def test_validate_response_invalid_response():
         TelegramPublisher()._validate_response(response)
 
     e.match("Invalid request")
+
+
+def test_message_length_counts_visible_text(event):
+    # markup doesn't count towards the maximum length
+    event.description = "<p><strong>a</strong></p>" * 1000
+    assert TelegramFormatter().validate_event(event) is None
@@ -1,4 +1,7 @@
+import functools
+
 import pytest
+from tortoise.backends.sqlite.client import SqliteClient, TransactionWrapper
 
 from mobilizon_reshare.models.publisher import Publisher
 
@@ -9,3 +12,30 @@ async def mock_active_publishers(request, monkeypatch):
         await Publisher.create(name=name)
 
     return request.param
+
+
+@pytest.fixture()
+def query_counter(monkeypatch):
+    """
+    Counts the statements sent to the database, including the ones in transactions.
+    """
+    counter = {"queries": 0}
+
+    def _counting(method):
+        @functools.wraps(method)
+        async def _method(*args, **kwargs):
+            counter["queries"] += 1
+            return await method(*args, **kwargs)
+
+        return _method
+
+    for cls in (SqliteClient, TransactionWrapper):
+        for name in (
+            "execute_insert",
+            "execute_query",
+            "execute_query_dict",
+            "execute_many",
+        ):
+            if name in cls.__dict__:
+                monkeypatch.setattr(cls, name, _counting(cls.__dict__[name]))
+    return counter
@@ -0,0 +1,126 @@
+import sqlite3
+
+import pytest
+import urllib3.util
+
+from mobilizon_reshare.models.publisher import Publisher
+from mobilizon_reshare.storage import db
+
+
+@pytest.fixture
+def sqlite_file_db(monkeypatch, tmp_path):
+    url = urllib3.util.parse_url(f"sqlite://{tmp_path / 'events.db'}")
+    monkeypatch.setattr(db, "get_db_url", lambda: url)
+
+
+@pytest.fixture
+def migrations_counter(monkeypatch):
+    counter = {"migrations": 0}
+    migrate = db.MoReDB.migrate
+
+    async def _migrate(self):
+        counter["migrations"] += 1
+        await migrate(self)
+
+    monkeypatch.setattr(db.MoReDB, "migrate", _migrate)
+    return counter
+
+
+@pytest.mark.asyncio
+async def test_is_up_to_date():
+    # the test database is created without migrations
+    assert not await db.MoReSQLiteDB().is_up_to_date()
+
+
+@pytest.mark.asyncio
+async def test_init_migrates_only_once(sqlite_file_db, migrations_counter):
+    await db.init()
+    assert migrations_counter["migrations"] == 1
+    assert await db.MoReSQLiteDB().is_up_to_date()
+
+    await db.init()
+    assert migrations_counter["migrations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_init_registers_new_publishers(sqlite_file_db, migrations_counter):
+    await db.init()
+    await Publisher.filter(name="telegram").delete()
+
+    await db.init(read_only=True)
+    assert not await Publisher.filter(name="telegram").exists()
+
+    await db.init()
+    assert await Publisher.filter(name="telegram").exists()
+    assert migrations_counter["migrations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_migrate(sqlite_file_db, migrations_counter):
+    await db.init()
+    await db.migrate()
+    assert migrations_counter["migrations"] == 2
+    assert await db.MoReSQLiteDB().is_up_to_date()
+
+
+@pytest.mark.asyncio
+async def test_init_without_auto_migrate(sqlite_file_db, migrations_counter):
+    await db.init(read_only=True, auto_migrate=False)
+    assert migrations_counter["migrations"] == 0
+
+    await db.migrate()
+    assert migrations_counter["migrations"] == 1
+    assert await db.MoReSQLiteDB().is_up_to_date()
+
+
+def _upgrade(connection, migration):
+    connection.executescript(migration.read_text().split("-- downgrade --")[0])
+
+
+def test_migration_merges_duplicate_events(sqlite_file_db):
+    migrations = sorted(
+        (db.MoReSQLiteDB().get_migration_location() / "models").glob("*.sql"),
+        key=lambda migration: int(migration.name.split("_")[0]),
+    )
+    unique_index = next(
+        i
+        for i, migration in enumerate(migrations)
+        if migration.name.endswith("_add indexes.sql")
+    )
+    connection = sqlite3.connect(":memory:")
+    for migration in migrations[:unique_index]:
+        _upgrade(connection, migration)
+
+    connection.execute("INSERT INTO publisher VALUES ('p', 'telegram', NULL)")
+    # the same event pulled three times, plus another event
+    for event_id, mobilizon_id, last_update_time in [
+        ("newest", "m", "2021-01-03"),
+        ("most_published", "m", "2021-01-01"),
+        ("published", "m", "2021-01-02"),
+        ("other", "o", "2021-01-01"),
+    ]:
+        connection.execute(
+            "INSERT INTO event (id, name, mobilizon_id, mobilizon_link, begin_datetime, end_datetime, "
+            "last_update_time) VALUES (?, 'name', ?, 'link', 0, 0, ?)",
+            (event_id, mobilizon_id, last_update_time),
+        )
+    for publication_id, event_id in [
+        ("1", "most_published"),
+        ("2", "most_published"),
+        ("3", "published"),
+    ]:
+        connection.execute(
+            "INSERT INTO publication VALUES (?, 1, 0, NULL, ?, 'p')",
+            (publication_id, event_id),
+        )
+
+    for migration in migrations[unique_index:]:
+        _upgrade(connection, migration)
+
+    assert sorted(connection.execute("SELECT id FROM event")) == [
+        ("most_published",),
+        ("other",),
+    ]
+    assert set(connection.execute("SELECT event_id FROM publication")) == {
+        ("most_published",)
+    }
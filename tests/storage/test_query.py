@@ -12,6 +12,7 @@ from mobilizon_reshare.dataclasses.event import (
 from mobilizon_reshare.storage.query.read import (
     get_all_events,
     get_event,
+    get_last_publication_time,
 )
 from mobilizon_reshare.dataclasses.publication import build_publications_for_event
 from mobilizon_reshare.models.publication import PublicationStatus
@@ -31,6 +32,22 @@ async def test_get_published_events(generate_models):
     assert len(published_events) == 3
 
 
+@pytest.mark.asyncio
+async def test_get_last_publication_time(generate_models):
+    await generate_models(complete_specification)
+
+    assert await get_last_publication_time() == max(
+        publication.timestamp for publication in result_publication.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_last_publication_time_no_publications(generate_models):
+    await generate_models({"event": 2, "publisher": ["zulip"]})
+
+    assert await get_last_publication_time() is None
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "status,mobilizon_id,from_date,to_date,expected_result",
@@ -72,13 +89,37 @@ async def test_publications_with_status(
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "status, expected_events_count",
-    [(_EventPublicationStatus.COMPLETED, 2), (_EventPublicationStatus.PARTIAL, 1)],
+    [
+        (_EventPublicationStatus.COMPLETED, 2),
+        (_EventPublicationStatus.PARTIAL, 1),
+        (_EventPublicationStatus.WAITING, 1),
+        (_EventPublicationStatus.FAILED, 0),
+    ],
 )
 async def test_event_with_status(generate_models, status, expected_events_count):
     await generate_models(complete_specification)
     result = list(await get_mobilizon_events_with_status([status]))
 
     assert len(result) == expected_events_count
+    assert all(event.status == status for event in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "statuses, expected_events_count",
+    [
+        ([_EventPublicationStatus.COMPLETED, _EventPublicationStatus.PARTIAL], 3),
+        ([_EventPublicationStatus.WAITING, _EventPublicationStatus.FAILED], 1),
+        ([], 0),
+    ],
+)
+async def test_event_with_multiple_statuses(
+    generate_models, statuses, expected_events_count
+):
+    await generate_models(complete_specification)
+    result = list(await get_mobilizon_events_with_status(statuses))
+
+    assert len(result) == expected_events_count
 
 
 @pytest.mark.asyncio
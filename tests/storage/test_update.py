@@ -1,8 +1,15 @@
+import asyncio
+from datetime import timedelta
 from uuid import UUID
 
+import arrow
 import pytest
+from tortoise.backends.asyncpg import AsyncpgDBClient
 
+from mobilizon_reshare.dataclasses import EventPublicationStatus
+from mobilizon_reshare.dataclasses.event import get_all_mobilizon_events
 from mobilizon_reshare.dataclasses.publication import _EventPublication
+from mobilizon_reshare.models.event import Event
 from mobilizon_reshare.models.publication import PublicationStatus, Publication
 from mobilizon_reshare.models.publisher import Publisher
 from mobilizon_reshare.publishers.coordinators.event_publishing.publish import (
@@ -14,11 +21,14 @@ from mobilizon_reshare.publishers.platforms.telegram import (
     TelegramPublisher,
 )
 from mobilizon_reshare.storage.query.write import (
+    EVENT_UPDATE_FIELDS,
+    _bulk_update_statement,
     save_publication_report,
     update_publishers,
     create_unpublished_events,
 )
 from tests.conftest import event_6, event_0, event_1, event_2, event_3, event_3_updated
+from tests import today
 from tests.storage import complete_specification
 
 two_publishers_specification = {"publisher": ["telegram", "twitter"]}
@@ -132,6 +142,85 @@ async def test_create_unpublished_events(
     assert unpublished_events == expected_result
 
 
+def _incoming_events(event_generator, changed_ids, new_ids):
+    events = []
+    for i in changed_ids:
+        begin_date = arrow.get(today + timedelta(days=i))
+        events.append(
+            event_generator(
+                begin_date=begin_date,
+                mobilizon_id=UUID(int=i),
+                last_update_time=begin_date.shift(days=1),
+            )
+        )
+    for i in new_ids:
+        begin_date = arrow.get(today + timedelta(days=i))
+        events.append(
+            event_generator(
+                begin_date=begin_date,
+                mobilizon_id=UUID(int=i),
+                last_update_time=begin_date,
+            )
+        )
+    return events
+
+
+@pytest.mark.asyncio
+async def test_create_unpublished_events_stream_doesnt_block_queries(
+    event_generator,
+):
+    """
+    Other queries can run while events are awaited from the stream
+    """
+    queried = asyncio.Event()
+
+    async def slow_stream():
+        yield event_generator(mobilizon_id=UUID(int=1))
+        await queried.wait()
+        yield event_generator(mobilizon_id=UUID(int=2))
+
+    async def query():
+        await Event.all().count()
+        queried.set()
+
+    await asyncio.wait_for(
+        asyncio.gather(create_unpublished_events(slow_stream()), query()), timeout=5
+    )
+    assert await Event.all().count() == 2
+
+
+@pytest.mark.asyncio
+async def test_create_unpublished_events_round_trips(
+    generate_models, event_generator, query_counter
+):
+    """
+    The number of queries needed to reconcile a batch of events doesn't depend on its size
+    """
+    await generate_models({"event": 100, "publisher": []})
+
+    query_counter["queries"] = 0
+    await create_unpublished_events(
+        _incoming_events(event_generator, range(0, 2), range(100, 102))
+    )
+    small_batch_queries = query_counter["queries"]
+
+    query_counter["queries"] = 0
+    await create_unpublished_events(
+        _incoming_events(event_generator, range(2, 50), range(102, 150))
+    )
+    assert query_counter["queries"] == small_batch_queries
+
+    # updated events are stored as any other event, so that they can be filtered by date
+    assert await Event.filter(name="test event").count() == 100
+    assert len(
+        await get_all_mobilizon_events(from_date=arrow.get(today + timedelta(days=148)))
+    ) == 1
+    updated_event = await Event.get(mobilizon_id=UUID(int=10))
+    assert arrow.get(updated_event.last_update_time) == arrow.get(
+        today + timedelta(days=11)
+    )
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "specification,report,event,expected_result",
@@ -179,3 +268,48 @@ async def test_save_publication_report(
         assert publications[i].status == expected_result[i].status
         assert publications[i].reason == expected_result[i].reason
         assert publications[i].timestamp
+
+    event_model = await Event.get(mobilizon_id=event.mobilizon_id)
+    assert event_model.publication_status == EventPublicationStatus.PARTIAL
+    assert event_model.last_published_at == max(p.timestamp for p in publications.values())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "db,placeholders",
+    [
+        [None, ["?"] * 10],
+        [
+            AsyncpgDBClient(
+                connection_name="postgres",
+                user="mobilizon_reshare",
+                password="password",
+                database="mobilizon_reshare",
+                host="localhost",
+                port=5432,
+            ),
+            [f"${i}" for i in range(1, 11)],
+        ],
+    ],
+)
+async def test_bulk_update_statement(generate_models, db, placeholders):
+    """
+    The statement is built from internals of tortoise-orm, so it's checked against the dialects of every supported
+    database.
+    """
+    await generate_models({"event": 1, "publisher": []})
+    event = await Event.first()
+    if db is None:
+        db = Event._meta.db
+
+    statement, get_values = _bulk_update_statement(db, Event, EVENT_UPDATE_FIELDS)
+
+    assignments = ",".join(
+        f'"{field}"={placeholder}'
+        for field, placeholder in zip(EVENT_UPDATE_FIELDS, placeholders)
+    )
+    assert statement == f'UPDATE "event" SET {assignments} WHERE "id"={placeholders[-1]}'
+    values = get_values(event)
+    assert len(values) == len(EVENT_UPDATE_FIELDS) + 1
+    assert values[0] == event.name
+    assert str(values[-1]) == str(event.id)